@@ -7,12 +7,32 @@ PRD 및 output.json 종합 무결성 검증 스크립트
 - 논리적 일관성 검증 (상태 전이, 플로우 순서 등)
 """
 
-import json
-import re
 from collections import defaultdict
 from typing import Dict, List, Set, Tuple, Any
 from pathlib import Path
 
+import prd_regex
+from prd_cache import cached_parse
+from sheet_loader import IA_SHEET, SPM_SHEET, iter_sheets
+from sheet_schema import detect_from_rows
+from screen_resolver import ScreenResolver
+from prd_model import (
+    DOCUMENT_CACHE_VERSION,
+    PRDDocument,
+    API_REGISTRY_COLUMNS,
+    FLOW_REGISTRY_COLUMNS,
+    FLOW_SCREEN_COLUMNS,
+    FUNCTION_REGISTRY_COLUMNS,
+    SCREEN_FUNCTION_COLUMNS,
+    SCREEN_REGISTRY_COLUMNS,
+    SITEMAP_COLUMNS,
+    STATE_TRANSITION_COLUMNS,
+)
+
+# output.json 항목에 담을 의미 필드 (sheet_schema의 필드 이름, 항목 키 순서)
+IA_ITEM_FIELDS = ('screen_id', 'func_definition', 'category', 'depth1', 'depth2', 'depth3', 'policy_id')
+SPM_ITEM_FIELDS = ('policy_intro', 'policy_category', 'policy_content')
+
 class ComprehensiveValidator:
     def __init__(self, prd_path: str, output_json_path: str):
         self.prd_path = prd_path
@@ -22,6 +42,7 @@ class ComprehensiveValidator:
         self.info = []
         
         # PRD 데이터 구조
+        self.document = None  # PRDDocument
         self.prd_screens = {}  # SCR-#### -> {name, flow, functions}
         self.prd_functions = {}  # FUNC-## -> {name, screens, apis, entities}
         self.prd_flows = {}  # FLOW-## -> {name, screens, order}
@@ -36,195 +57,143 @@ class ComprehensiveValidator:
         self.spm_items = []  # SPM 정책 항목
         
     def parse_prd(self):
-        """PRD 파일 파싱"""
+        """PRD 파일 파싱 (내용이 같으면 디스크 캐시 재사용)"""
         print("PRD 파일 파싱 중...")
-        with open(self.prd_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        parsed = cached_parse(self.prd_path, 'comprehensive.prd', self._parse_prd_file,
+                              version=DOCUMENT_CACHE_VERSION)
+        for name, value in parsed.items():
+            setattr(self, name, value)
+        
+        print(f"  - Screen: {len(self.prd_screens)}개")
+        print(f"  - Function: {len(self.prd_functions)}개")
+        print(f"  - Flow: {len(self.prd_flows)}개")
+        print(f"  - API: {len(self.prd_apis)}개")
+        print(f"  - 사이트맵 항목: {len(self.prd_sitemap)}개")
+        print(f"  - 상태 전이: {len(self.prd_state_transitions)}개")
+    
+    def _parse_prd_file(self, path: str) -> Dict[str, Any]:
+        """PRD 파일을 실제로 파싱하여 캐시할 상태를 반환"""
+        self.document = PRDDocument.from_file_incremental(path)
+        doc = self.document
         
         # Screen Registry 파싱
-        screen_pattern = r'\|\s*(SCR-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        screen_matches = re.finditer(screen_pattern, content)
-        for match in screen_matches:
-            screen_id = match.group(1).strip()
-            name = match.group(2).strip()
-            role = match.group(3).strip()
-            flow = match.group(4).strip()
-            status = match.group(5).strip()
-            self.prd_screens[screen_id] = {
-                'name': name,
-                'role': role,
-                'flow': flow,
-                'status': status,
+        for record in doc.records(SCREEN_REGISTRY_COLUMNS, key=prd_regex.compile(r'SCR-\d+')):
+            self.prd_screens[record['id']] = {
+                'name': record['name'],
+                'role': record['role'],
+                'flow': record['flow'],
+                'status': record['status'],
                 'functions': []
             }
         
         # Function Registry 파싱
-        func_pattern = r'\|\s*(FUNC-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        func_matches = re.finditer(func_pattern, content)
-        for match in func_matches:
-            func_id = match.group(1).strip()
-            name = match.group(2).strip()
-            desc = match.group(3).strip()
-            screens = match.group(4).strip()
-            status = match.group(5).strip()
-            self.prd_functions[func_id] = {
-                'name': name,
-                'description': desc,
-                'screens': [s.strip() for s in screens.split(',') if s.strip()],
-                'status': status,
+        for record in doc.records(FUNCTION_REGISTRY_COLUMNS, key=prd_regex.compile(r'FUNC-\d+')):
+            self.prd_functions[record['id']] = {
+                'name': record['name'],
+                'description': record['description'],
+                'screens': prd_regex.findall(r'SCR-\d+', record['related_screens']),
+                'status': record['status'],
                 'apis': [],
                 'entities': []
             }
         
         # Flow Registry 파싱
-        flow_pattern = r'\|\s*(FLOW-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        flow_matches = re.finditer(flow_pattern, content)
-        for match in flow_matches:
-            flow_id = match.group(1).strip()
-            name = match.group(2).strip()
-            desc = match.group(3).strip()
-            owner = match.group(4).strip()
-            status = match.group(5).strip()
-            self.prd_flows[flow_id] = {
-                'name': name,
-                'description': desc,
-                'owner': owner,
-                'status': status,
+        for record in doc.records(FLOW_REGISTRY_COLUMNS, key=prd_regex.compile(r'FLOW-\d+')):
+            self.prd_flows[record['id']] = {
+                'name': record['name'],
+                'description': record['description'],
+                'owner': record['owner'],
+                'status': record['status'],
                 'screens': []
             }
         
         # API Registry 파싱
-        api_pattern = r'\|\s*(API-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        api_matches = re.finditer(api_pattern, content)
-        for match in api_matches:
-            api_id = match.group(1).strip()
-            name = match.group(2).strip()
-            method = match.group(3).strip()
-            endpoint = match.group(4).strip()
-            desc = match.group(5).strip()
-            func = match.group(6).strip()
-            nfr = match.group(7).strip()
-            status = match.group(8).strip()
-            self.prd_apis[api_id] = {
-                'name': name,
-                'method': method,
-                'endpoint': endpoint,
-                'description': desc,
-                'function': func,
-                'nfr': nfr,
-                'status': status
+        for record in doc.records(API_REGISTRY_COLUMNS, key=prd_regex.compile(r'API-\d+')):
+            self.prd_apis[record['id']] = {
+                'name': record['name'],
+                'method': record['method'],
+                'endpoint': record['endpoint'],
+                'description': record['description'],
+                'function': record['related_function'],
+                'nfr': record['related_nfr'],
+                'status': record['status']
             }
         
         # 사이트맵 파싱 (딜러 사이트맵)
-        sitemap_pattern = r'\|\s*딜러\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        sitemap_matches = re.finditer(sitemap_pattern, content)
-        for match in sitemap_matches:
-            depth1 = match.group(1).strip()
-            depth2 = match.group(2).strip()
-            depth3 = match.group(3).strip()
-            contents = match.group(4).strip()
+        for record in doc.records(SITEMAP_COLUMNS, key=prd_regex.compile(r'딜러')):
+            contents = record['contents']
             # SCR-#### 추출
-            screen_match = re.search(r'\(SCR-\d+\)', contents)
+            screen_match = prd_regex.search(r'\(SCR-\d+\)', contents)
             screen_id = screen_match.group(0)[1:-1] if screen_match else None
             self.prd_sitemap.append({
-                'depth1': depth1,
-                'depth2': depth2,
-                'depth3': depth3,
+                'depth1': record['depth1'],
+                'depth2': record['depth2'],
+                'depth3': record['depth3'],
                 'contents': contents,
                 'screen_id': screen_id
             })
         
-        # 상태 전이 파싱
-        state_pattern = r'\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        state_section = re.search(r'### 15\.2 상태 전이 로직', content)
-        if state_section:
-            state_content = content[state_section.end():]
-            state_matches = re.finditer(state_pattern, state_content)
-            for match in state_matches:
-                prev_state = match.group(1).strip()
-                next_state = match.group(2).strip()
-                trigger = match.group(3).strip()
-                actor = match.group(4).strip()
-                if prev_state and next_state and not prev_state.startswith('이전'):
-                    self.prd_state_transitions.append({
-                        'from': prev_state,
-                        'to': next_state,
-                        'trigger': trigger,
-                        'actor': actor
-                    })
-        
-        print(f"  - Screen: {len(self.prd_screens)}개")
-        print(f"  - Function: {len(self.prd_functions)}개")
-        print(f"  - Flow: {len(self.prd_flows)}개")
-        print(f"  - API: {len(self.prd_apis)}개")
-        print(f"  - 사이트맵 항목: {len(self.prd_sitemap)}개")
-        print(f"  - 상태 전이: {len(self.prd_state_transitions)}개")
+        # 상태 전이 파싱 ('이전 상태 | 다음 상태 | 트리거 이벤트 | 주체' 표)
+        for record in doc.records(STATE_TRANSITION_COLUMNS):
+            if record['from'] and record['to']:
+                self.prd_state_transitions.append(dict(record))
+        
+        return {
+            'document': self.document,
+            'prd_screens': self.prd_screens,
+            'prd_functions': self.prd_functions,
+            'prd_flows': self.prd_flows,
+            'prd_apis': self.prd_apis,
+            'prd_sitemap': self.prd_sitemap,
+            'prd_state_transitions': self.prd_state_transitions,
+        }
     
     def parse_output_json(self):
-        """output.json 파일 파싱"""
+        """output.json 파일 파싱 (내용이 같으면 디스크 캐시 재사용)"""
         print("output.json 파일 파싱 중...")
-        with open(self.output_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # IA 1.0 시트 찾기
-        ia_sheet = None
-        spm_sheet = None
-        for sheet in data['sheets']:
-            if sheet['name'] == 'IA 1.0':
-                ia_sheet = sheet
-            elif sheet['name'] == 'SPM 1.0':
-                spm_sheet = sheet
-        
-        if not ia_sheet:
-            self.issues.append("output.json에 IA 1.0 시트가 없습니다")
-            return
-        
-        if not spm_sheet:
-            self.issues.append("output.json에 SPM 1.0 시트가 없습니다")
-            return
-        
-        # IA 1.0 파싱
-        for row in ia_sheet['data']:
-            # 기능 ID 찾기
-            func_id = None
-            for key, value in row.items():
-                if isinstance(value, str) and value.startswith('Seller-ia-front-'):
-                    func_id = value
-                    break
-            
-            if func_id:
-                item = {
-                    'func_id': func_id,
-                    'screen_id': row.get('화면 ID', ''),
-                    'func_definition': row.get('기능 정의', ''),
-                    'category': row.get('카테고리', ''),
-                    'depth1': row.get('Depth 1', ''),
-                    'depth2': row.get('Depth 2', ''),
-                    'depth3': row.get('Depth 3', ''),
-                    'policy_id': row.get('관련 정책 ID', ''),
-                }
-                self.ia_items.append(item)
-        
-        # SPM 1.0 파싱
-        for row in spm_sheet['data']:
-            policy_id = None
-            for key, value in row.items():
-                if isinstance(value, str) and value.startswith('dealer-sp-'):
-                    policy_id = value
-                    break
-            
-            if policy_id:
-                item = {
-                    'policy_id': policy_id,
-                    'policy_intro': row.get('정책 소개', ''),
-                    'policy_category': row.get('정책분류', ''),
-                    'policy_content': row.get('정책 내용', ''),
-                }
-                self.spm_items.append(item)
+        parsed = cached_parse(self.output_json_path, 'comprehensive.output_json', self._parse_output_json_file)
+        self.ia_items = parsed['ia_items']
+        self.spm_items = parsed['spm_items']
+        self.issues.extend(parsed['issues'])
         
         print(f"  - IA 항목: {len(self.ia_items)}개")
         print(f"  - SPM 항목: {len(self.spm_items)}개")
     
+    def _parse_output_json_file(self, path: str) -> Dict[str, List]:
+        """output.json을 실제로 파싱하여 IA/SPM 항목과 시트 누락 이슈를 반환"""
+        ia_items = []
+        spm_items = []
+        found_sheets = set()
+        
+        # IA/SPM 시트만 한 번의 스트리밍 읽기로 처리
+        for sheet_name, rows in iter_sheets(path, [IA_SHEET, SPM_SHEET]):
+            found_sheets.add(sheet_name)
+            
+            # ID 열/의미 열은 시트마다 한 번만 감지하고 행에서는 열 이름으로 바로 조회
+            schema, rows = detect_from_rows(path, sheet_name, rows)
+            
+            # IA 1.0 파싱
+            if sheet_name == IA_SHEET:
+                for row in rows:
+                    item = schema.extract(row, IA_ITEM_FIELDS)
+                    if item:
+                        ia_items.append(item)
+            
+            # SPM 1.0 파싱
+            elif sheet_name == SPM_SHEET:
+                for row in rows:
+                    item = schema.extract(row, SPM_ITEM_FIELDS)
+                    if item:
+                        spm_items.append(item)
+        
+        if IA_SHEET not in found_sheets:
+            return {'ia_items': [], 'spm_items': [], 'issues': ["output.json에 IA 1.0 시트가 없습니다"]}
+        
+        if SPM_SHEET not in found_sheets:
+            return {'ia_items': [], 'spm_items': [], 'issues': ["output.json에 SPM 1.0 시트가 없습니다"]}
+        
+        return {'ia_items': ia_items, 'spm_items': spm_items, 'issues': []}
+    
     def validate_prd_internal_consistency(self):
         """PRD 내부 일관성 검증"""
         print("\n=== PRD 내부 일관성 검증 ===")
@@ -234,18 +203,10 @@ class ComprehensiveValidator:
         screen_func_mapping = defaultdict(set)
         
         # Screen → Function 매핑 테이블에서 추출
-        screen_func_pattern = r'\|\s*(SCR-\d+)\s*\|\s*(FUNC-\d+[^|]*)\s*\|\s*([^|]+)\s*\|'
-        with open(self.prd_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        screen_func_matches = re.finditer(screen_func_pattern, content)
-        for match in screen_func_matches:
-            screen_id = match.group(1).strip()
-            funcs_str = match.group(2).strip()
+        for record in self.document.records(SCREEN_FUNCTION_COLUMNS, key=prd_regex.compile(r'SCR-\d+')):
             # FUNC-XX 추출
-            funcs = re.findall(r'FUNC-\d+', funcs_str)
-            for func_id in funcs:
-                screen_func_mapping[screen_id].add(func_id)
+            for func_id in prd_regex.findall(r'FUNC-\d+', record['functions']):
+                screen_func_mapping[record['screen']].add(func_id)
         
         # Function Registry의 screens와 비교
         for func_id, func_data in self.prd_functions.items():
@@ -268,14 +229,10 @@ class ComprehensiveValidator:
         
         # 3. Flow-Screen 순서 일관성
         print("\n3. Flow-Screen 순서 일관성 검증...")
-        flow_screen_pattern = r'\|\s*(FLOW-\d+)\s*\|\s*(SCR-\d+)\s*\|\s*(\d+)\s*\|\s*([^|]+)\s*\|'
-        flow_screen_matches = re.finditer(flow_screen_pattern, content)
         flow_screens = defaultdict(list)
-        for match in flow_screen_matches:
-            flow_id = match.group(1).strip()
-            screen_id = match.group(2).strip()
-            order = int(match.group(3).strip())
-            flow_screens[flow_id].append((order, screen_id))
+        for record in self.document.records(FLOW_SCREEN_COLUMNS, key=prd_regex.compile(r'FLOW-\d+')):
+            if prd_regex.fullmatch(r'SCR-\d+', record['screen']) and record['order'].isdigit():
+                flow_screens[record['flow']].append((int(record['order']), record['screen']))
         
         for flow_id, screens in flow_screens.items():
             screens.sort(key=lambda x: x[0])
@@ -317,14 +274,14 @@ class ComprehensiveValidator:
             if item['screen_id']:
                 output_screens.add(item['screen_id'])
         
-        prd_screen_names = {screen['name']: screen_id for screen_id, screen in self.prd_screens.items()}
-        
-        # output.json의 화면 ID가 PRD Screen 이름과 매핑 가능한지 확인
-        for screen_id in output_screens:
-            # 화면 ID를 화면명으로 변환 시도
-            screen_name = screen_id.replace('Join', '회원가입').replace('Offer', '제안')
-            if screen_name not in prd_screen_names:
+        # output.json의 화면 ID를 동의어 표 + 편집 거리로 PRD Screen에 해석
+        resolver = ScreenResolver.from_registry(self.prd_screens)
+        for screen_id in sorted(output_screens):
+            match = resolver.resolve(screen_id)
+            if match is None:
                 self.warnings.append(f"output.json의 화면 ID '{screen_id}'가 PRD Screen과 매핑되지 않음")
+            else:
+                self.info.append(f"output.json의 화면 ID '{screen_id}' → {match.screen_id} (신뢰도 {match.confidence:.2f})")
     
     def validate_logical_consistency(self):
         """논리적 일관성 검증"""
@@ -6,7 +6,7 @@ PRD 마크다운을 DOCX로 변환하는 스크립트
 - 제목은 볼드체로 변환
 """
 
-import re
+import prd_regex
 import sys
 from pathlib import Path
 
@@ -33,7 +33,7 @@ def preprocess_markdown(input_file, output_file):
     
     # > 참조: 또는 > 주석: 패턴 찾기
     comment_pattern = r'>\s*(참조|주석|비고):\s*([^\n]+)'
-    content = re.sub(comment_pattern, replace_comment, content)
+    content = prd_regex.sub(comment_pattern, replace_comment, content)
     
     # 2. 표 내의 "비고" 컬럼도 각주로 변환 (간단한 패턴)
     # 표 내 비고는 그대로 유지하되, 필요시 수동 처리
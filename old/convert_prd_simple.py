@@ -4,7 +4,7 @@
 PRD를 HTML로 변환하여 Word에서 열 수 있도록 하는 간단한 스크립트
 """
 
-import re
+import prd_regex
 from pathlib import Path
 
 def markdown_to_html(md_file_path, html_file_path):
@@ -66,7 +66,7 @@ def markdown_to_html(md_file_path, html_file_path):
             level = len(line) - len(line.lstrip('#'))
             text = line.lstrip('# ').strip()
             # 볼드 제거
-            text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
+            text = prd_regex.sub(r'\*\*(.+?)\*\*', r'\1', text)
             html.append(f'<h{level}>{text}</h{level}>')
             i += 1
             continue
@@ -107,13 +107,13 @@ def markdown_to_html(md_file_path, html_file_path):
         # 일반 텍스트 (볼드, 이탤릭, 링크 처리)
         text = line
         # 볼드
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+        text = prd_regex.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
         # 이탤릭
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+        text = prd_regex.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
         # 인라인 코드
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+        text = prd_regex.sub(r'`([^`]+)`', r'<code>\1</code>', text)
         # 링크
-        text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
+        text = prd_regex.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
         
         html.append(f'<p>{text}</p>')
         i += 1
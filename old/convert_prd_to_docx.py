@@ -4,7 +4,7 @@
 PRD_Phase1_2025-12-31.md를 DOCX로 변환하는 스크립트
 """
 
-import re
+import prd_regex
 import sys
 from pathlib import Path
 
@@ -33,7 +33,7 @@ def parse_markdown_table(line):
 
 def is_table_separator(line):
     """테이블 구분선인지 확인"""
-    return re.match(r'^\s*\|[\s\-:]+\|\s*$', line)
+    return prd_regex.match(r'^\s*\|[\s\-:]+\|\s*$', line)
 
 def add_hyperlink(paragraph, text, url):
     """하이퍼링크 추가"""
@@ -104,7 +104,7 @@ def convert_md_to_docx(md_file_path, docx_file_path):
             continue
         
         # 제목 처리 (#, ##, ### 등)
-        heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
+        heading_match = prd_regex.match(r'^(#{1,6})\s+(.+)$', line)
         if heading_match:
             if in_table:
                 in_table = False
@@ -114,7 +114,7 @@ def convert_md_to_docx(md_file_path, docx_file_path):
             level = len(heading_match.group(1))
             text = heading_match.group(2).strip()
             # 볼드 제거
-            text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
+            text = prd_regex.sub(r'\*\*(.+?)\*\*', r'\1', text)
             
             if level == 1:
                 para = doc.add_heading(text, level=1)
@@ -207,7 +207,7 @@ def convert_md_to_docx(md_file_path, docx_file_path):
                 table_header = None
             
             para = doc.add_paragraph()
-            parts = re.split(r'(`[^`]+`)', line)
+            parts = prd_regex.split(r'(`[^`]+`)', line)
             for part in parts:
                 if part.startswith('`') and part.endswith('`'):
                     run = para.add_run(part[1:-1])
@@ -229,7 +229,7 @@ def convert_md_to_docx(md_file_path, docx_file_path):
             # 링크 패턴 찾기
             link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
             last_pos = 0
-            for match in re.finditer(link_pattern, line):
+            for match in prd_regex.finditer(link_pattern, line):
                 # 링크 앞 텍스트
                 if match.start() > last_pos:
                     para.add_run(line[last_pos:match.start()])
@@ -255,7 +255,7 @@ def convert_md_to_docx(md_file_path, docx_file_path):
         para = doc.add_paragraph()
         
         # 볼드 처리 **text**
-        parts = re.split(r'(\*\*[^\*]+\*\*)', text)
+        parts = prd_regex.split(r'(\*\*[^\*]+\*\*)', text)
         for part in parts:
             if part.startswith('**') and part.endswith('**'):
                 run = para.add_run(part[2:-2])
@@ -3,7 +3,7 @@
 마크다운 파일을 각주를 추가하고 소제목을 볼드 처리한 후 docx로 변환하는 스크립트
 """
 
-import re
+import prd_regex
 import subprocess
 import sys
 
@@ -68,7 +68,7 @@ def process_markdown(input_file, output_file):
                 for j, part in enumerate(parts):
                     if '소스(근거 문서)' in parts[j-1] if j > 0 else False:
                         source_value = part.strip()
-                        if source_value and not re.search(r'\[\^\d+\]', source_value):
+                        if source_value and not prd_regex.search(r'\[\^\d+\]', source_value):
                             footnote_id = get_footnote_id(f"소스(근거 문서): {source_value}")
                             parts[j] = f" {source_value} [^{footnote_id}] "
                             line = '|'.join(parts)
@@ -76,14 +76,14 @@ def process_markdown(input_file, output_file):
                     # 또는 이전 행이 헤더인 경우
                     elif j > 0 and '소스(근거 문서)' in new_lines[-1] if new_lines else False:
                         source_value = part.strip()
-                        if source_value and not re.search(r'\[\^\d+\]', source_value) and source_value:
+                        if source_value and not prd_regex.search(r'\[\^\d+\]', source_value) and source_value:
                             footnote_id = get_footnote_id(f"소스(근거 문서): {source_value}")
                             parts[j] = f" {source_value} [^{footnote_id}] "
                             line = '|'.join(parts)
                             break
         
         # 4. 소제목(##, ###, ####)을 볼드 처리
-        heading_match = re.match(r'^(#{2,4})\s+(.+?)$', line)
+        heading_match = prd_regex.match(r'^(#{2,4})\s+(.+?)$', line)
         if heading_match:
             level = heading_match.group(1)
             title = heading_match.group(2).strip()
@@ -109,7 +109,7 @@ def process_markdown(input_file, output_file):
         
         toc_section = content[toc_start:toc_end]
         # 목차 항목 볼드 처리: 숫자. [텍스트](링크) 형식
-        toc_section = re.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
+        toc_section = prd_regex.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
         content = content[:toc_start] + toc_section + content[toc_end:]
     
     # 6. 각주 정의 추가 (문서 끝에)
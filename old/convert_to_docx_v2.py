@@ -3,7 +3,7 @@
 마크다운 파일을 각주를 추가하고 소제목을 볼드 처리한 후 docx로 변환하는 스크립트
 """
 
-import re
+import prd_regex
 
 def process_markdown(input_file, output_file):
     """마크다운 파일을 처리하여 각주 추가 및 소제목 볼드 처리"""
@@ -78,7 +78,7 @@ def process_markdown(input_file, output_file):
                 source_col_index = header_parts.index('소스(근거 문서)')
                 if source_col_index < len(parts):
                     source_value = parts[source_col_index]
-                    if source_value and source_value != '소스(근거 문서)' and not re.search(r'\[\^\d+\]', source_value):
+                    if source_value and source_value != '소스(근거 문서)' and not prd_regex.search(r'\[\^\d+\]', source_value):
                         footnote_id = get_footnote_id(f"소스(근거 문서): {source_value}")
                         parts[source_col_index] = f"{source_value} [^{footnote_id}]"
                         # 원래 형식 유지하면서 재구성
@@ -88,7 +88,7 @@ def process_markdown(input_file, output_file):
                             line = '|'.join(line_parts)
         
         # 4. 소제목(##, ###, ####)을 볼드 처리
-        heading_match = re.match(r'^(#{2,4})\s+(.+?)$', line)
+        heading_match = prd_regex.match(r'^(#{2,4})\s+(.+?)$', line)
         if heading_match:
             level = heading_match.group(1)
             title = heading_match.group(2).strip()
@@ -110,7 +110,7 @@ def process_markdown(input_file, output_file):
         
         toc_section = content[toc_start:toc_end]
         # 목차 항목 볼드 처리
-        toc_section = re.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
+        toc_section = prd_regex.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
         content = content[:toc_start] + toc_section + content[toc_end:]
     
     # 6. 각주 정의 추가 (문서 끝에)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IA/SPM 버전 간 변경 비교 스크립트
+- 두 output.json(또는 원본 .xlsx)의 IA 1.0 / SPM 1.0 항목을 ID(Seller-ia-front-*, dealer-sp-*)로 색인
+- 항목마다 필드 값 해시를 만들어 해시가 다른 항목만 필드 단위로 비교 (항목 수에 선형)
+- 추가/삭제/변경 항목과 변경 필드를 출력하고, --json으로 변경 ID 목록을 저장하여 후속 검증이 바뀐 항목만 다시 검사
+
+사용법
+    python diff_ia_spm.py 이전_output.json 새_output.json [--json 변경목록.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from prd_cache import cached_parse, content_digest
+from extract_output_json_details import extract_items
+
+# 항목 목록 이름 → (표시 이름, ID 필드)
+ITEM_KINDS = {
+    'ia_items': ('IA 1.0', 'func_id'),
+    'spm_items': ('SPM 1.0', 'policy_id'),
+}
+
+
+@dataclass
+class FieldChange:
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class ItemDiff:
+    kind: str
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: Dict[str, List[FieldChange]] = field(default_factory=dict)
+    unchanged: int = 0
+
+    @property
+    def changed_ids(self) -> List[str]:
+        """다시 검사해야 할 ID (추가 + 변경, 새 버전 순서)"""
+        return self.added + list(self.modified)
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+def item_digest(item: Dict[str, Any]) -> str:
+    """항목 필드 값 해시 (키 순서와 무관)"""
+    return content_digest(json.dumps(item, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+
+
+def index_items(items: List[Dict[str, Any]], id_field: str) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """ID → (해시, 항목). 같은 ID가 또 나오면 'ID#2'처럼 등장 순번을 붙여 구분"""
+    index = {}
+    seen: Dict[str, int] = {}
+    for item in items:
+        item_id = item[id_field]
+        seen[item_id] = seen.get(item_id, 0) + 1
+        key = item_id if seen[item_id] == 1 else f"{item_id}#{seen[item_id]}"
+        index[key] = (item_digest(item), item)
+    return index
+
+
+def field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> List[FieldChange]:
+    changes = []
+    for name in list(old) + [name for name in new if name not in old]:
+        if old.get(name, '') != new.get(name, ''):
+            changes.append(FieldChange(name, old.get(name, ''), new.get(name, '')))
+    return changes
+
+
+def diff_items(kind: str, old_items: List[Dict[str, Any]], new_items: List[Dict[str, Any]], id_field: str) -> ItemDiff:
+    result = ItemDiff(kind=kind)
+    old_index = index_items(old_items, id_field)
+    new_index = index_items(new_items, id_field)
+
+    for key, (digest, item) in new_index.items():
+        previous = old_index.get(key)
+        if previous is None:
+            result.added.append(key)
+        elif previous[0] == digest:
+            result.unchanged += 1
+        else:
+            result.modified[key] = field_changes(previous[1], item)
+    result.removed = [key for key in old_index if key not in new_index]
+    return result
+
+
+def diff_versions(old_path: str, new_path: str) -> List[ItemDiff]:
+    """두 버전의 IA/SPM 항목 비교 (파싱 결과는 내용 해시 캐시 재사용)"""
+    old = cached_parse(old_path, 'extract.items', extract_items)
+    new = cached_parse(new_path, 'extract.items', extract_items)
+    return [
+        diff_items(kind, old[name], new[name], id_field)
+        for name, (kind, id_field) in ITEM_KINDS.items()
+    ]
+
+
+def _shorten(value: Any, limit: int = 60) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    text = text.replace('\n', ' ')
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def print_diff(diffs: List[ItemDiff]):
+    for diff in diffs:
+        print(f"\n=== {diff.kind} ===")
+        print(f"추가 {len(diff.added)}개, 삭제 {len(diff.removed)}개, 변경 {len(diff.modified)}개, 동일 {diff.unchanged}개")
+        for key in diff.added:
+            print(f"  + {key}")
+        for key in diff.removed:
+            print(f"  - {key}")
+        for key, changes in diff.modified.items():
+            print(f"  ~ {key}")
+            for change in changes:
+                print(f"      {change.field}: {_shorten(change.old)!r} → {_shorten(change.new)!r}")
+
+
+def diff_to_dict(diffs: List[ItemDiff]) -> Dict[str, Any]:
+    return {
+        diff.kind: {
+            'added': diff.added,
+            'removed': diff.removed,
+            'modified': {
+                key: [{'field': change.field, 'old': change.old, 'new': change.new} for change in changes]
+                for key, changes in diff.modified.items()
+            },
+            'changed_ids': diff.changed_ids,
+        }
+        for diff in diffs
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IA/SPM 버전 간 변경 비교')
+    parser.add_argument('old', help='이전 output.json 또는 원본 엑셀(.xlsx)')
+    parser.add_argument('new', help='새 output.json 또는 원본 엑셀(.xlsx)')
+    parser.add_argument('--json', dest='json_path', help='변경 목록을 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    for path in (args.old, args.new):
+        if not os.path.exists(path):
+            print(f"파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    diffs = diff_versions(args.old, args.new)
+    print_diff(diffs)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(diff_to_dict(diffs), f, ensure_ascii=False, indent=2)
+        print(f"\n변경 목록 저장: {args.json_path}")
+
+    # 변경이 있으면 종료 코드 1 (diff 관례)
+    sys.exit(1 if any(diff.has_changes() for diff in diffs) else 0)
+
+
+if __name__ == "__main__":
+    main()
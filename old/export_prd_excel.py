@@ -5,6 +5,8 @@ ForwardMax PRD Excel 변환 스크립트
 """
 
 import re
+
+import prd_regex
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
@@ -26,7 +28,7 @@ def parse_markdown_table(md_content, sheet_name):
     """
     # 시트 선언 찾기: ## SHEET: 시트명
     pattern = rf'## SHEET:\s*{re.escape(sheet_name)}\s*\n(.*?)(?=\n## SHEET:|$)'
-    match = re.search(pattern, md_content, re.DOTALL)
+    match = prd_regex.search(pattern, md_content, re.DOTALL)
     
     if not match:
         return None
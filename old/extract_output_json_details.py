@@ -9,66 +9,42 @@ import json
 from collections import defaultdict
 from pathlib import Path
 
+from item_snapshot import load_items
+from sheet_loader import IA_SHEET, SPM_SHEET, iter_sheets
+from sheet_schema import detect_from_rows
+
+SHEET_RESULT_KEYS = {IA_SHEET: 'ia_items', SPM_SHEET: 'spm_items'}
+
+def _extract_sheet(file_path, sheet_name, rows):
+    """시트 스키마(ID 열/의미 열)를 한 번 감지한 뒤 열 이름으로 바로 항목 추출"""
+    schema, rows = detect_from_rows(file_path, sheet_name, rows)
+    items = []
+    for row in rows:
+        item = schema.extract(row)
+        if item is not None:
+            items.append(item)
+    return items
+
+def extract_items(file_path):
+    """IA 1.0 / SPM 1.0 항목을 한 번의 스트리밍 읽기로 추출"""
+    result = {'ia_items': [], 'spm_items': []}
+    for sheet_name, rows in iter_sheets(file_path, SHEET_RESULT_KEYS):
+        result[SHEET_RESULT_KEYS[sheet_name]] = _extract_sheet(file_path, sheet_name, rows)
+    return result
+
+def extract_items_from(file_path, sheet_name):
+    """시트 하나의 항목만 추출 (해당 시트를 읽으면 나머지는 읽지 않음)"""
+    for _, rows in iter_sheets(file_path, [sheet_name]):
+        return _extract_sheet(file_path, sheet_name, rows)
+    return []
+
 def extract_ia_items(file_path):
     """IA 1.0 시트의 모든 항목 추출"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    ia_sheet = next((s for s in data['sheets'] if s['name'] == 'IA 1.0'), None)
-    if not ia_sheet:
-        return []
-    
-    ia_items = []
-    for row in ia_sheet['data']:
-        func_id = row.get('System.Xml.XmlElement', '')
-        if func_id and func_id.startswith('Seller-ia-front-'):
-            item = {
-                'func_id': func_id,
-                'screen_id': row.get('화면 ID', ''),
-                'func_definition': row.get('기능 정의', ''),
-                'category': row.get('카테고리', ''),
-                'depth1': row.get('Depth 1', ''),
-                'depth2': row.get('Depth 2', ''),
-                'depth3': row.get('Depth 3', ''),
-                'policy_id': row.get('관련 정책 ID', ''),
-                'importance': row.get('중요도', ''),
-                'implementation_target': row.get('구현 대상', ''),
-            }
-            ia_items.append(item)
-    
-    return ia_items
+    return extract_items_from(file_path, IA_SHEET)
 
 def extract_spm_items(file_path):
     """SPM 1.0 시트의 모든 항목 추출"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    spm_sheet = next((s for s in data['sheets'] if s['name'] == 'SPM 1.0'), None)
-    if not spm_sheet:
-        return []
-    
-    spm_items = []
-    for row in spm_sheet['data']:
-        # 정책 코드 찾기
-        policy_code = row.get('정책 코드', '')
-        if not policy_code:
-            # 다른 필드에서 찾기 시도
-            for key, value in row.items():
-                if isinstance(value, str) and value.startswith('dealer-sp-'):
-                    policy_code = value
-                    break
-        
-        if policy_code and policy_code.startswith('dealer-sp-'):
-            item = {
-                'policy_id': policy_code,
-                'policy_intro': row.get('정책 소개', ''),
-                'policy_content': row.get('정책 내용', ''),
-                'policy_category': row.get('정책분류', ''),
-                'detail_item': row.get('세부 항목', ''),
-            }
-            spm_items.append(item)
-    
-    return spm_items
+    return extract_items_from(file_path, SPM_SHEET)
 
 def group_by_category(items):
     """카테고리별로 그룹화"""
@@ -81,41 +57,46 @@ def group_by_category(items):
 def main():
     output_json_path = r'C:\carivdealer\FOWARDMAX\output.json'
     
+    snapshot_path = r'C:\carivdealer\FOWARDMAX\output_json_extracted.prdsnap'
+    
+    # 열 단위 스냅샷이 output.json과 같으면 파싱 없이 mmap으로 읽음 (없거나 오래되었으면 파싱 후 저장)
+    # 표는 열 단위 그대로 두고 행 뷰로 순회 (dict 목록은 JSON 저장에만 만듦)
     print("output.json 파싱 중...")
-    ia_items = extract_ia_items(output_json_path)
-    spm_items = extract_spm_items(output_json_path)
+    with load_items(output_json_path, extract_items, snapshot_path) as extracted:
+        ia_items = extracted['ia_items']
+        spm_items = extracted['spm_items']
     
-    print(f"\nIA 항목: {len(ia_items)}개")
-    print(f"SPM 항목: {len(spm_items)}개")
+        print(f"\nIA 항목: {len(ia_items)}개")
+        print(f"SPM 항목: {len(spm_items)}개")
     
-    # 카테고리별 그룹화
-    ia_by_category = group_by_category(ia_items)
+        # 카테고리별 그룹화
+        ia_by_category = group_by_category(ia_items)
     
-    print("\n=== IA 카테고리별 분포 ===")
-    for category, items in sorted(ia_by_category.items()):
-        print(f"{category}: {len(items)}개")
+        print("\n=== IA 카테고리별 분포 ===")
+        for category, items in sorted(ia_by_category.items()):
+            print(f"{category}: {len(items)}개")
     
-    # 결과를 JSON으로 저장
-    result = {
-        'ia_items': ia_items,
-        'spm_items': spm_items,
-        'ia_by_category': {k: len(v) for k, v in ia_by_category.items()}
-    }
+        # 결과를 JSON으로 저장
+        result = {
+            'ia_items': [dict(item) for item in ia_items],
+            'spm_items': [dict(item) for item in spm_items],
+            'ia_by_category': {k: len(v) for k, v in ia_by_category.items()}
+        }
     
-    output_path = r'C:\carivdealer\FOWARDMAX\output_json_extracted.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+        output_path = r'C:\carivdealer\FOWARDMAX\output_json_extracted.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
     
-    print(f"\n추출 결과 저장: {output_path}")
+        print(f"\n추출 결과 저장: {output_path}")
     
-    # 샘플 출력
-    print("\n=== IA 샘플 (처음 5개) ===")
-    for item in ia_items[:5]:
-        print(f"- {item['func_id']}: {item['func_definition'][:50]}...")
+        # 샘플 출력
+        print("\n=== IA 샘플 (처음 5개) ===")
+        for item in ia_items[:5]:
+            print(f"- {item['func_id']}: {item['func_definition'][:50]}...")
     
-    print("\n=== SPM 샘플 (처음 5개) ===")
-    for item in spm_items[:5]:
-        print(f"- {item['policy_id']}: {item['policy_intro'][:50] if item['policy_intro'] else '(정책 소개 없음)'}...")
+        print("\n=== SPM 샘플 (처음 5개) ===")
+        for item in spm_items[:5]:
+            print(f"- {item['policy_id']}: {item['policy_intro'][:50] if item['policy_intro'] else '(정책 소개 없음)'}...")
 
 if __name__ == '__main__':
     main()
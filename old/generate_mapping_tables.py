@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IA/SPM ↔ PRD 매핑 테이블 생성 스크립트
+- IA 기능 정의(+ Depth 경로) ↔ PRD Function(기능명 + 설명) 문자 n-gram TF-IDF 유사도 상위 k개로 매핑
+- SPM 정책 소개(+ 세부 항목) ↔ PRD Decision(결정 내용)/NFR(섹션 본문) 유사도로 매핑
+- 매핑된 Function의 관련 Screen/Flow는 PRD 매핑 표에서 가져옴
+- 기본값은 *_자동생성.md에 작성 (손으로 정리한 IA_PRD_매핑_테이블.md, SPM_PRD_매핑_테이블.md는 --ia-output/--spm-output으로 지정할 때만 덮어씀)
+
+사용법
+    python generate_mapping_tables.py [--prd PRD_Phase1_2025-12-31.md] [--output-json output.json] [--top-k 3]
+                                      [--ia-output IA_PRD_매핑_테이블_자동생성.md] [--spm-output SPM_PRD_매핑_테이블_자동생성.md]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from typing import Dict, List, Tuple
+
+from extract_output_json_details import extract_items
+from ngram_similarity import Match, SimilarityIndex
+from prd_cache import cached_parse
+from validate_prd_deep_check import SCREEN_ID_RE, PRDDeepValidator
+
+# 유사도 기준: 이상이면 매핑 가능, 사이면 분석 필요, 미만이면 매핑 불가
+MAPPED_SCORE = 0.3
+REVIEW_SCORE = 0.15
+# 1, 2위 점수 차가 이보다 작으면 후보를 함께 표시하고 분석 필요로 분류
+AMBIGUOUS_MARGIN = 0.05
+
+# 저장소에 커밋된 매핑 테이블과 다른 기본 경로
+DEFAULT_IA_TABLE = 'IA_PRD_매핑_테이블_자동생성.md'
+DEFAULT_SPM_TABLE = 'SPM_PRD_매핑_테이블_자동생성.md'
+
+
+def _cell(text: str, limit: int = 80) -> str:
+    text = ' '.join(str(text).split()).replace('|', '\\|')
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def classify(matches: List[Match]) -> Tuple[List[Match], str]:
+    """(표시할 후보, 매핑 상태)"""
+    if not matches or matches[0].score < REVIEW_SCORE:
+        return [], '매핑 불가'
+    top = matches[0]
+    close = [match for match in matches if top.score - match.score < AMBIGUOUS_MARGIN]
+    if top.score < MAPPED_SCORE or len(close) > 1:
+        return close, '분석 필요'
+    return [top], '매핑 가능'
+
+
+def function_screens(validator: PRDDeepValidator) -> Dict[str, List[str]]:
+    """Function ID → 관련 Screen ID (화면-기능 매핑 표, 없으면 Function Registry의 관련 화면)"""
+    screens: Dict[str, List[str]] = {}
+    for screen_id, function_ids in validator.mappings['screen_to_function'].items():
+        for function_id in function_ids:
+            screens.setdefault(function_id, [])
+            if screen_id not in screens[function_id]:
+                screens[function_id].append(screen_id)
+    for function_id, data in validator.registries['functions'].items():
+        if function_id not in screens:
+            screens[function_id] = SCREEN_ID_RE.findall(data.get('related_screens', ''))
+    return screens
+
+
+def ia_query(item: Dict) -> str:
+    depth = ' '.join(item.get(name, '') for name in ('depth1', 'depth2', 'depth3') if isinstance(item.get(name), str))
+    return f"{item.get('func_definition', '')} {depth}"
+
+
+def spm_query(item: Dict) -> str:
+    detail = item.get('detail_item', '')
+    return f"{item.get('policy_intro', '')} {detail if isinstance(detail, str) else ''}"
+
+
+def generate_ia_table(validator: PRDDeepValidator, ia_items: List[Dict], top_k: int) -> str:
+    functions = validator.registries['functions']
+    screens = validator.registries['screens']
+    queries = {item['func_id']: ia_query(item) for item in ia_items}
+    index = SimilarityIndex(
+        {function_id: f"{data.get('name', '')} {data.get('description', '')}" for function_id, data in functions.items()},
+        fit_documents=queries.values(),
+    )
+    matrix = index.top_k_matrix(queries, k=top_k)
+    related_screens = function_screens(validator)
+
+    lines = []
+    lines.append("# IA-PRD 매핑 테이블")
+    lines.append("")
+    lines.append("**문서명**: output.json IA 1.0 ↔ PRD Function/Screen 매핑 테이블  ")
+    lines.append("**생성 방식**: 문자 n-gram TF-IDF 유사도 자동 매핑 (generate_mapping_tables.py)  ")
+    lines.append(f"**작성일**: {date.today().isoformat()}")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## 매핑 규칙")
+    lines.append("")
+    lines.append("1. **의미 기반 매칭**: IA 기능 정의 + Depth 구조 ↔ PRD 기능명 + 설명의 문자 2~3-gram TF-IDF 코사인 유사도")
+    lines.append(f"2. **매핑 상태**: 유사도 {MAPPED_SCORE} 이상 매핑 가능, {REVIEW_SCORE} 이상 분석 필요, 그 미만 매핑 불가")
+    lines.append(f"3. **후보 경합**: 1, 2위 유사도 차가 {AMBIGUOUS_MARGIN} 미만이면 후보를 함께 표시하고 분석 필요로 분류")
+    lines.append("4. **화면 기반 매칭**: 매핑된 Function의 관련 Screen과 해당 Screen의 Flow")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## IA → PRD Function 매핑")
+    lines.append("")
+    lines.append("| IA 기능 ID | 화면 ID | 기능 정의 | Depth 구조 | PRD Function ID | PRD Screen ID | PRD Flow ID | 매핑 상태 | 매핑 근거 |")
+    lines.append("|---|---|---|---|---|---|---|---|---|")
+
+    status_counts = {'매핑 가능': 0, '분석 필요': 0, '매핑 불가': 0}
+    mapped_functions = set()
+    for item in ia_items:
+        shown, status = classify(matrix[item['func_id']])
+        status_counts[status] += 1
+        function_ids = [match.id for match in shown]
+        mapped_functions.update(function_ids)
+        screen_ids = []
+        for function_id in function_ids:
+            screen_ids.extend(screen_id for screen_id in related_screens.get(function_id, []) if screen_id not in screen_ids)
+        flow_ids = []
+        for screen_id in screen_ids:
+            flow_id = screens.get(screen_id, {}).get('flow', '')
+            if flow_id and flow_id not in flow_ids:
+                flow_ids.append(flow_id)
+        depth = ' > '.join(item.get(name) for name in ('depth1', 'depth2', 'depth3')
+                           if isinstance(item.get(name), str) and item.get(name))
+        basis = ', '.join(f"{match.id} {functions[match.id].get('name', '')} ({match.score:.2f})" for match in shown)
+        if not basis:
+            best = matrix[item['func_id']][:1]
+            basis = f"최고 유사도 {best[0].score:.2f} ({best[0].id})" if best else "유사한 Function 없음"
+        lines.append(
+            f"| {item['func_id']} | {_cell(item.get('screen_id') or '-')} | {_cell(item.get('func_definition') or '-')} "
+            f"| {_cell(depth or '-')} | {' 또는 '.join(function_ids) or '-'} | {' 또는 '.join(screen_ids) or '-'} "
+            f"| {' 또는 '.join(flow_ids) or '-'} | {status} | {_cell(basis, 120)} |"
+        )
+
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## PRD에만 존재하는 Function")
+    lines.append("")
+    lines.append("| PRD Function ID | 기능명 | 설명 | 관련 화면 | 상태 |")
+    lines.append("|---|---|---|---|---|")
+    prd_only = [function_id for function_id in functions if function_id not in mapped_functions]
+    for function_id in prd_only:
+        data = functions[function_id]
+        lines.append(
+            f"| {function_id} | {_cell(data.get('name', ''))} | {_cell(data.get('description', ''))} "
+            f"| {', '.join(related_screens.get(function_id, [])) or '-'} | {_cell(data.get('status', '') or '-')} |"
+        )
+    if not prd_only:
+        lines.append("| - | 모든 Function이 IA 항목의 후보로 매핑됨 | - | - | - |")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## 매핑 통계")
+    lines.append("")
+    lines.append("| 항목 | 개수 | 매핑 가능 | 매핑 불가 | 분석 필요 |")
+    lines.append("|---|---|---|---|---|")
+    lines.append(f"| IA 기능 항목 | {len(ia_items)}개 | {status_counts['매핑 가능']}개 | {status_counts['매핑 불가']}개 | {status_counts['분석 필요']}개 |")
+    lines.append(f"| PRD Function | {len(functions)}개 | {len(mapped_functions)}개 (IA 후보로 등장) | - | - |")
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def generate_spm_table(validator: PRDDeepValidator, spm_items: List[Dict], top_k: int) -> str:
+    decisions = validator.registries['decisions']
+    nfrs = validator.registries['nfrs']
+    queries = {item['policy_id']: spm_query(item) for item in spm_items}
+    decision_index = SimilarityIndex(
+        {decision_id: data.get('content', '') for decision_id, data in decisions.items()},
+        fit_documents=queries.values(),
+    )
+    nfr_index = SimilarityIndex(
+        {nfr_id: data['section'].text if 'section' in data else '' for nfr_id, data in nfrs.items()},
+        fit_documents=queries.values(),
+    )
+    decision_matrix = decision_index.top_k_matrix(queries, k=top_k)
+    nfr_matrix = nfr_index.top_k_matrix(queries, k=top_k)
+
+    lines = []
+    lines.append("# SPM-PRD 매핑 테이블")
+    lines.append("")
+    lines.append("**문서명**: output.json SPM 1.0 ↔ PRD Decision/NFR 매핑 테이블  ")
+    lines.append("**생성 방식**: 문자 n-gram TF-IDF 유사도 자동 매핑 (generate_mapping_tables.py)  ")
+    lines.append(f"**작성일**: {date.today().isoformat()}")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## 매핑 규칙")
+    lines.append("")
+    lines.append("1. **의미 기반 매칭**: 정책 소개 + 세부 항목 ↔ Decision 결정 내용 / NFR 본문의 문자 2~3-gram TF-IDF 코사인 유사도")
+    lines.append(f"2. **매핑 상태**: Decision/NFR 중 높은 유사도 기준 {MAPPED_SCORE} 이상 매핑 가능, {REVIEW_SCORE} 이상 분석 필요, 그 미만 매핑 불가")
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## SPM → PRD Decision/NFR 매핑")
+    lines.append("")
+    lines.append("| SPM 정책 ID | 정책 소개 | 정책분류 | 세부 항목 | PRD Decision ID | PRD NFR ID | 매핑 상태 | 매핑 근거 |")
+    lines.append("|---|---|---|---|---|---|---|---|")
+
+    status_counts = {'매핑 가능': 0, '분석 필요': 0, '매핑 불가': 0}
+    for item in spm_items:
+        decision_shown, decision_status = classify(decision_matrix[item['policy_id']])
+        nfr_shown, nfr_status = classify(nfr_matrix[item['policy_id']])
+        status = min((decision_status, nfr_status), key=['매핑 가능', '분석 필요', '매핑 불가'].index)
+        status_counts[status] += 1
+        basis = ', '.join(f"{match.id} ({match.score:.2f})" for match in decision_shown + nfr_shown) or "유사한 Decision/NFR 없음"
+        detail = item.get('detail_item', '')
+        lines.append(
+            f"| {item['policy_id']} | {_cell(item.get('policy_intro') or '-')} | {_cell(item.get('policy_category') or '-')} "
+            f"| {_cell(detail if isinstance(detail, str) and detail else '-')} "
+            f"| {' 또는 '.join(match.id for match in decision_shown) or '-'} "
+            f"| {' 또는 '.join(match.id for match in nfr_shown) or '-'} | {status} | {basis} |"
+        )
+
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+    lines.append("## 매핑 통계")
+    lines.append("")
+    lines.append("| 항목 | 개수 | 매핑 가능 | 매핑 불가 | 분석 필요 |")
+    lines.append("|---|---|---|---|---|")
+    lines.append(f"| SPM 정책 항목 | {len(spm_items)}개 | {status_counts['매핑 가능']}개 | {status_counts['매핑 불가']}개 | {status_counts['분석 필요']}개 |")
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IA/SPM ↔ PRD 매핑 테이블 생성')
+    parser.add_argument('--prd', default='PRD_Phase1_2025-12-31.md', help='PRD 마크다운 경로')
+    parser.add_argument('--output-json', default='output.json', help='output.json 또는 IA/SPM 원본 엑셀(.xlsx) 경로')
+    parser.add_argument('--top-k', type=int, default=3, help='항목별 후보 수')
+    parser.add_argument('--ia-output', default=DEFAULT_IA_TABLE, help='IA 매핑 테이블 경로 (기본값: 커밋된 표와 별도 파일)')
+    parser.add_argument('--spm-output', default=DEFAULT_SPM_TABLE, help='SPM 매핑 테이블 경로 (기본값: 커밋된 표와 별도 파일)')
+    args = parser.parse_args()
+
+    for path in (args.prd, args.output_json):
+        if not os.path.exists(path):
+            print(f"파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    started = time.perf_counter()
+    validator = PRDDeepValidator(args.prd, args.output_json)
+    validator.parse_prd()
+    items = cached_parse(args.output_json, 'extract.items', extract_items)
+    print(f"PRD Function {len(validator.registries['functions'])}개, Decision {len(validator.registries['decisions'])}개, "
+          f"IA {len(items['ia_items'])}개, SPM {len(items['spm_items'])}개")
+
+    with open(args.ia_output, 'w', encoding='utf-8') as f:
+        f.write(generate_ia_table(validator, items['ia_items'], args.top_k))
+    with open(args.spm_output, 'w', encoding='utf-8') as f:
+        f.write(generate_spm_table(validator, items['spm_items'], args.top_k))
+
+    print(f"완료! ({time.perf_counter() - started:.2f}초) {args.ia_output}, {args.spm_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 변경 영향 분석 (Flow/Screen/Function/Entity/API/NFR/Decision)
+- 추적성 그래프(trace_graph) + 결정로그 영향 범위 열(범위에 나온 Screen/Function … → Decision 간선)
+- 간선 방향은 '의존하는 쪽 → 의존 대상' (Flow → Screen → Function → Entity/API/NFR, Function → Decision)
+  - X에 영향받는 항목: X로 들어오는 역방향 도달 집합
+  - X가 의존하는 항목: X에서 나가는 정방향 도달 집합
+- 도달 집합은 노드마다 정수 비트셋으로 미리 계산 (강연결요소 단위로 한 번씩, 하위 요소부터 OR)
+  조회는 비트셋 AND(종류 필터)와 설정 비트 나열뿐
+- 매핑이 바뀌면 추가 간선은 비트셋 증분 갱신, 제거 간선이 있으면 도달 집합 재계산
+
+사용법
+    python impact_analysis.py ENT-01 API-0101 [--prd PRD_Phase1_2025-12-31.md] [--depends] [--kind functions] [--json impact.json]
+
+    index = ImpactIndex.from_validator(validator)
+    index.affected_by('ENT-01')                       # ['FLOW-01', 'SCR-0200', 'FUNC-05', ...]
+    index.depends_on('FUNC-05', kinds=('apis',))     # ['API-0201', ...]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import prd_regex
+from prd_model import DECISION_SCOPE_HEADERS, PRDDocument
+from trace_graph import KINDS, TraceGraph, kind_of
+from validate_prd_deep_check import DECISION_ID_RE, PRDDeepValidator
+
+KIND_LABELS = {
+    'flows': 'Flow',
+    'screens': 'Screen',
+    'functions': 'Function',
+    'entities': 'Entity',
+    'apis': 'API',
+    'nfrs': 'NFR',
+    'decisions': 'Decision',
+}
+
+_SCOPE_ID_RE = prd_regex.compile(r'(?:FLOW|SCR|FUNC|ENT|API|NFR)-\d+')
+
+
+def decision_scopes(document: PRDDocument) -> Dict[str, List[str]]:
+    """결정로그 표의 영향 범위 열에 나온 ID {결정 ID: [ID, ...]} (문서 순서, 중복 제거)"""
+    scopes: Dict[str, List[str]] = {}
+    for header in DECISION_SCOPE_HEADERS:
+        for record in document.records({'id': '결정 ID', 'scope': header}, key=DECISION_ID_RE):
+            scope = scopes.setdefault(record['id'], [])
+            for ref_id in _SCOPE_ID_RE.findall(record['scope']):
+                if ref_id not in scope:
+                    scope.append(ref_id)
+    return scopes
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """설정된 비트 번호 (오름차순)"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def reachability(graph: TraceGraph, backward: bool = False) -> List[int]:
+    """
+    노드별 도달 집합 비트셋 (자기 자신은 순환에 속할 때만 포함)
+    - 반복 Tarjan으로 강연결요소를 구하면 하위(도달만 당하는) 요소부터 나오므로 그 순서대로 OR
+    """
+    offsets, targets = graph.csr(backward)
+    count = len(graph)
+    order = [-1] * count
+    low = [0] * count
+    on_stack = bytearray(count)
+    component = [-1] * count
+    components: List[List[int]] = []
+    stack: List[int] = []
+    counter = 0
+
+    for root in range(count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, offsets[root])]
+        while work:
+            node, position = work[-1]
+            if position < offsets[node + 1]:
+                work[-1] = (node, position + 1)
+                target = targets[position]
+                if order[target] == -1:
+                    order[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    work.append((target, offsets[target]))
+                elif on_stack[target]:
+                    low[node] = min(low[node], order[target])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == order[node]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component[member] = len(components)
+                    members.append(member)
+                    if member == node:
+                        break
+                components.append(members)
+
+    reach = [0] * len(components)
+    for number, members in enumerate(components):
+        bits = 0
+        cyclic = len(members) > 1
+        for member in members:
+            for i in range(offsets[member], offsets[member + 1]):
+                target = targets[i]
+                if component[target] == number:
+                    cyclic = True
+                else:
+                    bits |= (1 << target) | reach[component[target]]
+        if cyclic:
+            for member in members:
+                bits |= 1 << member
+        reach[number] = bits
+    return [reach[component[node]] for node in range(count)]
+
+
+class ImpactIndex:
+    def __init__(self, graph: TraceGraph):
+        self.graph = graph
+        self.rebuild()
+
+    @classmethod
+    def from_prd(cls, registries: Dict[str, Dict], mappings: Dict[str, Dict],
+                 scopes: Optional[Dict[str, List[str]]] = None) -> 'ImpactIndex':
+        return cls(build_graph(registries, mappings, scopes))
+
+    @classmethod
+    def from_validator(cls, validator: PRDDeepValidator) -> 'ImpactIndex':
+        """parse_prd()를 마친 검증기의 Registry/매핑/결정로그 영향 범위로 구축"""
+        return cls.from_prd(validator.registries, validator.mappings, decision_scopes(validator.document))
+
+    def rebuild(self):
+        """정방향/역방향 도달 집합 전체 재계산"""
+        self.descendants = reachability(self.graph)
+        self.ancestors = reachability(self.graph, backward=True)
+        self._kind_masks: Dict[str, int] = {}
+
+    def _grow(self):
+        """그래프에 새로 생긴 노드의 (빈) 비트셋 추가"""
+        missing = len(self.graph) - len(self.descendants)
+        if missing:
+            self.descendants.extend([0] * missing)
+            self.ancestors.extend([0] * missing)
+            self._kind_masks = {}
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """
+        간선 추가 + 증분 갱신 (이미 있으면 False)
+        - source에 도달하는 노드(자신 포함)는 target과 target의 도달 집합을 새로 얻음 (역방향도 대칭)
+        """
+        if not self.graph.add_edge(source, target):
+            return False
+        self._grow()
+        source_number, target_number = self.graph.index[source], self.graph.index[target]
+        down = (1 << target_number) | self.descendants[target_number]
+        up = (1 << source_number) | self.ancestors[source_number]
+        for number in iter_bits(up):
+            self.descendants[number] |= down
+        for number in iter_bits(down):
+            self.ancestors[number] |= up
+        return True
+
+    def remove_edge(self, source: str, target: str) -> bool:
+        """간선 제거 (제거는 다른 경로가 남았는지 알 수 없으므로 도달 집합 재계산)"""
+        if not self.graph.remove_edge(source, target):
+            return False
+        self.rebuild()
+        return True
+
+    def update(self, graph: TraceGraph) -> Tuple[int, int]:
+        """
+        새로 구축한 그래프와 간선 차이만 반영 (추가 간선 수, 제거 간선 수)
+        - 제거 간선이 없으면 추가 간선만 증분 갱신, 있으면 간선을 모두 반영한 뒤 한 번만 재계산
+        """
+        current = set(self.graph.edges())
+        latest = graph.edges()
+        added = [edge for edge in latest if edge not in current]
+        removed = [edge for edge in current - set(latest)]
+        for node_id in graph.ids:
+            self.graph.node(node_id, defined=bool(graph.defined[graph.index[node_id]]))
+        self._grow()
+        if removed:
+            for source, target in removed:
+                self.graph.remove_edge(source, target)
+            for source, target in added:
+                self.graph.add_edge(source, target)
+            self.rebuild()
+        else:
+            for source, target in added:
+                self.add_edge(source, target)
+        return len(added), len(removed)
+
+    def _mask(self, kinds: Optional[Iterable[str]]) -> int:
+        if kinds is None:
+            return -1
+        mask = 0
+        for kind in kinds:
+            if kind not in self._kind_masks:
+                self._kind_masks[kind] = sum(1 << number for number in self.graph.nodes_of(kind, defined_only=False))
+            mask |= self._kind_masks[kind]
+        return mask
+
+    def _query(self, closures: List[int], node_id: str, kinds: Optional[Iterable[str]]) -> List[str]:
+        number = self.graph.index.get(node_id)
+        if number is None:
+            raise KeyError(f"추적성 그래프에 없는 ID입니다: {node_id}")
+        bits = closures[number] & ~(1 << number) & self._mask(kinds)
+        return [self.graph.ids[target] for target in iter_bits(bits)]
+
+    def affected_by(self, node_id: str, kinds: Optional[Iterable[str]] = None) -> List[str]:
+        """node_id가 바뀌면 영향받는 (node_id에 직간접 의존하는) ID (노드 번호 순)"""
+        return self._query(self.ancestors, node_id, kinds)
+
+    def depends_on(self, node_id: str, kinds: Optional[Iterable[str]] = None) -> List[str]:
+        """node_id가 직간접으로 의존하는 ID (노드 번호 순)"""
+        return self._query(self.descendants, node_id, kinds)
+
+
+def build_graph(registries: Dict[str, Dict], mappings: Dict[str, Dict],
+                scopes: Optional[Dict[str, List[str]]] = None) -> TraceGraph:
+    """추적성 그래프 + 결정 영향 범위 간선 (범위의 ID → Decision)"""
+    graph = TraceGraph.from_prd(registries, mappings)
+    for decision_id, scope in (scopes or {}).items():
+        for ref_id in scope:
+            graph.add_edge(ref_id, decision_id)
+    return graph
+
+
+def group_by_kind(ids: Iterable[str]) -> Dict[str, List[str]]:
+    """ID를 종류별로 묶음 (KINDS 순서)"""
+    groups: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+    for node_id in ids:
+        groups[kind_of(node_id)].append(node_id)
+    return {kind: ids for kind, ids in groups.items() if ids}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PRD 변경 영향 분석')
+    parser.add_argument('ids', nargs='+', help='조회할 ID (예: ENT-01, API-0101, FUNC-05)')
+    parser.add_argument('--prd', default='PRD_Phase1_2025-12-31.md', help='PRD 마크다운 경로')
+    parser.add_argument('--depends', action='store_true', help='영향받는 항목 대신 의존 대상 조회')
+    parser.add_argument('--kind', action='append', choices=KINDS, help='결과 종류 제한 (여러 번 지정 가능)')
+    parser.add_argument('--json', dest='json_path', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.prd):
+        print(f"파일을 찾을 수 없습니다: {args.prd}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    validator = PRDDeepValidator(args.prd, '')
+    validator.parse_prd()
+    index = ImpactIndex.from_validator(validator)
+    print(f"추적성 그래프: 노드 {len(index.graph)}개, 간선 {len(index.graph.edges())}개 "
+          f"({time.perf_counter() - started:.2f}초)")
+
+    results = {}
+    missing = []
+    for node_id in args.ids:
+        try:
+            started = time.perf_counter()
+            if args.depends:
+                found = index.depends_on(node_id, args.kind)
+            else:
+                found = index.affected_by(node_id, args.kind)
+            elapsed = (time.perf_counter() - started) * 1e6
+        except KeyError:
+            print(f"\n{node_id}: 추적성 그래프에 없는 ID입니다")
+            missing.append(node_id)
+            continue
+        groups = group_by_kind(found)
+        results[node_id] = groups
+        title = '의존 대상' if args.depends else '변경 영향'
+        print(f"\n{node_id} {title}: {len(found)}개 ({elapsed:.0f}µs)")
+        for kind, ids in groups.items():
+            print(f"  - {KIND_LABELS[kind]} {len(ids)}개: {', '.join(ids)}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+열 단위 이슈 저장소
+- 이슈마다 객체를 두지 않고 열(column)별 배열에 보관
+  - 심각도/분류: 작은 정수 코드 (array 'B'/'H') + 값 표
+  - 규칙명/위치/영향 ID: 반복이 많아 공유 문자열 표에 한 번만 저장하고 코드(array 'I')로 참조
+  - 영향 ID: 모든 이슈의 ID 코드를 한 배열에 이어 붙이고 이슈별 시작 위치(offsets)로 구분
+  - 설명/권장 수정: 이슈마다 다른 문장이 대부분이라 열마다 UTF-8 바이트 하나에 이어 붙이고 offsets로 구분
+    (문자열 객체/사전 항목을 만들지 않음, 읽을 때 디코딩)
+- 심각도/분류별 묶기·세기는 코드 배열 한 번 순회
+- 목록처럼 append/extend/len/반복/인덱싱/슬라이스 지원, 읽을 때만 factory(기본: IssueRow)로 이슈 객체 생성
+
+사용법
+    store = IssueStore(Issue)
+    store.add(Severity.HIGH, "API 논리", "동일 엔드포인트/메서드 중복", "...", "API Registry", ['API-0101'], "...")
+    store.count_by('severity')      # {Severity.HIGH: 1}
+    store.rows_by('category')       # {'API 논리': array('I', [0])}
+    store[0]                        # Issue(severity=<Severity.HIGH: 'High'>, ...)
+"""
+
+from array import array
+from collections import namedtuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+IssueRow = namedtuple('IssueRow', 'severity category rule description location affected_ids recommendation')
+
+FIELDS = IssueRow._fields
+# 값 표로 코드화하는 열과 코드 배열 형식
+_CODED_COLUMNS = {'severity': 'B', 'category': 'H'}
+# 공유 문자열 표를 참조하는 열
+_STRING_COLUMNS = ('rule', 'location')
+# UTF-8 바이트로 이어 붙이는 열
+_TEXT_COLUMNS = ('description', 'recommendation')
+
+
+class IssueStore:
+    def __init__(self, factory: Optional[Callable[..., Any]] = None):
+        self.factory = factory or IssueRow
+        self.values: Dict[str, List[Hashable]] = {name: [] for name in _CODED_COLUMNS}   # 열 → 코드별 값
+        self._value_codes: Dict[str, Dict[Hashable, int]] = {name: {} for name in _CODED_COLUMNS}
+        self.codes: Dict[str, array] = {name: array(typecode) for name, typecode in _CODED_COLUMNS.items()}
+        self.strings: List[str] = []                 # 공유 문자열 표
+        self._string_codes: Dict[str, int] = {}
+        self.string_columns: Dict[str, array] = {name: array('I') for name in _STRING_COLUMNS}
+        self.affected = array('I')                   # 모든 이슈의 영향 ID 문자열 코드
+        self.affected_offsets = array('I', [0])
+        self.texts: Dict[str, bytearray] = {name: bytearray() for name in _TEXT_COLUMNS}
+        self.text_offsets: Dict[str, array] = {name: array('I', [0]) for name in _TEXT_COLUMNS}
+
+    def _intern(self, text: str) -> int:
+        code = self._string_codes.get(text)
+        if code is None:
+            code = self._string_codes[text] = len(self.strings)
+            self.strings.append(text)
+        return code
+
+    def _code(self, column: str, value: Hashable) -> int:
+        codes = self._value_codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.values[column])
+            self.values[column].append(value)
+        return code
+
+    def add(self, severity: Hashable, category: str, rule: str, description: str, location: str = "",
+            affected_ids: Iterable[str] = (), recommendation: str = "") -> int:
+        """이슈 한 건 추가 (행 번호 반환)"""
+        self.codes['severity'].append(self._code('severity', severity))
+        self.codes['category'].append(self._code('category', category))
+        self.string_columns['rule'].append(self._intern(rule))
+        self.string_columns['location'].append(self._intern(location))
+        self.affected.extend(self._intern(node_id) for node_id in affected_ids)
+        self.affected_offsets.append(len(self.affected))
+        for name, text in (('description', description), ('recommendation', recommendation)):
+            blob = self.texts[name]
+            blob += text.encode('utf-8')
+            self.text_offsets[name].append(len(blob))
+        return len(self) - 1
+
+    def append(self, issue: Any):
+        """이슈 객체(Issue 등 같은 이름의 속성을 가진 객체)를 열로 나누어 추가"""
+        self.add(*(getattr(issue, name) for name in FIELDS))
+
+    def extend(self, issues: Iterable[Any]):
+        if isinstance(issues, IssueStore):
+            for row in range(len(issues)):
+                self.add(*issues.fields(row))
+        else:
+            for issue in issues:
+                self.append(issue)
+
+    def __len__(self) -> int:
+        return len(self.codes['severity'])
+
+    def field(self, row: int, name: str) -> Any:
+        """한 행의 열 값 (이슈 객체를 만들지 않음)"""
+        if name in _CODED_COLUMNS:
+            return self.values[name][self.codes[name][row]]
+        if name in _STRING_COLUMNS:
+            return self.strings[self.string_columns[name][row]]
+        if name == 'affected_ids':
+            start, end = self.affected_offsets[row], self.affected_offsets[row + 1]
+            return [self.strings[code] for code in self.affected[start:end]]
+        if name in _TEXT_COLUMNS:
+            offsets = self.text_offsets[name]
+            return self.texts[name][offsets[row]:offsets[row + 1]].decode('utf-8')
+        raise KeyError(name)
+
+    def fields(self, row: int) -> Tuple[Any, ...]:
+        return tuple(self.field(row, name) for name in FIELDS)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.subset(range(len(self))[key])
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(key)
+        return self.factory(*self.fields(key))
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in range(len(self)):
+            yield self.factory(*self.fields(row))
+
+    def subset(self, rows: Iterable[int]) -> 'IssueStore':
+        """지정한 행만 담은 새 저장소 (행 순서 유지)"""
+        store = IssueStore(self.factory)
+        for row in rows:
+            store.add(*self.fields(row))
+        return store
+
+    def rows(self, rows: Iterable[int]) -> List[Any]:
+        """지정한 행의 이슈 객체 목록"""
+        return [self.factory(*self.fields(row)) for row in rows]
+
+    def rows_by(self, column: str, rows: Optional[Sequence[int]] = None) -> Dict[Hashable, array]:
+        """심각도/분류 값 → 행 번호 배열 (값은 처음 나온 순서)"""
+        codes = self.codes[column]
+        grouped: Dict[int, array] = {}
+        for row in (range(len(codes)) if rows is None else rows):
+            code = codes[row]
+            bucket = grouped.get(code)
+            if bucket is None:
+                bucket = grouped[code] = array('I')
+            bucket.append(row)
+        values = self.values[column]
+        return {values[code]: bucket for code, bucket in grouped.items()}
+
+    def count_by(self, column: str, rows: Optional[Sequence[int]] = None) -> Dict[Hashable, int]:
+        """심각도/분류 값 → 건수"""
+        codes = self.codes[column]
+        counts = [0] * len(self.values[column])
+        for code in (codes if rows is None else (codes[row] for row in rows)):
+            counts[code] += 1
+        return {value: count for value, count in zip(self.values[column], counts) if count}
+
+    def select(self, column: str, *values: Hashable, rows: Optional[Sequence[int]] = None) -> array:
+        """열 값이 values 중 하나인 행 번호 (원래 순서)"""
+        value_codes = self._value_codes[column]
+        wanted = {value_codes[value] for value in values if value in value_codes}
+        codes = self.codes[column]
+        candidates = range(len(codes)) if rows is None else rows
+        return array('I', (row for row in candidates if codes[row] in wanted))
+
+    def nbytes(self) -> int:
+        """열 배열과 문자열 표가 차지하는 대략의 바이트 수"""
+        arrays = (list(self.codes.values()) + list(self.string_columns.values()) + list(self.text_offsets.values())
+                  + [self.affected, self.affected_offsets])
+        size = sum(len(column) * column.itemsize for column in arrays) + sum(len(blob) for blob in self.texts.values())
+        return size + sum(len(text.encode('utf-8')) for text in self.strings)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IA/SPM 항목 열 단위 바이너리 스냅샷
+- 파싱한 항목 목록(ia_items, spm_items …)을 열 단위로 저장: 공유 문자열 테이블 + 열별 uint32 인덱스 배열
+- 읽을 때는 파일을 mmap하여 인덱스 배열을 복사 없이 사용하고, 문자열은 실제로 조회할 때만 디코딩
+- 원본 파일(output.json)의 내용 해시(prd_cache.file_digest)를 기록하여 원본 내용이 바뀌면 다시 만듦
+- load_items는 열 단위 표를 그대로 돌려주고 행은 SnapshotRow 뷰로 읽음 (dict는 필요한 호출 지점에서만 생성)
+
+파일 구조 (정수는 리틀 엔디언, 각 구획은 4바이트 정렬)
+    MAGIC(8) | 헤더 길이(uint32) | 헤더(JSON) | 문자열 오프셋(uint32 × (N+1)) | 문자열 바이트 | 열 인덱스 배열 …
+
+사용법
+    write_snapshot('output_json_extracted.prdsnap', {'ia_items': ia_items, 'spm_items': spm_items}, source='output.json')
+    with load_items('output.json', extract_items) as tables:
+        for item in tables['ia_items']:      # 행 뷰: 열 값은 조회할 때만 디코딩
+            item['func_id']
+        ia_items = [dict(item) for item in tables['ia_items']]  # dict 목록이 꼭 필요할 때만 전체 디코딩
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from prd_cache import file_digest
+
+MAGIC = b'PRDSNAP1'
+FORMAT_VERSION = 2
+MISSING = 0xFFFFFFFF  # 항목에 해당 키가 없음
+SNAPSHOT_SUFFIX = '.prdsnap'
+
+_HEADER_LENGTH = struct.Struct('<I')
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % 4)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _source_signature(path: Optional[str]) -> Optional[str]:
+    """원본 파일 내용 해시 (읽을 수 없으면 None)"""
+    if not path:
+        return None
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+class _StringTableBuilder:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.offsets = array('I', [0])
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, text: str) -> int:
+        position = self.index.get(text)
+        if position is None:
+            data = text.encode('utf-8')
+            self.chunks.append(data)
+            self.size += len(data)
+            self.offsets.append(self.size)
+            position = self.index[text] = len(self.index)
+        return position
+
+
+def write_snapshot(path: str, tables: Dict[str, List[Dict[str, Any]]], source: Optional[str] = None):
+    """
+    항목 목록들을 스냅샷으로 저장 (임시 파일 기록 후 원자적으로 교체)
+    - 문자열이 아닌 값이 섞인 열은 열 전체를 JSON 문자열로 저장
+    """
+    strings = _StringTableBuilder()
+    header_tables = {}
+    column_arrays: List[array] = []
+
+    for table_name, items in tables.items():
+        columns: List[str] = []
+        for item in items:
+            for key in item:
+                if key not in columns:
+                    columns.append(key)
+
+        column_meta = []
+        for column in columns:
+            encoded = any(column in item and not isinstance(item[column], str) for item in items)
+            indexes = array('I')
+            for item in items:
+                if column not in item:
+                    indexes.append(MISSING)
+                    continue
+                value = item[column]
+                indexes.append(strings.add(json.dumps(value, ensure_ascii=False) if encoded else value))
+            column_meta.append({'name': column, 'json': encoded})
+            column_arrays.append(indexes)
+        header_tables[table_name] = {'rows': len(items), 'columns': column_meta}
+
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'source': _source_signature(source),
+        'strings': len(strings.index),
+        'string_bytes': strings.size,
+        'tables': header_tables,
+    }, ensure_ascii=False).encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=SNAPSHOT_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            preamble = MAGIC + _HEADER_LENGTH.pack(len(header)) + header
+            f.write(preamble + _padding(len(preamble)))
+            f.write(_little_endian(strings.offsets))
+            blob = b''.join(strings.chunks)
+            f.write(blob + _padding(len(blob)))
+            for indexes in column_arrays:
+                f.write(_little_endian(indexes))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SnapshotRow(Mapping):
+    """스냅샷 표의 행 하나 (dict처럼 조회, 열 값은 조회할 때만 디코딩)"""
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: 'SnapshotTable', row: int):
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, column: str) -> Any:
+        indexes = self.table.indexes.get(column)
+        if indexes is None or indexes[self.row] == MISSING:
+            raise KeyError(column)
+        return self.table.value(column, self.row)
+
+    def __iter__(self) -> Iterator[str]:
+        return (column for column in self.table.columns if self.table.indexes[column][self.row] != MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SnapshotRow({self.table.name!r}, {self.row})"
+
+
+class SnapshotTable:
+    """
+    스냅샷의 항목 목록 하나 (열별 인덱스 배열은 mmap 위의 memoryview)
+    - 인덱싱/반복은 행 뷰(SnapshotRow)를 돌려주므로 항목 전체를 dict로 만들지 않음
+    """
+
+    def __init__(self, snapshot: 'Snapshot', name: str, rows: int, columns: List[Dict[str, Any]],
+                 indexes: Dict[str, Any]):
+        self.snapshot = snapshot
+        self.name = name
+        self.rows = rows
+        self.columns = [column['name'] for column in columns]
+        self.json_columns = {column['name'] for column in columns if column['json']}
+        self.indexes = indexes
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def value(self, column: str, row: int, default: Any = None) -> Any:
+        position = self.indexes[column][row]
+        if position == MISSING:
+            return default
+        text = self.snapshot.string(position)
+        return json.loads(text) if column in self.json_columns else text
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[SnapshotRow, List[SnapshotRow]]:
+        if isinstance(key, slice):
+            return [SnapshotRow(self, row) for row in range(self.rows)[key]]
+        if key < 0:
+            key += self.rows
+        if not 0 <= key < self.rows:
+            raise IndexError(key)
+        return SnapshotRow(self, key)
+
+    def __iter__(self) -> Iterator[SnapshotRow]:
+        for row in range(self.rows):
+            yield SnapshotRow(self, row)
+
+
+class Snapshot:
+    """mmap으로 연 스냅샷 (close 또는 with 문으로 해제)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap할 수 없음
+            self._file.close()
+            raise ValueError(f"스냅샷 형식이 아닙니다: {path}")
+        self._view = memoryview(self._map)
+        self._views: List[memoryview] = []
+        self._decoded: Dict[int, str] = {}
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _words(self, offset: int, count: int):
+        """offset부터 uint32 count개 (리틀 엔디언 환경에서는 복사 없이 cast)"""
+        raw = self._view[offset:offset + count * 4]
+        if len(raw) != count * 4:
+            raise ValueError(f"스냅샷이 잘렸습니다: {self.path}")
+        if sys.byteorder == 'little':
+            words = raw.cast('I')
+            self._views.extend((words, raw))
+            return words
+        values = array('I', raw.tobytes())
+        raw.release()
+        values.byteswap()
+        return values
+
+    def _parse(self):
+        if self._view[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"스냅샷 형식이 아닙니다: {self.path}")
+        offset = len(MAGIC)
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._map, offset)
+        offset += _HEADER_LENGTH.size
+        self.header = json.loads(bytes(self._view[offset:offset + header_length]).decode('utf-8'))
+        if self.header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {self.header.get('version')}")
+        offset += header_length
+        offset += -offset % 4
+
+        string_count = self.header['strings']
+        self._string_offsets = self._words(offset, string_count + 1)
+        offset += (string_count + 1) * 4
+        self._string_base = offset
+        offset += self.header['string_bytes']
+        offset += -offset % 4
+
+        self.tables: Dict[str, SnapshotTable] = {}
+        for name, meta in self.header['tables'].items():
+            indexes = {}
+            for column in meta['columns']:
+                indexes[column['name']] = self._words(offset, meta['rows'])
+                offset += meta['rows'] * 4
+            self.tables[name] = SnapshotTable(self, name, meta['rows'], meta['columns'], indexes)
+
+    def string(self, position: int) -> str:
+        text = self._decoded.get(position)
+        if text is None:
+            start = self._string_base + self._string_offsets[position]
+            end = self._string_base + self._string_offsets[position + 1]
+            text = self._decoded[position] = str(self._map[start:end], 'utf-8')
+        return text
+
+    def is_fresh(self, source: str) -> bool:
+        """원본 파일 내용이 스냅샷을 만들 때와 같은지"""
+        recorded = self.header.get('source')
+        return recorded is not None and recorded == _source_signature(source)
+
+    def __getitem__(self, name: str) -> SnapshotTable:
+        return self.tables[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
+
+    def close(self):
+        # memoryview 파생 객체(열 인덱스)를 먼저 놓아야 mmap을 닫을 수 있음
+        self.tables = {}
+        self._string_offsets = None
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_snapshot(path: str) -> Snapshot:
+    return Snapshot(path)
+
+
+def snapshot_path_for(source: str) -> str:
+    """원본 옆 기본 스냅샷 경로 (output.json → output.prdsnap)"""
+    return os.path.splitext(source)[0] + SNAPSHOT_SUFFIX
+
+
+class BuiltTables(dict):
+    """스냅샷을 저장하지 못했을 때 파싱 결과를 Snapshot과 같은 방식(표 이름 조회, with 문)으로 쓰기 위한 dict"""
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> 'BuiltTables':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+def load_items(source: str, build: Callable[[str], Dict[str, List[Dict[str, Any]]]],
+               snapshot_path: Optional[str] = None) -> Union[Snapshot, BuiltTables]:
+    """
+    원본과 같은 스냅샷을 열어 반환하고, 없거나 오래되었으면 build(source)로 파싱해 스냅샷을 저장한 뒤 엶
+    - 반환값의 표(snapshot['ia_items'])는 열 단위 그대로이며 행은 읽을 때만 디코딩 (with 문으로 닫기)
+    - 스냅샷을 저장할 수 없으면 파싱한 dict 목록을 BuiltTables로 반환
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source)
+    try:
+        snapshot = open_snapshot(snapshot_path)
+    except (OSError, ValueError, KeyError, struct.error):
+        snapshot = None
+    if snapshot is not None:
+        if snapshot.is_fresh(source):
+            return snapshot
+        snapshot.close()
+
+    tables = build(source)
+    try:
+        write_snapshot(snapshot_path, tables, source=source)
+        return open_snapshot(snapshot_path)
+    except (OSError, ValueError):
+        return BuiltTables(tables)
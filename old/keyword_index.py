@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 레지스트리 키워드 역색인
+- 레지스트리(Function/Decision)마다 한 번 구축: 키워드 → 소유 ID 목록
+- 텍스트에 들어 있는 키워드 찾기: 텍스트의 위치마다 그 위치에서 시작하는 문자 bigram의 키워드 목록만 확인
+- 매칭은 기존 규칙과 같은 부분 문자열 기준이며, 결과는 참/거짓 대신 점수순 후보 ID 목록
+
+사용법
+    index = KeywordIndex.from_registry(registries['functions'], lambda owner, data: data.get('name', '').split())
+    candidates = index.rank(ia_item['func_definition'])  # [Candidate(id='FUNC-01', score=..., keywords=(...)), ...]
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Candidate:
+    id: str
+    score: float
+    keywords: Tuple[str, ...]
+
+
+class KeywordIndex:
+    def __init__(self, normalize: Optional[Callable[[str], str]] = None):
+        self.normalize = normalize or (lambda text: text)
+        self.owners: Dict[str, List[str]] = {}                          # 키워드 → 소유 ID (등록 순서)
+        self.order: Dict[str, int] = {}                                 # 소유 ID → 등록 순번
+        self._starts: Dict[str, List[str]] = defaultdict(list)          # 첫 bigram(한 글자 키워드는 그 글자) → 키워드
+
+    @classmethod
+    def from_registry(cls, registry: Dict[str, Dict], keywords: Callable[[str, Dict], Iterable[str]],
+                      normalize: Optional[Callable[[str], str]] = None) -> 'KeywordIndex':
+        """레지스트리의 각 ID에 keywords(ID, 데이터)로 얻은 키워드 등록"""
+        index = cls(normalize)
+        for owner, data in registry.items():
+            index.add_owner(owner)
+            for keyword in keywords(owner, data):
+                index.add(keyword, owner)
+        return index
+
+    def add_owner(self, owner: str):
+        self.order.setdefault(owner, len(self.order))
+
+    def add(self, keyword: str, owner: str):
+        keyword = self.normalize(keyword)
+        if not keyword:
+            return
+        self.add_owner(owner)
+        owners = self.owners.get(keyword)
+        if owners is None:
+            owners = self.owners[keyword] = []
+            self._starts[keyword[:2]].append(keyword)
+        if owner not in owners:
+            owners.append(owner)
+
+    def contained_in(self, text: str) -> List[str]:
+        """text 안에 부분 문자열로 나타나는 키워드 (처음 나타나는 위치 순서)"""
+        text = self.normalize(text)
+        found = []
+        seen = set()
+        for i in range(len(text)):
+            for gram in (text[i], text[i:i + 2]) if i + 1 < len(text) else (text[i],):
+                for keyword in self._starts.get(gram, ()):
+                    if keyword not in seen and text.startswith(keyword, i):
+                        seen.add(keyword)
+                        found.append(keyword)
+        return found
+
+    def rank(self, text: str) -> List[Candidate]:
+        """
+        text에 키워드가 나타나는 소유 ID를 점수순으로 반환
+        - 점수: 일치한 키워드마다 길이 × IDF(드문 키워드일수록 큼)의 합
+        """
+        matched: Dict[str, List[str]] = defaultdict(list)
+        for keyword in self.contained_in(text):
+            for owner in self.owners[keyword]:
+                matched[owner].append(keyword)
+
+        total = len(self.order) or 1
+        candidates = []
+        for owner, keywords in matched.items():
+            score = sum(len(keyword) * math.log(1 + total / len(self.owners[keyword])) for keyword in keywords)
+            candidates.append(Candidate(owner, round(score, 6), tuple(keywords)))
+        candidates.sort(key=lambda candidate: (-candidate.score, self.order[candidate.id]))
+        return candidates
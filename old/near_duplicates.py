@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+MinHash/LSH 유사 중복 탐지
+- 문서마다 문자 3-gram shingle 집합의 MinHash 서명(기본 64개 해시)을 만듦
+- 서명을 밴드(기본 16개 × 4행)로 나누어 같은 밴드 값을 가진 문서끼리만 후보 쌍으로 봄 (전체 쌍 비교 없음)
+- 후보 쌍은 shingle 집합의 실제 Jaccard 유사도로 확인하고, 기준 이상인 쌍을 union-find로 묶어 군집 반환
+- 해시는 blake2b 기반이라 실행마다 같은 결과 (PYTHONHASHSEED 영향 없음)
+
+사용법
+    detector = NearDuplicateDetector(threshold=0.8)
+    detector.add('IA:Seller-ia-front-join-01', '로그인 및 계정 식별에 사용할 이메일 주소를 입력한다.')
+    clusters = detector.clusters()  # [DuplicateCluster(keys=[...], similarity=0.85), ...]
+"""
+
+import hashlib
+import random
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple
+
+from ngram_similarity import char_ngrams
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+MIN_SHINGLES = 4  # 이보다 짧은 문서는 우연히 겹치기 쉬워 제외
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+@dataclass
+class DuplicateCluster:
+    keys: List[str]
+    similarity: float  # 군집 안 확인된 쌍의 최소 Jaccard 유사도
+
+
+def shingles(text: str) -> FrozenSet[str]:
+    return frozenset(char_ngrams(text, (SHINGLE_SIZE, SHINGLE_SIZE)))
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """(a·x + b) mod p 순열 num_perm개로 MinHash 서명 계산 (계수는 고정 시드)"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        generator = random.Random(seed)
+        self.permutations = [
+            (generator.randrange(1, _MERSENNE_PRIME), generator.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: FrozenSet[str]) -> Tuple[int, ...]:
+        hashes = [_shingle_hash(shingle) for shingle in shingle_set]
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+            for a, b in self.permutations
+        )
+
+
+class NearDuplicateDetector:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                 bands: int = DEFAULT_BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.shingle_sets: Dict[str, FrozenSet[str]] = {}
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+
+    def add(self, key: str, text: str) -> bool:
+        """문서 등록 (너무 짧으면 등록하지 않고 False)"""
+        shingle_set = shingles(text)
+        if len(shingle_set) < MIN_SHINGLES:
+            return False
+        self.shingle_sets[key] = shingle_set
+        signature = self.hasher.signature(shingle_set)
+        for band in range(self.bands):
+            self.buckets[(band, signature[band * self.rows:(band + 1) * self.rows])].append(key)
+        return True
+
+    def candidate_pairs(self) -> List[Tuple[str, str]]:
+        """같은 밴드 버킷을 공유하는 문서 쌍 (등록 순서)"""
+        order = {key: index for index, key in enumerate(self.shingle_sets)}
+        pairs = set()
+        for keys in self.buckets.values():
+            for i in range(len(keys)):
+                for j in range(i + 1, len(keys)):
+                    pair = (keys[i], keys[j]) if order[keys[i]] < order[keys[j]] else (keys[j], keys[i])
+                    pairs.add(pair)
+        return sorted(pairs, key=lambda pair: (order[pair[0]], order[pair[1]]))
+
+    def clusters(self) -> List[DuplicateCluster]:
+        """Jaccard 유사도가 기준 이상인 쌍을 묶은 군집 (군집 안은 등록 순서, 군집은 첫 문서 순서)"""
+        parent: Dict[str, str] = {}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        similarities: Dict[str, float] = {}
+        for a, b in self.candidate_pairs():
+            similarity = jaccard(self.shingle_sets[a], self.shingle_sets[b])
+            if similarity < self.threshold:
+                continue
+            parent.setdefault(a, a)
+            parent.setdefault(b, b)
+            root_a, root_b = find(a), find(b)
+            lowest = min(similarity, similarities.get(root_a, 1.0), similarities.get(root_b, 1.0))
+            if root_a != root_b:
+                parent[root_b] = root_a
+            similarities[root_a] = lowest
+
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for key in self.shingle_sets:
+            if key in parent:
+                groups[find(key)].append(key)
+        return [
+            DuplicateCluster(keys=keys, similarity=round(similarities[find(keys[0])], 4))
+            for keys in groups.values() if len(keys) > 1
+        ]
+
+
+def find_near_duplicates(documents: Dict[str, str], threshold: float = DEFAULT_THRESHOLD,
+                         num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS) -> List[DuplicateCluster]:
+    detector = NearDuplicateDetector(threshold, num_perm, bands)
+    for key, text in documents.items():
+        detector.add(key, text)
+    return detector.clusters()
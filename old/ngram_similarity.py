@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+문자 n-gram TF-IDF 유사도
+- 띄어쓰기/조사에 덜 민감하도록 단어가 아니라 문자 n-gram(기본 2~3글자)으로 벡터화
+- 문서 벡터는 {n-gram 번호: 가중치} 희소 벡터 (sublinear TF × smooth IDF, L2 정규화)
+- 유사도 행렬은 후보 문서 쪽 역색인(n-gram → (문서, 가중치) 게시 목록)으로 0이 아닌 항만 누적하여 계산
+  (희소 행렬 곱과 같은 연산, 비용은 공유 n-gram 수에 비례)
+- 질의마다 점수 상위 k개 후보 반환
+
+사용법
+    index = SimilarityIndex({'FUNC-01': '딜러 회원가입 계정 생성', ...})
+    index.top_k('로그인 및 계정 식별에 사용할 이메일 주소를 입력한다', k=3)  # [Match(id='FUNC-01', score=0.21), ...]
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_NGRAM_RANGE = (2, 3)
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+SparseVector = Dict[int, float]
+
+
+@dataclass(frozen=True)
+class Match:
+    id: str
+    score: float
+
+
+def normalize_text(text: str) -> str:
+    """소문자화 후 기호/공백 연속을 공백 하나로 (단어 경계는 n-gram에 남김)"""
+    return _NON_WORD.sub(' ', text.lower()).strip()
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE) -> List[str]:
+    """단어 앞뒤에 공백을 붙인 뒤 문자 n-gram 추출 (공백만으로 된 n-gram 제외)"""
+    text = f' {normalize_text(text)} '
+    low, high = ngram_range
+    grams = []
+    for n in range(low, high + 1):
+        for i in range(len(text) - n + 1):
+            gram = text[i:i + n]
+            if gram.strip():
+                grams.append(gram)
+    return grams
+
+
+class NgramVectorizer:
+    """문자 n-gram TF-IDF 벡터화 (어휘/IDF는 fit한 문서 집합 기준)"""
+
+    def __init__(self, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE):
+        self.ngram_range = ngram_range
+        self.vocabulary: Dict[str, int] = {}
+        self.idf: List[float] = []
+
+    def fit(self, documents: Iterable[str]) -> 'NgramVectorizer':
+        document_frequency: Counter = Counter()
+        count = 0
+        for document in documents:
+            count += 1
+            document_frequency.update(set(char_ngrams(document, self.ngram_range)))
+        self.vocabulary = {gram: index for index, gram in enumerate(sorted(document_frequency))}
+        self.idf = [0.0] * len(self.vocabulary)
+        for gram, index in self.vocabulary.items():
+            self.idf[index] = math.log((1 + count) / (1 + document_frequency[gram])) + 1
+        return self
+
+    def transform_one(self, document: str) -> SparseVector:
+        counts = Counter(char_ngrams(document, self.ngram_range))
+        vector = {}
+        for gram, count in counts.items():
+            index = self.vocabulary.get(gram)
+            if index is not None:
+                vector[index] = (1 + math.log(count)) * self.idf[index]
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if norm:
+            for index in vector:
+                vector[index] /= norm
+        return vector
+
+    def transform(self, documents: Iterable[str]) -> List[SparseVector]:
+        return [self.transform_one(document) for document in documents]
+
+
+class SimilarityIndex:
+    """
+    후보 문서(PRD Function/Decision …)의 TF-IDF 역색인
+    - fit_documents: IDF를 계산할 추가 문서(질의 쪽 문서 포함 시 양쪽 어휘가 같은 기준으로 가중됨)
+    """
+
+    def __init__(self, candidates: Dict[str, str], fit_documents: Optional[Iterable[str]] = None,
+                 ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE):
+        self.ids = list(candidates)
+        texts = list(candidates.values())
+        self.vectorizer = NgramVectorizer(ngram_range).fit(texts + list(fit_documents or []))
+        self.postings: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+        for position, vector in enumerate(self.vectorizer.transform(texts)):
+            for index, weight in vector.items():
+                self.postings[index].append((position, weight))
+
+    def scores(self, text: str) -> Dict[int, float]:
+        """질의와 코사인 유사도가 0보다 큰 후보 {후보 순번: 점수}"""
+        scores: Dict[int, float] = defaultdict(float)
+        for index, weight in self.vectorizer.transform_one(text).items():
+            for position, candidate_weight in self.postings.get(index, ()):
+                scores[position] += weight * candidate_weight
+        return scores
+
+    def top_k(self, text: str, k: int = 3, min_score: float = 0.0) -> List[Match]:
+        """점수 상위 k개 후보 (동점이면 후보 등록 순서)"""
+        scores = self.scores(text)
+        best = heapq.nsmallest(k, ((-score, position) for position, score in scores.items() if score > min_score))
+        return [Match(self.ids[position], round(-score, 4)) for score, position in best]
+
+    def top_k_matrix(self, queries: Dict[str, str], k: int = 3, min_score: float = 0.0) -> Dict[str, List[Match]]:
+        """질의 전체 × 후보 전체 유사도 행렬에서 질의별 상위 k개"""
+        return {query_id: self.top_k(text, k, min_score) for query_id, text in queries.items()}
@@ -5,93 +5,57 @@ output.json 파싱 스크립트
 IA 1.0 및 SPM 1.0 시트의 모든 항목 추출
 """
 
-import json
 import re
 from collections import defaultdict
 
+from prd_cache import cached_parse
+from sheet_loader import IA_SHEET, SPM_SHEET, load_sheet_tables
+from sheet_schema import detect_from_rows
+
 def parse_output_json(file_path):
-    """output.json 파일을 파싱하여 IA 및 SPM 데이터 추출"""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    """output.json(또는 원본 .xlsx) 파일을 파싱하여 IA 및 SPM 데이터 추출"""
     
-    # 시트 찾기
-    ia_sheet = None
-    spm_sheet = None
+    # IA/SPM 시트만 한 번의 스트리밍 읽기로 열 단위 적재 (항상 빈 열은 제거)
+    sheets = load_sheet_tables(file_path, [IA_SHEET, SPM_SHEET])
     
-    for sheet in data['sheets']:
-        if sheet['name'] == 'IA 1.0':
-            ia_sheet = sheet
-        elif sheet['name'] == 'SPM 1.0':
-            spm_sheet = sheet
-    
-    if not ia_sheet:
+    if IA_SHEET not in sheets:
         raise ValueError("IA 1.0 시트를 찾을 수 없습니다")
-    if not spm_sheet:
+    if SPM_SHEET not in sheets:
         raise ValueError("SPM 1.0 시트를 찾을 수 없습니다")
     
-    # IA 1.0 파싱
+    # IA 1.0 파싱 (ID 열/의미 열은 시트마다 한 번만 감지, 원본 엑셀의 ID 열 이름도 허용)
     ia_items = []
-    for row in ia_sheet['data']:
-        # 필수 필드 확인
-        if 'System.Xml.XmlElement' in row and row['System.Xml.XmlElement']:
-            func_id = row['System.Xml.XmlElement']
-            # Seller-ia-front- 형식인지 확인
-            if func_id.startswith('Seller-ia-front-'):
-                item = {
-                    'func_id': func_id,
-                    'screen_id': row.get('화면 ID', ''),
-                    'func_definition': row.get('기능 정의', ''),
-                    'category': row.get('카테고리', ''),
-                    'depth1': row.get('Depth 1', ''),
-                    'depth2': row.get('Depth 2', ''),
-                    'depth3': row.get('Depth 3', ''),
-                    'policy_id': row.get('관련 정책 ID', ''),
-                    'importance': row.get('중요도', ''),
-                    'implementation_target': row.get('구현 대상', ''),
-                    'empty_fields': []
-                }
-                
-                # 빈 필드 체크
-                for key, value in row.items():
-                    if value == '' or value == [] or (isinstance(value, list) and len(value) == 0):
-                        item['empty_fields'].append(key)
-                
-                ia_items.append(item)
+    schema, rows = detect_from_rows(file_path, IA_SHEET, sheets[IA_SHEET].rows())
+    for row in rows:
+        item = schema.extract(row)
+        if item is not None:
+            # 빈 필드 (적재 시 계산된 행별 정보 사용)
+            item['empty_fields'] = row.empty_fields()
+            ia_items.append(item)
     
     # SPM 1.0 파싱
     spm_items = []
-    for row in spm_sheet['data']:
-        # 정책 ID 찾기 (System.Xml.XmlElement 필드에 있을 것으로 예상)
-        policy_id = None
-        policy_content = None
-        
-        # System.Xml.XmlElement 필드에서 정책 ID 찾기
-        if 'System.Xml.XmlElement' in row:
-            value = row['System.Xml.XmlElement']
-            if isinstance(value, str) and value.startswith('dealer-sp-'):
-                policy_id = value
+    schema, rows = detect_from_rows(file_path, SPM_SHEET, sheets[SPM_SHEET].rows())
+    for row in rows:
+        policy_id = schema.row_id(row)
+        if not policy_id:
+            continue
         
         # 정책 내용 찾기 (다양한 필드명 시도)
+        policy_content = None
         for key in ['정책 내용', '정책', '내용', 'Policy', 'Content']:
             if key in row and row[key]:
                 policy_content = row[key]
                 break
         
-        if policy_id:
-            item = {
-                'policy_id': policy_id,
-                'policy_content': policy_content or '',
-                'category': row.get('카테고리', ''),
-                'empty_fields': []
-            }
-            
-            # 빈 필드 체크
-            for key, value in row.items():
-                if value == '' or value == [] or (isinstance(value, list) and len(value) == 0):
-                    item['empty_fields'].append(key)
-            
-            spm_items.append(item)
+        item = {
+            'policy_id': policy_id,
+            'policy_content': policy_content or '',
+            'category': row.get('카테고리', ''),
+            'empty_fields': row.empty_fields()
+        }
+        
+        spm_items.append(item)
     
     return {
         'ia_items': ia_items,
@@ -101,7 +65,7 @@ def parse_output_json(file_path):
     }
 
 if __name__ == '__main__':
-    result = parse_output_json('output.json')
+    result = cached_parse('output.json', 'parse_output_json', parse_output_json, version=2)
     
     print(f"IA 1.0 항목 수: {result['ia_count']}")
     print(f"SPM 1.0 항목 수: {result['spm_count']}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD/output.json 파싱 결과 디스크 캐시
+- 입력 파일 내용 해시(blake2b)를 키로 파싱 결과를 pickle로 저장
+- 입력이 바뀌지 않았으면 재실행 시 파싱을 건너뜀
+- 임시 파일 기록 후 os.replace로 교체하므로 동시 실행 시에도 깨진 캐시를 읽지 않음
+
+환경 변수
+- PRD_CACHE_DIR: 캐시 디렉터리 (기본값: 입력 파일 옆 .prd_cache)
+- PRD_CACHE=0: 캐시 사용 안 함
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Optional
+
+CACHE_DIR_NAME = '.prd_cache'
+
+
+def content_digest(data: bytes) -> str:
+    """바이트 내용의 해시"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """파일 내용의 해시"""
+    with open(path, 'rb') as f:
+        return content_digest(f.read())
+
+
+def cache_enabled() -> bool:
+    return os.environ.get('PRD_CACHE', '1') != '0'
+
+
+def cache_dir_for(path: str) -> str:
+    return os.environ.get('PRD_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR_NAME)
+
+
+def entry_prefix(path: str, namespace: str) -> str:
+    source_key = content_digest(os.path.abspath(path).encode('utf-8'))[:8]
+    return f"{namespace}-{source_key}-"
+
+
+def load_entry(cache_dir: str, name: str) -> Optional[Any]:
+    """캐시 항목 읽기. 없거나 손상되었으면 None"""
+    try:
+        with open(os.path.join(cache_dir, name), 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError):
+        return None
+
+
+def store_entry(cache_dir: str, name: str, value: Any):
+    """임시 파일에 기록한 뒤 원자적으로 교체"""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, os.path.join(cache_dir, name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    except OSError:
+        # 캐시는 최적화일 뿐이므로 기록 실패는 무시
+        pass
+
+
+def _prune(cache_dir: str, prefix: str, keep: str):
+    """같은 입력 파일의 이전 버전 캐시 정리"""
+    try:
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix) and name != keep:
+                try:
+                    os.unlink(os.path.join(cache_dir, name))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def cached_parse(path: str, namespace: str, parser: Callable[[str], Any], version: int = 1) -> Any:
+    """
+    path 파일을 parser(path)로 파싱하되, 같은 내용에 대한 결과가 캐시에 있으면 재사용
+    - namespace: 파서 식별자 (스크립트/결과 형태별로 구분)
+    - version: 파서 결과 형태가 바뀌면 올려서 기존 캐시 무효화
+    """
+    if not cache_enabled():
+        return parser(path)
+
+    cache_dir = cache_dir_for(path)
+    prefix = entry_prefix(path, namespace)
+    name = f"{prefix}v{version}-{file_digest(path)}.pickle"
+
+    value = load_entry(cache_dir, name)
+    if value is not None:
+        return value
+
+    value = parser(path)
+    store_entry(cache_dir, name, value)
+    _prune(cache_dir, prefix, name)
+    return value
@@ -0,0 +1,533 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 마크다운 문서 모델
+- 문서를 한 번만 읽어 헤딩/섹션/표/코드 블록으로 토큰화
+- 검증 스크립트는 정규식으로 문서 전체를 반복 스캔하지 않고 이 모델을 조회
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+import prd_regex
+from prd_cache import cache_dir_for, cache_enabled, content_digest, entry_prefix, load_entry, store_entry
+
+# 헤딩: 줄 끝 공백을 먼저 잘라 낸 줄에 매치하고 닫는 '#'은 match_heading에서 제거 (줄 길이에 선형)
+HEADING_RE = prd_regex.compile(r'^(#{1,6})\s+(.*\S)')
+# 표 구분 줄은 문서 스캔 예산 적용 (PRD_REGEX_BUDGET)
+TABLE_SEPARATOR_RE = prd_regex.budgeted(r'^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$')
+FENCE_RE = prd_regex.compile(r'^(```|~~~)\s*([^`\s]*)')
+SECTION_NUMBER_RE = prd_regex.compile(r'^\d+(?:\.\d+)*\.?\s+')
+HEADING_ID_RE = prd_regex.compile(r'^(?:결정\s+)?((?:FLOW|SCR|FUNC|API|ENT|NFR|D-P1)-\d+)\s*:')
+# 본문 ID 참조 (모든 접두어를 한 번의 스캔으로 찾는 단일 alternation)
+ID_REFERENCE_RE = prd_regex.compile(r'(FUNC|SCR|API|ENT|FLOW|NFR|D-P1)-\d+')
+
+# PRD 표 헤더 바인딩 ({필드명: 헤더 이름}, 첫 항목이 키 열)
+FLOW_REGISTRY_COLUMNS = {
+    'id': 'Flow ID', 'name': '플로우명', 'description': '설명', 'owner': '담당자', 'status': '상태',
+}
+SCREEN_REGISTRY_COLUMNS = {
+    'id': 'Screen ID', 'name': '화면명', 'role': '역할', 'flow': 'Flow', 'status': '상태',
+}
+FUNCTION_REGISTRY_COLUMNS = {
+    'id': 'Function ID', 'name': '기능명', 'description': '설명', 'related_screens': '관련 화면', 'status': '상태',
+}
+API_REGISTRY_COLUMNS = {
+    'id': 'API ID', 'name': 'API명', 'method': 'HTTP 메서드', 'endpoint': '엔드포인트',
+    'description': '설명', 'related_function': '관련 Function', 'related_nfr': '관련 NFR', 'status': '상태',
+}
+DECISION_COLUMNS = {'id': '결정 ID', 'content': '결정 내용'}
+# 결정로그 표의 영향 범위 열 (표마다 헤더 표기가 다름)
+DECISION_SCOPE_HEADERS = ('영향 범위(기능/화면/상태)', '영향 범위')
+FLOW_SCREEN_COLUMNS = {'flow': 'Flow ID', 'screen': 'Screen ID', 'order': '순서'}
+SCREEN_FUNCTION_COLUMNS = {'screen': 'Screen ID', 'functions': 'Function ID'}
+FUNCTION_MAPPING_COLUMNS = {'function': 'Function ID', 'entities': 'Entity ID', 'apis': 'API ID', 'nfrs': 'NFR ID'}
+SITEMAP_COLUMNS = {'area': '탭/영역', 'depth1': '1depths', 'depth2': '2depths', 'depth3': '3depths', 'contents': 'contents'}
+STATE_TRANSITION_COLUMNS = {'from': '이전 상태', 'to': '다음 상태', 'trigger': '트리거 이벤트', 'actor': '주체'}
+FIELD_TABLE_HEADERS = ('필드명', '내용')
+CHUNK_CACHE_VERSION = 2
+# PRDDocument를 담는 파싱 캐시의 버전 (문서 모델 속성이 바뀌면 올림)
+DOCUMENT_CACHE_VERSION = 4
+
+
+@dataclass
+class Heading:
+    level: int
+    text: str
+    line: int      # 1부터 시작하는 줄 번호
+    offset: int    # 문서 내 헤딩 줄 시작 위치
+    end: int = 0   # 섹션 끝 위치(다음 동급 이상 헤딩 시작 또는 문서 끝)
+
+
+@dataclass
+class Table:
+    header: List[str]
+    rows: List[List[str]]
+    line: int
+    offset: int
+    end: int
+    heading: int = -1  # 표를 포함하는 헤딩 인덱스(-1: 없음)
+    row_lines: List[int] = field(default_factory=list)
+
+    def column(self, name: str) -> int:
+        """헤더 이름으로 열 인덱스 조회(없으면 -1)"""
+        try:
+            return self.header.index(name)
+        except ValueError:
+            return -1
+
+    def fields(self) -> Dict[str, str]:
+        """'필드명 | 내용' 형태의 2열 표를 {필드명: 내용}으로 변환"""
+        return {cells[0]: cells[1] for cells in self.rows if len(cells) >= 2}
+
+
+@dataclass
+class CodeBlock:
+    lang: str
+    line: int
+    offset: int
+    end: int
+
+
+class Span:
+    """
+    문서 내용(공유 버퍼)의 [start, end) 구간
+    - 부분 문자열을 복사하지 않고 위치만 보관, 텍스트는 text로 요청할 때만 생성
+    - 검색은 pattern.search(buffer, start, end)로 버퍼에서 직접 수행
+      (이때 '^'는 구간 시작이 아니라 버퍼 시작/줄 시작에만 매치)
+    """
+
+    __slots__ = ('buffer', 'start', 'end')
+
+    def __init__(self, buffer: str, start: int = 0, end: Optional[int] = None):
+        self.buffer = buffer
+        self.start = start
+        self.end = len(buffer) if end is None else end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"Span({self.start}, {self.end})"
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __contains__(self, sub: str) -> bool:
+        return self.find(sub) >= 0
+
+    @property
+    def text(self) -> str:
+        return self.buffer[self.start:self.end]
+
+    def find(self, sub: str) -> int:
+        """구간 안에서 sub의 버퍼 기준 위치 (없으면 -1)"""
+        return self.buffer.find(sub, self.start, self.end)
+
+    def search(self, pattern: Pattern) -> Optional[re.Match]:
+        return pattern.search(self.buffer, self.start, self.end)
+
+    def finditer(self, pattern: Pattern) -> Iterator[re.Match]:
+        return pattern.finditer(self.buffer, self.start, self.end)
+
+    def sub_span(self, start: int, end: int) -> 'Span':
+        """버퍼 기준 위치로 잘라낸 하위 구간 (이 구간 범위로 제한)"""
+        return Span(self.buffer, max(start, self.start), min(end, self.end))
+
+
+def match_heading(line: str) -> Optional[Tuple[int, str]]:
+    """헤딩 줄이면 (레벨, 텍스트), 아니면 None (텍스트 끝의 닫는 '#'과 공백 제외)"""
+    match = HEADING_RE.match(line.rstrip())
+    if match is None:
+        return None
+    text = match.group(2)
+    return len(match.group(1)), text.rstrip('#').rstrip() or text[:1]
+
+
+def split_table_row(line: str) -> List[str]:
+    """마크다운 표 행을 셀 목록으로 분리"""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+@dataclass
+class Chunk:
+    """헤딩 단위로 나눈 문서 조각의 토큰 (조각 기준 상대 오프셋/줄 번호)"""
+    headings: List[Heading]
+    tables: List[Table]
+    code_blocks: List[CodeBlock]
+
+
+def split_chunks(content: str) -> List[Tuple[int, int]]:
+    """코드 블록 밖의 헤딩 줄마다 문서를 [start, end) 조각으로 분할"""
+    starts = [0]
+    offset = 0
+    fence = None
+    for raw in content.splitlines(keepends=True):
+        start, offset = offset, offset + len(raw)
+        if fence:
+            if raw.lstrip().startswith(fence):
+                fence = None
+            continue
+        first = raw[:1]
+        if first == '#' and start and match_heading(raw):
+            starts.append(start)
+        elif first in '`~ \t':
+            fence_match = FENCE_RE.match(raw.strip())
+            if fence_match:
+                fence = fence_match.group(1)
+    return list(zip(starts, starts[1:] + [len(content)]))
+
+
+def tokenize_chunk(text: str) -> Chunk:
+    """조각 하나를 줄 단위로 순회하며 헤딩/표/코드 블록을 수집"""
+    chunk = Chunk([], [], [])
+    offset = 0
+    fence = None
+    code_start = None
+    table_lines = []  # (line_no, offset, end, text)
+
+    for line_no, raw in enumerate(text.splitlines(keepends=True), 1):
+        line = raw.rstrip('\r\n')
+        start, offset = offset, offset + len(raw)
+
+        if fence:
+            if line.lstrip().startswith(fence):
+                chunk.code_blocks.append(CodeBlock(code_start[2], code_start[0], code_start[1], offset))
+                fence = None
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith('|'):
+            table_lines.append((line_no, start, offset, stripped))
+            continue
+        if table_lines:
+            chunk.tables.append(_build_table(table_lines, len(chunk.headings) - 1))
+            table_lines = []
+
+        fence_match = FENCE_RE.match(stripped)
+        if fence_match:
+            fence = fence_match.group(1)
+            code_start = (line_no, start, fence_match.group(2))
+            continue
+
+        heading = match_heading(line)
+        if heading:
+            chunk.headings.append(Heading(heading[0], heading[1], line_no, start))
+
+    if table_lines:
+        chunk.tables.append(_build_table(table_lines, len(chunk.headings) - 1))
+    if fence:
+        chunk.code_blocks.append(CodeBlock(code_start[2], code_start[0], code_start[1], offset))
+    return chunk
+
+
+def _build_table(table_lines, heading: int) -> Table:
+    header: List[str] = []
+    body = table_lines
+    if len(table_lines) >= 2 and TABLE_SEPARATOR_RE.match(table_lines[1][3]):
+        header = split_table_row(table_lines[0][3])
+        body = table_lines[2:]
+    body = [entry for entry in body if not TABLE_SEPARATOR_RE.match(entry[3])]
+    return Table(
+        header=header,
+        rows=[split_table_row(text) for _, _, _, text in body],
+        line=table_lines[0][0],
+        offset=table_lines[0][1],
+        end=table_lines[-1][2],
+        heading=heading,
+        row_lines=[line_no for line_no, _, _, _ in body],
+    )
+
+
+@dataclass
+class IdOccurrence:
+    id: str
+    offset: int
+    line: int                  # 1부터 시작하는 줄 번호
+    column: int                # 1부터 시작하는 열 번호
+    section: Optional[Heading]  # 참조를 감싸는 가장 안쪽 섹션 (없으면 None)
+
+
+class IdReferenceIndex:
+    """
+    본문 ID 참조 색인 (ID → 등장 위치 offset 배열)
+    - 문서를 한 번만 스캔하고 위치는 array('L')로만 보관
+    - 줄/열/섹션은 조회할 때 이분 탐색으로 계산
+    """
+
+    def __init__(self, document: 'PRDDocument'):
+        self.document = document
+        self.offsets: Dict[str, array] = {}
+        self.types: Dict[str, str] = {}  # ID → 접두어 (FUNC, SCR, ..., D-P1)
+        for match in ID_REFERENCE_RE.finditer(document.content):
+            ref_id = match.group(0)
+            positions = self.offsets.get(ref_id)
+            if positions is None:
+                positions = self.offsets[ref_id] = array('L')
+                self.types[ref_id] = match.group(1)
+            positions.append(match.start())
+
+    def __len__(self) -> int:
+        return sum(len(positions) for positions in self.offsets.values())
+
+    def __contains__(self, ref_id: str) -> bool:
+        return ref_id in self.offsets
+
+    def ids(self, id_type: Optional[str] = None) -> List[str]:
+        """참조된 ID 목록(첫 등장 순서)"""
+        return [ref_id for ref_id, ref_type in self.types.items() if id_type is None or ref_type == id_type]
+
+    def by_type(self) -> Dict[str, set]:
+        """접두어 → 참조된 ID 집합"""
+        result: Dict[str, set] = {}
+        for ref_id, ref_type in self.types.items():
+            result.setdefault(ref_type, set()).add(ref_id)
+        return result
+
+    def count(self, ref_id: str) -> int:
+        return len(self.offsets.get(ref_id, ()))
+
+    def occurrences(self, ref_id: str) -> Iterator[IdOccurrence]:
+        for offset in self.offsets.get(ref_id, ()):
+            line, column = self.document.position(offset)
+            yield IdOccurrence(ref_id, offset, line, column, self.document.enclosing_section(offset))
+
+    def first(self, ref_id: str) -> Optional[IdOccurrence]:
+        return next(self.occurrences(ref_id), None)
+
+
+class PRDDocument:
+    """
+    헤딩 단위 조각을 토큰화해 조립한 PRD 문서 모델
+    - chunk_cache(조각 해시 → Chunk)를 넘기면 내용이 바뀐 조각만 다시 토큰화
+    """
+
+    def __init__(self, content: str, chunk_cache: Optional[Dict[str, Chunk]] = None):
+        self.content = content
+        self.headings: List[Heading] = []
+        self.tables: List[Table] = []
+        self.code_blocks: List[CodeBlock] = []
+        # 조각 해시 목록과 이번에 다시 토큰화한 조각 수
+        self.chunk_digests: List[str] = []
+        self.reparsed_chunks = 0
+        # 섹션 인덱스: 헤딩 텍스트/ID → 헤딩(섹션 범위 = offset..end)
+        self.sections_by_title: Dict[str, Heading] = {}
+        self.sections_by_id: Dict[str, Heading] = {}
+        # 표 인덱스: 헤더 이름 → 표 인덱스 목록, 바인딩된 레코드 캐시
+        self._tables_by_header: Dict[str, List[int]] = {}
+        self._record_cache: Dict[tuple, List[Dict[str, str]]] = {}
+        self._tokenize(chunk_cache if chunk_cache is not None else {})
+        self._index_sections()
+        self._table_offsets = [table.offset for table in self.tables]
+        self._heading_offsets = [heading.offset for heading in self.headings]
+        # 필요할 때 만드는 색인 (줄 시작 위치, 본문 ID 참조)
+        self._line_starts: Optional[array] = None
+        self._id_references: Optional[IdReferenceIndex] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PRDDocument':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read())
+
+    @classmethod
+    def from_file_incremental(cls, path: str) -> 'PRDDocument':
+        """
+        이전 실행의 조각 토큰을 디스크 캐시에서 읽어 바뀐 조각만 다시 토큰화
+        (조각 캐시는 현재 문서의 조각만 남기고 갱신)
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if not cache_enabled():
+            return cls(content)
+
+        cache_dir = cache_dir_for(path)
+        name = entry_prefix(path, 'prd_chunks') + f"v{CHUNK_CACHE_VERSION}.pickle"
+        chunk_cache = load_entry(cache_dir, name) or {}
+        document = cls(content, chunk_cache)
+        if document.reparsed_chunks or len(chunk_cache) != len(set(document.chunk_digests)):
+            store_entry(cache_dir, name, {digest: chunk_cache[digest] for digest in document.chunk_digests})
+        return document
+
+    def _tokenize(self, chunk_cache: Dict[str, Chunk]):
+        """조각별 토큰을 (캐시 재사용 또는 재토큰화) 문서 기준 위치로 옮겨 조립"""
+        with prd_regex.scan():
+            self._tokenize_chunks(chunk_cache)
+
+    def _tokenize_chunks(self, chunk_cache: Dict[str, Chunk]):
+        open_levels: List[int] = []  # 아직 끝나지 않은 헤딩 인덱스 스택
+        base_line = 0
+
+        for start, end in split_chunks(self.content):
+            text = self.content[start:end]
+            digest = content_digest(text.encode('utf-8'))
+            chunk = chunk_cache.get(digest)
+            if chunk is None:
+                chunk = chunk_cache[digest] = tokenize_chunk(text)
+                self.reparsed_chunks += 1
+            self.chunk_digests.append(digest)
+
+            base_heading = len(self.headings)
+            for heading in chunk.headings:
+                while open_levels and self.headings[open_levels[-1]].level >= heading.level:
+                    self.headings[open_levels.pop()].end = start + heading.offset
+                self.headings.append(replace(heading, line=base_line + heading.line, offset=start + heading.offset))
+                open_levels.append(len(self.headings) - 1)
+            for table in chunk.tables:
+                self._add_table(replace(
+                    table,
+                    line=base_line + table.line,
+                    offset=start + table.offset,
+                    end=start + table.end,
+                    heading=base_heading + table.heading,
+                    row_lines=[base_line + line_no for line_no in table.row_lines],
+                ))
+            for block in chunk.code_blocks:
+                self.code_blocks.append(replace(
+                    block, line=base_line + block.line, offset=start + block.offset, end=start + block.end,
+                ))
+            base_line += text.count('\n')
+
+        for index in open_levels:
+            self.headings[index].end = len(self.content)
+
+    def _index_sections(self):
+        """헤딩 텍스트(번호 포함/제외)와 헤딩 선두 ID로 섹션 인덱스 구성"""
+        for heading in self.headings:
+            title = SECTION_NUMBER_RE.sub('', heading.text)
+            self.sections_by_title.setdefault(heading.text, heading)
+            self.sections_by_title.setdefault(title, heading)
+            id_match = HEADING_ID_RE.match(title)
+            if id_match:
+                self.sections_by_id.setdefault(id_match.group(1), heading)
+
+    def _add_table(self, table: Table):
+        for name in set(table.header):
+            self._tables_by_header.setdefault(name, []).append(len(self.tables))
+        self.tables.append(table)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def section(self, key: str) -> Optional[Heading]:
+        """헤딩 텍스트(번호 유무 무관) 또는 헤딩 선두 ID로 섹션 조회"""
+        heading = self.sections_by_title.get(key)
+        if heading is None:
+            heading = self.sections_by_id.get(key)
+        return heading
+
+    def section_ids(self, prefix: str, level: Optional[int] = None) -> List[str]:
+        """헤딩 선두 ID 중 prefix로 시작하는 ID 목록(문서 순서)"""
+        return [
+            item_id for item_id, heading in self.sections_by_id.items()
+            if item_id.startswith(prefix) and (level is None or heading.level == level)
+        ]
+
+    def enclosing_section(self, offset: int) -> Optional[Heading]:
+        """offset을 포함하는 가장 안쪽 섹션"""
+        index = bisect_right(self._heading_offsets, offset) - 1
+        while index >= 0:
+            heading = self.headings[index]
+            if heading.end > offset:
+                return heading
+            index -= 1
+        return None
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """offset의 (줄, 열), 모두 1부터 시작"""
+        if self._line_starts is None:
+            self._line_starts = array('L', [0])
+            self._line_starts.extend(match.end() for match in prd_regex.finditer('\n', self.content))
+        index = bisect_right(self._line_starts, offset) - 1
+        return index + 1, offset - self._line_starts[index] + 1
+
+    def id_references(self) -> IdReferenceIndex:
+        """본문 ID 참조 색인 (처음 호출할 때 한 번 스캔)"""
+        if self._id_references is None:
+            self._id_references = IdReferenceIndex(self)
+        return self._id_references
+
+    def span(self, start: int = 0, end: Optional[int] = None) -> Span:
+        return Span(self.content, start, end)
+
+    def section_span(self, heading: Heading) -> Span:
+        """섹션 범위 (복사 없이 문서 버퍼를 가리킴)"""
+        return Span(self.content, heading.offset, heading.end)
+
+    def section_text(self, heading: Heading) -> str:
+        """섹션 텍스트 (새 문자열을 만듦, 필요할 때만 사용)"""
+        return self.section_span(heading).text
+
+    def tables_in(self, start: int = 0, end: Optional[int] = None) -> Iterator[Table]:
+        """[start, end) 범위에 있는 표 (표 시작 위치 이분 탐색)"""
+        end = len(self.content) if end is None else end
+        for index in range(bisect_left(self._table_offsets, start), len(self.tables)):
+            table = self.tables[index]
+            if table.end > end:
+                break
+            yield table
+
+    def tables_with(self, *headers: str) -> List[Table]:
+        """지정한 헤더 이름을 모두 가진 표(문서 순서)"""
+        if not headers:
+            return list(self.tables)
+        candidates = set(self._tables_by_header.get(headers[0], ()))
+        for name in headers[1:]:
+            candidates &= set(self._tables_by_header.get(name, ()))
+        return [self.tables[index] for index in sorted(candidates)]
+
+    def records(self, columns: Dict[str, str], key: Optional[Pattern] = None,
+                section: Optional[Heading] = None) -> List[Dict[str, str]]:
+        """
+        헤더 이름으로 열을 바인딩한 행 레코드 목록
+        - columns: {필드명: 헤더 이름}, 첫 번째 항목이 키 열
+        - key: 키 열 값이 fullmatch해야 하는 패턴
+        - section: 지정 시 해당 섹션 범위의 표만 조회
+        결과는 (columns, key, section) 단위로 캐시된다.
+        """
+        cache_key = (tuple(columns.items()), key.pattern if key else None,
+                     section.offset if section else None)
+        cached = self._record_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        key_field = next(iter(columns))
+        records = []
+        for table in self.tables_with(*columns.values()):
+            if section and not (section.offset <= table.offset and table.end <= section.end):
+                continue
+            indexes = {name: table.column(header) for name, header in columns.items()}
+            for cells in table.rows:
+                record = {name: cells[index] if index < len(cells) else ''
+                          for name, index in indexes.items()}
+                if key is not None and not key.fullmatch(record[key_field]):
+                    continue
+                records.append(record)
+        self._record_cache[cache_key] = records
+        return records
+
+    def rows(self, first_cell: Optional[Pattern] = None, min_cells: int = 0,
+             start: int = 0, end: Optional[int] = None) -> Iterator[List[str]]:
+        """범위 내 모든 표의 데이터 행. first_cell 패턴과 최소 셀 수로 거른다."""
+        for table in self.tables_in(start, end):
+            for cells in table.rows:
+                if len(cells) < min_cells:
+                    continue
+                if first_cell is not None and not first_cell.fullmatch(cells[0]):
+                    continue
+                yield cells
+
+    def headings_matching(self, pattern: Pattern) -> Iterator[re.Match]:
+        """헤딩 텍스트에 pattern.match를 적용한 결과"""
+        for heading in self.headings:
+            match = pattern.match(heading.text)
+            if match:
+                yield match
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 정규식 백엔드
+- re2 모듈(google-re2)이 설치되어 있으면 선형 시간 매칭 엔진 사용
+- re2가 없거나 re2가 지원하지 않는 패턴(역참조, 전후방 탐색 등)/플래그는 표준 re 사용
+  - re 플래그는 re2 인라인 플래그((?i), (?m), (?s))로 옮기고, 옮길 수 없으면 표준 re로 처리
+  - re2가 있는데 표준 re로 처리한 패턴은 RuntimeWarning을 내고 FALLBACK_PATTERNS에 기록 (선형 시간 보장 없음)
+- compile()/search() 등은 백엔드가 컴파일한 패턴을 그대로 사용 (호출마다 추가 비용 없음)
+- 역추적이 폭증할 수 있는 표/행 패턴은 budgeted()로 감싸 시간 예산 적용 (re2가 없어도 CI가 멈추지 않도록)
+  - 예산은 문서 스캔(scan() 블록) 단위로 한 번만 설정, 초과 시 문제 패턴/줄을 담은 RegexBudgetExceeded 발생
+  - POSIX 메인 스레드에서는 SIGALRM으로 매칭 도중 중단, 그 외 환경에서는 budgeted 패턴 호출 후 검사
+  - PRD_REGEX_BUDGET=0이면 예산 없이 budgeted 패턴도 일반 패턴과 같이 동작
+
+환경 변수
+- PRD_REGEX_BACKEND=re|re2: 백엔드 지정 (기본값: re2가 있으면 re2)
+- PRD_REGEX_BUDGET=초: 문서 스캔당 시간 예산 (기본값 5초, 0이면 예산 없음)
+
+사용법
+    import prd_regex
+    ID_RE = prd_regex.compile(r'FUNC-\\d+')
+    TABLE_SEPARATOR_RE = prd_regex.budgeted(r'^\\|?\\s*:?-+:?\\s*(\\|\\s*:?-+:?\\s*)*\\|?$')
+    with prd_regex.scan():
+        TABLE_SEPARATOR_RE.match(line)
+"""
+
+import os
+import re
+import signal
+import threading
+import time
+import warnings
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# 정상 문서의 토큰화는 수십 ms이므로 넉넉한 값 (문제 줄 하나가 CI를 멈추지 않도록 하는 상한)
+DEFAULT_BUDGET = 5.0
+# re 플래그 → re2 인라인 플래그 (re.UNICODE는 str 패턴의 기본 동작이라 그대로 둠)
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+_RE2_IGNORED_FLAGS = re.UNICODE
+# re2가 있는데도 표준 re로 컴파일한 패턴 → 사유
+FALLBACK_PATTERNS: Dict[str, str] = {}
+_PREEMPT_SUPPORTED = hasattr(signal, 'setitimer')
+_handler_installed = False
+
+
+class RegexBudgetExceeded(RuntimeError):
+    """문서 스캔이 정규식 시간 예산을 넘김"""
+
+    def __init__(self, pattern: str, budget: float, elapsed: float,
+                 line_no: Optional[int] = None, line: str = ''):
+        self.pattern = pattern
+        self.budget = budget
+        self.elapsed = elapsed
+        self.line_no = line_no
+        self.line = line
+        if line_no is not None:
+            where = f"{line_no}행: {line[:120]!r}"
+        else:
+            where = repr(line[:120]) if line else "문제 줄을 특정하지 못함"
+        super().__init__(f"정규식 시간 예산 초과 ({elapsed:.2f}초 > {budget}초) {pattern!r} - {where}")
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _raise_interrupted(signum, frame):
+    raise _Interrupted()
+
+
+def backend_name() -> str:
+    requested = os.environ.get('PRD_REGEX_BACKEND', '')
+    if requested == 're' or re2 is None:
+        return 're'
+    return 're2'
+
+
+def default_budget() -> float:
+    try:
+        return float(os.environ.get('PRD_REGEX_BUDGET', DEFAULT_BUDGET))
+    except ValueError:
+        return DEFAULT_BUDGET
+
+
+def _can_preempt() -> bool:
+    """
+    SIGALRM으로 매칭을 중단할 수 있는지
+    - 메인 스레드에서만 가능하며, 다른 코드가 SIGALRM을 쓰고 있으면 건드리지 않음
+    - 처리기는 예산이 있는 스캔을 처음 시작할 때 한 번만 설치
+    """
+    global _handler_installed
+    if not _PREEMPT_SUPPORTED or threading.current_thread() is not threading.main_thread():
+        return False
+    if not _handler_installed:
+        if signal.getsignal(signal.SIGALRM) not in (signal.SIG_DFL, None):
+            return False
+        signal.signal(signal.SIGALRM, _raise_interrupted)
+        _handler_installed = True
+    return True
+
+
+class _ScanState(threading.local):
+    deadline: Optional[float] = None   # 진행 중인 스캔의 마감 시각 (perf_counter 기준)
+    budget = 0.0
+    started = 0.0
+    preempt = False
+
+
+_state = _ScanState()
+
+
+class scan:
+    """
+    문서 스캔 한 번에 시간 예산 적용 (중첩되면 바깥 스캔의 예산만 사용)
+    - 타이머는 블록에 들어갈 때 한 번 설정하고 나올 때 해제
+    - budgeted 패턴 밖에서 예산을 넘기면 패턴을 특정하지 못한 RegexBudgetExceeded
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = default_budget() if budget is None else budget
+        self.active = False
+
+    def __enter__(self) -> 'scan':
+        if self.budget and _state.deadline is None:
+            self.active = True
+            _state.budget = self.budget
+            _state.started = time.perf_counter()
+            _state.deadline = _state.started + self.budget
+            _state.preempt = _can_preempt()
+            if _state.preempt:
+                signal.setitimer(signal.ITIMER_REAL, self.budget)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if not self.active:
+            return False
+        if _state.preempt:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        elapsed = time.perf_counter() - _state.started
+        _state.deadline = None
+        self.active = False
+        if exc_type is _Interrupted:
+            raise RegexBudgetExceeded('', self.budget, elapsed) from None
+        return False
+
+
+def _re2_pattern(pattern: str, flags: int) -> Optional[str]:
+    """re 플래그를 re2 인라인 플래그로 옮긴 패턴 (옮길 수 없는 플래그가 있으면 None)"""
+    inline = ''
+    for flag, letter in _RE2_INLINE_FLAGS:
+        if flags & flag:
+            inline += letter
+            flags &= ~flag
+    if flags & ~_RE2_IGNORED_FLAGS:
+        return None
+    return f'(?{inline}){pattern}' if inline else pattern
+
+
+def _fall_back(pattern: str, reason: str):
+    if pattern not in FALLBACK_PATTERNS:
+        FALLBACK_PATTERNS[pattern] = reason
+        warnings.warn(f"re2로 컴파일할 수 없어 표준 re 사용 (선형 시간 보장 없음): {pattern!r} - {reason}",
+                      RuntimeWarning, stacklevel=3)
+
+
+def _compile_backend(pattern: str, flags: int) -> Tuple[Any, str]:
+    """(컴파일된 패턴, 실제 사용한 백엔드 이름)"""
+    if backend_name() == 're2':
+        re2_pattern = _re2_pattern(pattern, flags)
+        if re2_pattern is None:
+            _fall_back(pattern, f"re2로 옮길 수 없는 플래그 {re.RegexFlag(flags)!r}")
+        else:
+            try:
+                return re2.compile(re2_pattern), 're2'
+            except Exception as e:
+                _fall_back(pattern, f"{type(e).__name__}: {e}")
+    return re.compile(pattern, flags), 're'
+
+
+class BudgetedPattern:
+    """
+    re.Pattern과 같은 방식으로 쓰는 예산 적용 패턴 (역추적이 폭증할 수 있는 표/행 패턴용)
+    - 진행 중인 scan()이 없으면 컴파일된 패턴을 바로 호출
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled, self.backend = _compile_backend(pattern, flags)
+
+    def __reduce__(self):
+        return (BudgetedPattern, (self.pattern, self.flags))
+
+    def __repr__(self) -> str:
+        return f"prd_regex.budgeted({self.pattern!r}, backend={self.backend!r})"
+
+    @property
+    def groups(self) -> int:
+        return self._compiled.groups
+
+    def _locate(self, string: str, budget: float) -> Tuple[Optional[int], str]:
+        """예산을 넘기는 줄 찾기 (한 줄 입력이면 그 줄, 실패 경로에서만 호출)"""
+        if '\n' not in string:
+            return None, string
+        for line_no, line in enumerate(string.split('\n'), 1):
+            started = time.perf_counter()
+            try:
+                with scan(budget):
+                    self._compiled.search(line)
+            except RegexBudgetExceeded:
+                return line_no, line
+            if time.perf_counter() - started > budget:
+                return line_no, line
+        return None, ''
+
+    def _exceeded(self, string: str) -> RegexBudgetExceeded:
+        budget, elapsed = _state.budget, time.perf_counter() - _state.started
+        if _state.preempt:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        _state.deadline = None  # 문제 줄을 찾는 동안 바깥 스캔의 예산은 끝난 것으로 봄
+        return RegexBudgetExceeded(self.pattern, budget, elapsed, *self._locate(string, budget))
+
+    def _run(self, call: Callable[[], Any], string: str) -> Any:
+        if _state.deadline is None:
+            return call()
+        try:
+            result = call()
+        except _Interrupted:
+            raise self._exceeded(string) from None
+        if not _state.preempt and time.perf_counter() > _state.deadline:
+            raise self._exceeded(string)
+        return result
+
+    def search(self, string: str, *args) -> Optional[re.Match]:
+        return self._run(lambda: self._compiled.search(string, *args), string)
+
+    def match(self, string: str, *args) -> Optional[re.Match]:
+        return self._run(lambda: self._compiled.match(string, *args), string)
+
+    def fullmatch(self, string: str, *args) -> Optional[re.Match]:
+        return self._run(lambda: self._compiled.fullmatch(string, *args), string)
+
+    def findall(self, string: str, *args) -> List[Any]:
+        return self._run(lambda: self._compiled.findall(string, *args), string)
+
+    def finditer(self, string: str, *args) -> Iterator[re.Match]:
+        return iter(self._run(lambda: list(self._compiled.finditer(string, *args)), string))
+
+    def sub(self, repl: Any, string: str, count: int = 0) -> str:
+        return self._run(lambda: self._compiled.sub(repl, string, count), string)
+
+    def split(self, string: str, maxsplit: int = 0) -> List[str]:
+        return self._run(lambda: self._compiled.split(string, maxsplit), string)
+
+
+@lru_cache(maxsize=256)
+def compile(pattern: str, flags: int = 0) -> Any:
+    """백엔드가 컴파일한 패턴 (re.Pattern 또는 re2 패턴, 같은 인자는 캐시)"""
+    return _compile_backend(pattern, flags)[0]
+
+
+def budgeted(pattern: str, flags: int = 0) -> BudgetedPattern:
+    """scan() 예산을 적용하는 패턴 (역추적이 폭증할 수 있는 표/행 패턴에만 사용)"""
+    return BudgetedPattern(pattern, flags)
+
+
+def search(pattern: str, string: str, flags: int = 0) -> Optional[re.Match]:
+    return compile(pattern, flags).search(string)
+
+
+def match(pattern: str, string: str, flags: int = 0) -> Optional[re.Match]:
+    return compile(pattern, flags).match(string)
+
+
+def fullmatch(pattern: str, string: str, flags: int = 0) -> Optional[re.Match]:
+    return compile(pattern, flags).fullmatch(string)
+
+
+def findall(pattern: str, string: str, flags: int = 0) -> List[Any]:
+    return compile(pattern, flags).findall(string)
+
+
+def finditer(pattern: str, string: str, flags: int = 0) -> Iterator[re.Match]:
+    return compile(pattern, flags).finditer(string)
+
+
+def sub(pattern: str, repl: Any, string: str, count: int = 0, flags: int = 0) -> str:
+    return compile(pattern, flags).sub(repl, string, count)
+
+
+def split(pattern: str, string: str, maxsplit: int = 0, flags: int = 0) -> List[str]:
+    return compile(pattern, flags).split(string, maxsplit)
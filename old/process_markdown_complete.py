@@ -3,7 +3,7 @@
 마크다운 파일을 각주를 추가하고 소제목을 볼드 처리하는 스크립트
 """
 
-import re
+import prd_regex
 
 def process_markdown(input_file, output_file):
     """마크다운 파일을 처리하여 각주 추가 및 소제목 볼드 처리"""
@@ -72,13 +72,13 @@ def process_markdown(input_file, output_file):
             parts = line.split('|')
             if len(parts) > current_source_col_idx + 1:
                 source_value = parts[current_source_col_idx + 1].strip()
-                if source_value and source_value != '소스(근거 문서)' and '필드명' not in source_value and not re.search(r'\[\^\d+\]', source_value):
+                if source_value and source_value != '소스(근거 문서)' and '필드명' not in source_value and not prd_regex.search(r'\[\^\d+\]', source_value):
                     footnote_id = get_footnote_id(f"소스(근거 문서): {source_value}")
                     parts[current_source_col_idx + 1] = f" {source_value} [^{footnote_id}] "
                     line = '|'.join(parts)
         
         # 4. 소제목(##, ###, ####)을 볼드 처리 (이미 볼드가 아닌 경우만)
-        heading_match = re.match(r'^(#{2,4})\s+(.+?)$', line)
+        heading_match = prd_regex.match(r'^(#{2,4})\s+(.+?)$', line)
         if heading_match:
             level = heading_match.group(1)
             title = heading_match.group(2).strip()
@@ -103,7 +103,7 @@ def process_markdown(input_file, output_file):
         toc_section = content[toc_start:toc_end]
         # 목차 항목 볼드 처리 (이미 볼드가 아닌 경우만)
         if '**[**' not in toc_section:  # 이미 처리되지 않은 경우만
-            toc_section = re.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
+            toc_section = prd_regex.sub(r'(\d+\.)\s+\[(.+?)\]\((.+?)\)', r'\1 [**\2**](\3)', toc_section)
         content = content[:toc_start] + toc_section + content[toc_end:]
     
     # 6. 각주 정의 추가 (문서 끝에)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+선언형 검사 규칙 엔진
+- 규칙은 데이터: (검사 이름, 선택자, 조건, 심각도/분류/규칙명/설명/위치/권장 수정 템플릿, 영향 ID)
+- 선택자는 레코드 스트림 이름 ('registry.item', 'flow_to_screen.target' …)
+  모델을 한 번 순회하는 이벤트 생성기가 (선택자, 레코드)를 차례로 내보내고,
+  계획(RulePlan)은 선택자별 규칙 목록만 조회하여 평가 → 규칙을 늘려도 순회는 한 번
+- 템플릿은 레코드 필드로 채우는 str.format 문자열이거나 (레코드, 문맥) → 값 함수
+- 결과는 검사별로 이벤트 순번, 같은 이벤트 안에서는 규칙 선언 순서 (손으로 쓴 루프와 같은 순서)
+
+사용법
+    plan = RulePlan.compile(RULES, ['check_id_format', 'check_api_logic'])
+    results = plan.evaluate(validator.rule_events(plan.selectors), validator, Issue)  # {검사 이름: [Issue, ...]}
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+Template = Union[str, Callable[[Dict[str, Any], Any], Any]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    check: str                      # 결과를 모을 check_* 이름
+    selector: str                   # 평가할 레코드 스트림
+    severity: Any
+    category: str
+    rule: Template
+    description: Template
+    location: Template = ""
+    recommendation: Template = ""
+    affected: Union[Tuple[str, ...], Callable[[Dict[str, Any], Any], List[str]]] = ()
+    predicate: Optional[Callable[[Dict[str, Any], Any], bool]] = None  # None이면 스트림의 모든 레코드가 이슈
+
+
+def render(template: Template, record: Dict[str, Any], context: Any) -> Any:
+    if callable(template):
+        return template(record, context)
+    return template.format(**record)
+
+
+class RulePlan:
+    def __init__(self, rules: Sequence[Rule], checks: Sequence[str]):
+        self.checks = list(checks)
+        self.by_selector: Dict[str, List[Rule]] = defaultdict(list)
+        for rule in rules:
+            if rule.check in self.checks:
+                self.by_selector[rule.selector].append(rule)
+
+    @classmethod
+    def compile(cls, rules: Sequence[Rule], checks: Optional[Iterable[str]] = None) -> 'RulePlan':
+        """checks(기본: 규칙에 나온 전체 검사, 선언 순서)에 속한 규칙만 선택자별로 묶음"""
+        if checks is None:
+            checks = list(dict.fromkeys(rule.check for rule in rules))
+        return cls(rules, list(checks))
+
+    @property
+    def selectors(self) -> frozenset:
+        """계획에 필요한 선택자 (이벤트 생성기가 필요 없는 스트림을 건너뛰는 데 사용)"""
+        return frozenset(self.by_selector)
+
+    def evaluate(self, events: Iterable[Tuple[str, Dict[str, Any]]], context: Any,
+                 make_issue: Callable[..., Any], new_bucket: Callable[[], Any] = list) -> Dict[str, Any]:
+        """
+        이벤트를 한 번 순회하며 모든 규칙 평가 → {검사 이름: 이슈 모음} (checks 순서)
+        - 이슈 모음은 new_bucket()으로 만든 append 가능한 객체 (기본: list)
+        """
+        found: Dict[str, Any] = {check: new_bucket() for check in self.checks}
+        for selector, record in events:
+            for rule in self.by_selector.get(selector, ()):
+                if rule.predicate is not None and not rule.predicate(record, context):
+                    continue
+                if callable(rule.affected):
+                    affected_ids = list(rule.affected(record, context))
+                else:
+                    affected_ids = [record[name] for name in rule.affected]
+                issue = make_issue(
+                    severity=rule.severity,
+                    category=rule.category,
+                    rule=render(rule.rule, record, context),
+                    description=render(rule.description, record, context),
+                    location=render(rule.location, record, context),
+                    affected_ids=affected_ids,
+                    recommendation=render(rule.recommendation, record, context),
+                )
+                found[rule.check].append(issue)
+        return found
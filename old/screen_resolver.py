@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IA 화면 ID → PRD Screen(SCR-xxxx) 해석기
+- IA 화면 ID(JoinEmail, BizOCRResult …)를 CamelCase 단어로 나누고 영-한 동의어 표로 한국어 화면명 후보를 만듦
+- PRD 화면명(및 '/', '(' 로 나눈 부분 이름)과 Screen ID를 편집 거리 BK-tree에 등록
+- 조회는 정확히 일치하면 바로 반환, 아니면 앞부분 일치(정렬 키 이분 탐색)와 BK-tree 허용 거리 안의 키만 탐색
+- 결과는 가장 가까운 SCR-xxxx와 신뢰도(1 - 편집 거리 / 긴 쪽 길이, 전체 단어 중 동의어로 옮긴 단어 비율 반영)
+- 동의어로 옮긴 단어가 너무 적은 ID(예: 'SocialCheck'에서 'check'를 빼면 한 단어)는 번역 질의를 만들지 않음
+
+동의어 표
+- 기본 표는 screen_synonyms.json (PRD 화면명에 맞춘 문서별 데이터)
+- PRD_SCREEN_SYNONYMS=경로: 동의어 표 JSON({"Join": ["회원가입"], ...})을 기본 표에 덧붙임
+
+사용법
+    resolver = ScreenResolver.from_registry(registries['screens'])
+    resolver.resolve('SettleHistory')  # ScreenMatch(screen_id='SCR-0104', confidence=1.0, key='정산내역', query='정산내역')
+"""
+
+import bisect
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import prd_regex
+
+# 영어 단어 → 한국어 화면명 표현 표 (앞쪽이 우선, PRD 화면명에 맞춘 문서별 데이터라 코드와 분리)
+SYNONYMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'screen_synonyms.json')
+# 의미 없이 붙는 단어 (번역하지 않지만 신뢰도 분모에는 포함)
+STOP_WORDS = {'done', 'create', 'edit', 'check', 'confirm', 'date', 'time'}
+
+DEFAULT_MIN_CONFIDENCE = 0.5
+# 번역 질의를 만들려면 동의어 표로 옮긴 (불용어가 아닌) 단어가 이만큼 있어야 함 (단어 수가 더 적으면 전부)
+DEFAULT_MIN_MATCHED_WORDS = 2
+
+_CAMEL_WORD_RE = prd_regex.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+_NAME_SPLIT_RE = prd_regex.compile(r'[/()]')
+_NON_WORD_RE = prd_regex.compile(r'[\W_]+')
+
+
+@dataclass(frozen=True)
+class ScreenMatch:
+    screen_id: str
+    confidence: float
+    key: str
+    query: str
+
+
+def normalize_key(text: str) -> str:
+    """소문자화하고 공백/기호 제거 ('회원가입(딜러)' → '회원가입딜러')"""
+    return _NON_WORD_RE.sub('', text.lower())
+
+
+def split_words(screen_id: str) -> List[str]:
+    """'BizOCRResult' → ['biz', 'ocr', 'result']"""
+    return [word.lower() for word in _CAMEL_WORD_RE.findall(screen_id)]
+
+
+def edit_distance(a: str, b: str) -> int:
+    """레벤슈타인 거리 (행 두 개만 유지)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _read_synonyms(path: str) -> Dict[str, Tuple[str, ...]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return {word.lower(): (terms,) if isinstance(terms, str) else tuple(terms) for word, terms in json.load(f).items()}
+
+
+def load_synonyms(path: Optional[str] = None) -> Dict[str, Tuple[str, ...]]:
+    """기본 동의어 표(SYNONYMS_PATH) + JSON 파일(path 또는 PRD_SCREEN_SYNONYMS)의 항목 (파일 항목이 앞쪽 우선)"""
+    synonyms = _read_synonyms(SYNONYMS_PATH) if os.path.exists(SYNONYMS_PATH) else {}
+    path = path or os.environ.get('PRD_SCREEN_SYNONYMS')
+    if path:
+        for word, terms in _read_synonyms(path).items():
+            synonyms[word] = terms + tuple(term for term in synonyms.get(word, ()) if term not in terms)
+    return synonyms
+
+
+class BKTree:
+    """편집 거리 BK-tree: 노드 = (키, {자식까지의 거리: 자식 노드})"""
+
+    def __init__(self, distance=edit_distance):
+        self.distance = distance
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+        self.size = 0
+
+    def add(self, key: str) -> bool:
+        """키 추가 (이미 있으면 False)"""
+        if self.root is None:
+            self.root = (key, {})
+            self.size = 1
+            return True
+        node = self.root
+        while True:
+            distance = self.distance(key, node[0])
+            if distance == 0:
+                return False
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (key, {})
+                self.size += 1
+                return True
+            node = child
+
+    def search(self, query: str, tolerance: int) -> Iterator[Tuple[int, str]]:
+        """query와 거리가 tolerance 이하인 (거리, 키). 삼각 부등식으로 거리 범위 밖 가지는 건너뜀"""
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            key, children = stack.pop()
+            distance = self.distance(query, key)
+            if distance <= tolerance:
+                yield distance, key
+            for child_distance, child in children.items():
+                if distance - tolerance <= child_distance <= distance + tolerance:
+                    stack.append(child)
+
+
+class ScreenResolver:
+    def __init__(self, synonyms: Optional[Dict[str, Tuple[str, ...]]] = None,
+                 min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+                 min_matched_words: int = DEFAULT_MIN_MATCHED_WORDS):
+        self.synonyms = synonyms if synonyms is not None else load_synonyms()
+        self.min_confidence = min_confidence
+        self.min_matched_words = min_matched_words
+        self.keys: Dict[str, List[str]] = {}  # 정규화 키 → Screen ID (등록 순서)
+        self._key_order: Dict[str, int] = {}
+        self._sorted_keys: Optional[List[str]] = None
+        self.tree = BKTree()
+
+    @classmethod
+    def from_registry(cls, screens: Dict[str, Dict], **options) -> 'ScreenResolver':
+        """Screen Registry({SCR-xxxx: {'name': ...}})의 화면명/부분 이름/ID 등록"""
+        resolver = cls(**options)
+        for screen_id, data in screens.items():
+            resolver.add(screen_id, [screen_id, data.get('name', '')])
+        return resolver
+
+    def add(self, screen_id: str, names: Iterable[str]):
+        for name in names:
+            for part in [name] + _NAME_SPLIT_RE.split(name):
+                key = normalize_key(part)
+                if not key:
+                    continue
+                if key not in self.keys:
+                    self.keys[key] = []
+                    self._key_order[key] = len(self._key_order)
+                    self._sorted_keys = None
+                    self.tree.add(key)
+                if screen_id not in self.keys[key]:
+                    self.keys[key].append(screen_id)
+
+    def translations(self, screen_id: str) -> List[Tuple[str, float]]:
+        """
+        (한국어 질의 키, 번역 비율) 후보
+        - 전체 단어 번역, 그리고 뒤 단어를 하나씩 뺀 앞부분 번역
+        - 번역 비율 = 동의어 표로 옮긴 단어 수 / 전체 단어 수 (불용어와 표에 없는 단어도 분모에 포함)
+        - 옮긴 단어가 min_matched_words개(전체 단어가 더 적으면 전부) 미만인 후보는 만들지 않음
+        - 'SettleHistory' → [('정산내역', 1.0)], 'JoinEmail' → [] (옮긴 단어가 join 하나뿐)
+        """
+        words = split_words(screen_id)
+        required = min(self.min_matched_words, len(words))
+        variants = []
+        for end in range(len(words), 0, -1):
+            translated = [self.synonyms[word][0] for word in words[:end]
+                          if word not in STOP_WORDS and word in self.synonyms]
+            if not translated or len(translated) < required:
+                continue
+            key = normalize_key(''.join(translated))
+            coverage = len(translated) / len(words)
+            if all(key != existing for existing, _ in variants):
+                variants.append((key, coverage))
+        return variants
+
+    def _prefix_keys(self, query: str) -> Iterator[str]:
+        """query로 시작하는 키(정렬 목록 이분 탐색)와 query의 앞부분인 키"""
+        position = bisect.bisect_left(self._sorted_keys, query)
+        while position < len(self._sorted_keys) and self._sorted_keys[position].startswith(query):
+            yield self._sorted_keys[position]
+            position += 1
+        for end in range(len(query) - 1, 0, -1):
+            if query[:end] in self.keys:
+                yield query[:end]
+
+    def _best(self, query: str, coverage: float) -> Optional[Tuple[float, str]]:
+        """
+        질의 키와 가장 가까운 등록 키 (신뢰도, 키)
+        - 정확히 일치 > 앞부분 일치(짧은 쪽 길이 / 긴 쪽 길이) > 편집 거리(길이의 1/3 이내)
+        """
+        if query in self.keys:
+            return coverage, query
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.keys)
+
+        scored = []
+        for key in self._prefix_keys(query):
+            scored.append((min(len(key), len(query)) / max(len(key), len(query)), key))
+        for distance, key in self.tree.search(query, len(query) // 3):
+            scored.append((1 - distance / max(len(query), len(key)), key))
+        if not scored:
+            return None
+        # 신뢰도가 같으면 짧은 키, 그다음 먼저 등록한 화면의 키
+        confidence, key = min(scored, key=lambda item: (-item[0], len(item[1]), self._key_order[item[1]]))
+        return confidence * coverage, key
+
+    def candidates(self, screen_id: str) -> List[ScreenMatch]:
+        """신뢰도순 후보 (최소 신뢰도 미만 포함)"""
+        matches: Dict[str, ScreenMatch] = {}
+        queries = [(normalize_key(screen_id), 1.0)] + self.translations(screen_id)
+        for query, coverage in queries:
+            if not query:
+                continue
+            found = self._best(query, coverage)
+            if found is None:
+                continue
+            confidence, key = found
+            for owner in self.keys[key]:
+                if owner not in matches or confidence > matches[owner].confidence:
+                    matches[owner] = ScreenMatch(owner, round(confidence, 4), key, query)
+        return sorted(matches.values(), key=lambda match: (-match.confidence, match.screen_id))
+
+    def resolve(self, screen_id: str) -> Optional[ScreenMatch]:
+        """가장 그럴듯한 PRD Screen (신뢰도가 min_confidence 미만이면 None)"""
+        candidates = self.candidates(screen_id)
+        if candidates and candidates[0].confidence >= self.min_confidence:
+            return candidates[0]
+        return None
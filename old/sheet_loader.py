@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+output.json 시트 스트리밍 로더
+- {"fileName": ..., "sheets": [{"name": ..., "data": [행, ...]}, ...]} 구조를 조각 단위로 읽음
+- 요청한 시트의 행만 하나씩 디코딩해 넘기고, 나머지 시트의 행은 디코딩 후 바로 버림
+- 여러 시트를 한 번의 읽기로 처리하고, 요청한 시트를 모두 읽으면 나머지 파일은 읽지 않음
+- 메모리 사용량은 파일 크기가 아니라 행 하나 크기에 비례
+- 시트 전체가 필요하면 SheetTable로 열 단위 적재 (항상 빈 열 제거, 반복 문자열 공유)
+- 경로가 .xlsx/.xlsm이면 원본 엑셀을 xlsx_loader로 직접 스트리밍 (output.json 변환 불필요)
+
+사용법
+    for sheet_name, rows in iter_sheets('output.json', ['IA 1.0', 'SPM 1.0']):  # 한 번의 읽기로 여러 시트
+        for row in rows:
+            ...
+"""
+
+import json
+import re
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from xlsx_loader import is_workbook, iter_workbook_sheets
+
+CHUNK_SIZE = 64 * 1024
+IA_SHEET = 'IA 1.0'
+SPM_SHEET = 'SPM 1.0'
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _StreamReader:
+    """텍스트 파일 위에서 JSON 토큰을 조각 단위로 읽는 커서"""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.file = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """소비한 앞부분을 버리고 size만큼 더 읽음. 더 읽을 것이 없으면 False"""
+        if self.eof:
+            return False
+        chunk = self.file.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 '')"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"output.json 구조 오류: '{char}' 위치에 '{found or 'EOF'}'")
+        self.pos += 1
+
+    def next_item(self, close: str) -> bool:
+        """배열/객체의 다음 항목이 있으면 True (구분자 ',' 소비), 닫는 문자면 소비 후 False"""
+        char = self.peek()
+        if char == close:
+            self.pos += 1
+            return False
+        if char == ',':
+            self.pos += 1
+        return True
+
+    def value(self) -> Any:
+        """현재 위치의 JSON 값 하나를 디코딩 (조각 경계에 걸리면 더 읽고 다시 시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # 값이 조각 경계에 걸림: 버퍼 크기만큼 더 읽어(두 배) 큰 행에서도 재시도 비용이 선형이 되도록 함
+                if not self._fill(max(self.chunk_size, len(self.buffer))):
+                    raise
+                continue
+            if end == len(self.buffer) and self._fill():
+                # 숫자처럼 끝이 열린 값은 경계에서 잘렸을 수 있으므로 다시 디코딩
+                continue
+            self.pos = end
+            return value
+
+    def key(self) -> str:
+        key = self.value()
+        self.expect(':')
+        return key
+
+
+def _walk(path: str, wanted: Optional[set]) -> Iterator[Tuple[str, Optional[Dict]]]:
+    """
+    (시트명, 행) 생성. 시트 이름을 확인한 시점에 (시트명, None)을 먼저 생성
+    - 시트 객체에서 "data"가 "name"보다 먼저 나오면 이름을 확인할 때까지 해당 시트 행만 보관
+    """
+    remaining = set(wanted) if wanted is not None else None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _StreamReader(f)
+        if reader.peek() == '\ufeff':
+            reader.pos += 1
+        reader.expect('{')
+        while reader.next_item('}'):
+            if reader.key() != 'sheets':
+                reader.value()
+                continue
+
+            reader.expect('[')
+            while reader.next_item(']'):
+                name = None
+                pending: List[Dict] = []
+                reader.expect('{')
+                while reader.next_item('}'):
+                    field = reader.key()
+                    if field == 'name':
+                        name = reader.value()
+                        if wanted is None or name in wanted:
+                            yield name, None
+                            for row in pending:
+                                yield name, row
+                        pending = []
+                    elif field == 'data':
+                        reader.expect('[')
+                        while reader.next_item(']'):
+                            row = reader.value()
+                            if name is None:
+                                pending.append(row)
+                            elif wanted is None or name in wanted:
+                                yield name, row
+                    else:
+                        reader.value()
+
+                if remaining is not None and name in remaining:
+                    remaining.discard(name)
+                    if not remaining:
+                        return
+            return
+
+
+def iter_sheets(path: str, sheet_names: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Iterator[Dict]]]:
+    """
+    (시트명, 행 iterator)를 파일 순서대로 생성 (행이 없는 시트도 포함)
+    - 행 iterator는 다음 시트로 넘어가기 전에 소비해야 하며, 소비하지 않은 행은 건너뜀
+    """
+    if is_workbook(path):
+        yield from iter_workbook_sheets(path, sheet_names)
+        return
+    events = _walk(path, set(sheet_names) if sheet_names is not None else None)
+    marker = next(events, None)
+    while marker is not None:
+        following = []
+
+        def rows() -> Iterator[Dict]:
+            for name, row in events:
+                if row is None:
+                    following.append((name, row))
+                    return
+                yield row
+
+        sheet_rows = rows()
+        yield marker[0], sheet_rows
+        for _ in sheet_rows:
+            pass
+        marker = following[0] if following else None
+
+
+def is_empty_value(value: Any) -> bool:
+    """output.json의 빈 값 ('' 또는 [])"""
+    return value == '' or value == []
+
+
+class SheetRow:
+    """SheetTable의 행 하나를 dict처럼 조회하는 뷰 (값은 복사하지 않음)"""
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: 'SheetTable', index: int):
+        self.table = table
+        self.index = index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        values = self.table.data.get(key)
+        if values is None:
+            return default if key not in self.table.empty_columns else self._pruned_value(key, default)
+        value = values[self.index]
+        return default if value is None else value
+
+    def _pruned_value(self, key: str, default: Any) -> Any:
+        bit = 1 << self.table.empty_columns.index(key)
+        return '' if self.table.empty_presence[self.index] & bit else default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """값이 있는 열 (항상 빈 열은 제외)"""
+        for column in self.table.columns:
+            value = self.table.data[column][self.index]
+            if value is not None:
+                yield column, value
+
+    def empty_count(self) -> int:
+        return self.table.empty_counts[self.index]
+
+    def empty_fields(self) -> List[str]:
+        return self.table.empty_fields(self.index)
+
+
+class SheetTable:
+    """
+    시트 행을 열 단위(column-major)로 보관
+    - 모든 행에서 비어 있는 열(Column2 … 등)은 값 목록 없이 열 이름과 행별 존재 비트만 보관 (조회 시 '')
+    - 같은 열의 반복 문자열은 하나의 객체로 공유
+    - 행별 빈 필드 개수는 적재할 때 미리 계산 (JSON null과 키 없음은 구분하지 않음)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.row_count = 0
+        self.column_order: List[str] = []      # 처음 등장한 순서의 전체 열
+        self.columns: List[str] = []           # 값이 있는 열
+        self.data: Dict[str, List[Any]] = {}   # 값이 있는 열 → 행별 값 (없으면 None)
+        self.empty_columns: List[str] = []     # 모든 행에서 빈 열
+        self.empty_presence: List[int] = []    # 행별로 존재하는 빈 열 비트마스크
+        self.empty_counts = array('H')         # 행별 빈 필드 개수
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    @classmethod
+    def from_rows(cls, name: str, rows: Iterable[Dict]) -> 'SheetTable':
+        table = cls(name)
+        data: Dict[str, List[Any]] = {}
+        interned: Dict[str, Dict[str, str]] = {}
+        for row in rows:
+            empty = 0
+            for key, value in row.items():
+                values = data.get(key)
+                if values is None:
+                    values = data[key] = [None] * table.row_count
+                    interned[key] = {}
+                    table.column_order.append(key)
+                if isinstance(value, str):
+                    value = interned[key].setdefault(value, value)
+                if is_empty_value(value):
+                    empty += 1
+                values.append(value)
+            table.row_count += 1
+            table.empty_counts.append(empty)
+            for values in data.values():
+                if len(values) < table.row_count:
+                    values.append(None)
+
+        for column in table.column_order:
+            values = data[column]
+            if all(value is None or is_empty_value(value) for value in values):
+                table.empty_columns.append(column)
+            else:
+                table.columns.append(column)
+                table.data[column] = values
+
+        # 빈 열은 값이 모두 ''/[]이므로 행별 존재 여부만 남김
+        for index in range(table.row_count):
+            presence = 0
+            for bit, column in enumerate(table.empty_columns):
+                if data[column][index] is not None:
+                    presence |= 1 << bit
+            table.empty_presence.append(presence)
+        return table
+
+    def row(self, index: int) -> SheetRow:
+        return SheetRow(self, index)
+
+    def rows(self) -> Iterator[SheetRow]:
+        for index in range(self.row_count):
+            yield SheetRow(self, index)
+
+    def empty_fields(self, index: int) -> List[str]:
+        """행의 빈 필드 이름 (전체 열 순서)"""
+        presence = self.empty_presence[index]
+        fields = []
+        for column in self.column_order:
+            values = self.data.get(column)
+            if values is None:
+                if presence >> self.empty_columns.index(column) & 1:
+                    fields.append(column)
+            elif values[index] is not None and is_empty_value(values[index]):
+                fields.append(column)
+        return fields
+
+
+def load_sheet_tables(path: str, sheet_names: Iterable[str]) -> Dict[str, SheetTable]:
+    """요청한 시트들을 한 번의 스트리밍 읽기로 SheetTable로 적재 (없는 시트는 키 없음)"""
+    return {name: SheetTable.from_rows(name, rows) for name, rows in iter_sheets(path, sheet_names)}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+output.json 시트 스키마 감지
+- 시트 앞부분 행 표본에서 ID 열(접두어가 가장 많이 나오는 열)과 의미 열(헤더 이름)을 한 번만 찾음
+- 이후 행은 감지한 열 이름으로 바로 조회 (행마다 모든 값을 훑지 않음)
+- 감지 결과는 시트 지문(시트명 + 표본 헤더 집합)으로 메모리/디스크에 캐시
+- 헤더가 같아도 ID 열이 바뀔 수 있으므로, 캐시한 ID 열이 표본에서도 ID가 가장 많은 열일 때만 재사용
+- 행은 dict 또는 items()/get()을 가진 행 뷰(SheetRow) 모두 가능
+
+사용법
+    schema, rows = detect_from_rows(path, IA_SHEET, rows)
+    for row in rows:
+        item = schema.extract(row)
+"""
+
+import itertools
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from prd_cache import cache_dir_for, cache_enabled, content_digest, load_entry, store_entry
+from sheet_loader import IA_SHEET, SPM_SHEET
+
+SCHEMA_CACHE_VERSION = 1
+# ID 열이 확정될 때까지 볼 최대 행 수와, 확정에 필요한 최소 ID 개수
+SAMPLE_LIMIT = 200
+MIN_ID_HITS = 3
+
+
+@dataclass(frozen=True)
+class SchemaSpec:
+    """시트 의미 정의: ID 필드/접두어와 의미 필드별 헤더 후보(앞쪽 우선)"""
+    id_field: str
+    id_prefix: str
+    fields: Dict[str, Tuple[str, ...]]
+
+
+IA_SPEC = SchemaSpec(
+    id_field='func_id',
+    id_prefix='Seller-ia-front-',
+    fields={
+        'screen_id': ('화면 ID',),
+        'func_definition': ('기능 정의',),
+        'category': ('카테고리',),
+        'depth1': ('Depth 1',),
+        'depth2': ('Depth 2',),
+        'depth3': ('Depth 3',),
+        'policy_id': ('관련 정책 ID',),
+        'importance': ('중요도',),
+        'implementation_target': ('구현 대상',),
+    },
+)
+SPM_SPEC = SchemaSpec(
+    id_field='policy_id',
+    id_prefix='dealer-sp-',
+    fields={
+        'policy_intro': ('정책 소개',),
+        'policy_content': ('정책 내용',),
+        'policy_category': ('정책분류',),
+        'detail_item': ('세부 항목',),
+    },
+)
+SHEET_SPECS = {IA_SHEET: IA_SPEC, SPM_SHEET: SPM_SPEC}
+
+
+@dataclass
+class SheetSchema:
+    sheet: str
+    fingerprint: str
+    spec: SchemaSpec
+    id_column: Optional[str] = None
+    columns: Dict[str, str] = field(default_factory=dict)  # 의미 필드 → 열 이름
+
+    def row_id(self, row) -> Optional[str]:
+        """행의 ID (ID 열 값이 접두어로 시작하지 않으면 None)"""
+        if self.id_column is None:
+            return None
+        value = row.get(self.id_column)
+        if isinstance(value, str) and value.startswith(self.spec.id_prefix):
+            return value
+        return None
+
+    def extract(self, row, fields: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """ID가 있는 행을 {ID 필드, 의미 필드...} 항목으로 변환 (fields: 포함할 의미 필드와 순서)"""
+        row_id = self.row_id(row)
+        if row_id is None:
+            return None
+        item = {self.spec.id_field: row_id}
+        for name in (self.spec.fields if fields is None else fields):
+            column = self.columns.get(name)
+            item[name] = row.get(column, '') if column else ''
+        return item
+
+
+_schema_memo: Dict[str, SheetSchema] = {}
+
+
+def sheet_fingerprint(sheet_name: str, sample: List[Dict]) -> str:
+    headers = sorted({key for row in sample for key, _ in row.items()})
+    return content_digest('\x1f'.join([sheet_name] + headers).encode('utf-8'))
+
+
+def _id_hits(sample: List[Dict], prefix: str) -> Counter:
+    """열별로 접두어로 시작하는 값의 개수"""
+    hits = Counter()
+    for row in sample:
+        for key, value in row.items():
+            if isinstance(value, str) and value.startswith(prefix):
+                hits[key] += 1
+    return hits
+
+
+def _fits_sample(schema: SheetSchema, sample: List[Dict]) -> bool:
+    """캐시한 스키마의 ID 열이 표본에서 다시 감지해도 나올 열인지"""
+    hits = _id_hits(sample, schema.spec.id_prefix)
+    if schema.id_column is None:
+        return not hits
+    return hits[schema.id_column] > 0 and hits[schema.id_column] == max(hits.values())
+
+
+def detect_schema(sheet_name: str, sample: List[Dict], spec: SchemaSpec) -> SheetSchema:
+    """표본 행에서 ID 열과 의미 열 감지"""
+    schema = SheetSchema(sheet=sheet_name, fingerprint=sheet_fingerprint(sheet_name, sample), spec=spec)
+
+    hits = _id_hits(sample, spec.id_prefix)
+    if hits:
+        schema.id_column = hits.most_common(1)[0][0]
+
+    headers = {key for row in sample for key, _ in row.items()}
+    for name, candidates in spec.fields.items():
+        # 표본에 없는 헤더는 첫 후보를 그대로 사용 (뒤쪽 행에만 있는 열도 조회되도록)
+        schema.columns[name] = next((candidate for candidate in candidates if candidate in headers), candidates[0])
+    return schema
+
+
+def _sample(rows: Iterator[Dict], prefix: str) -> List[Dict]:
+    """ID가 MIN_ID_HITS개 나오거나 SAMPLE_LIMIT행이 될 때까지 앞부분 행 수집"""
+    sample = []
+    id_count = 0
+    for row in rows:
+        sample.append(row)
+        if any(isinstance(value, str) and value.startswith(prefix) for _, value in row.items()):
+            id_count += 1
+        if id_count >= MIN_ID_HITS or len(sample) >= SAMPLE_LIMIT:
+            break
+    return sample
+
+
+def detect_from_rows(path: str, sheet_name: str, rows: Iterable[Dict],
+                     spec: Optional[SchemaSpec] = None) -> Tuple[SheetSchema, Iterator[Dict]]:
+    """
+    행 스트림 앞부분으로 스키마를 정하고 (스키마, 표본을 포함한 전체 행 iterator) 반환
+    - 같은 지문의 스키마는 메모리 → 디스크 캐시 순으로 재사용 (ID 열이 표본과 맞지 않으면 다시 감지)
+    """
+    spec = spec or SHEET_SPECS[sheet_name]
+    rows = iter(rows)
+    sample = _sample(rows, spec.id_prefix)
+    fingerprint = sheet_fingerprint(sheet_name, sample)
+
+    schema = _schema_memo.get(fingerprint)
+    if schema is None and cache_enabled():
+        cached = load_entry(cache_dir_for(path), f"sheet_schema-v{SCHEMA_CACHE_VERSION}-{fingerprint}.pickle")
+        if isinstance(cached, SheetSchema) and cached.spec == spec:
+            schema = cached
+    if schema is None or schema.spec != spec or not _fits_sample(schema, sample):
+        schema = detect_schema(sheet_name, sample, spec)
+        if cache_enabled():
+            store_entry(cache_dir_for(path), f"sheet_schema-v{SCHEMA_CACHE_VERSION}-{fingerprint}.pickle", schema)
+    _schema_memo[fingerprint] = schema
+
+    return schema, itertools.chain(sample, rows)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 설정
+- 스크립트 모듈(old/*.py)을 바로 import할 수 있도록 경로 추가
+- 파싱 디스크 캐시는 끄고 실행 (테스트 입력 옆에 .prd_cache를 만들지 않음)
+- write_workbook: 공유 문자열/인라인 문자열 셀로 된 최소 .xlsx 작성
+"""
+
+import os
+import sys
+import zipfile
+from xml.sax.saxutils import escape
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+@pytest.fixture(autouse=True)
+def _no_disk_cache(monkeypatch):
+    monkeypatch.setenv('PRD_CACHE', '0')
+
+
+def _column_letters(index: int) -> str:
+    letters = ''
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def write_workbook(path, sheets, inline=False):
+    """
+    sheets: {시트명: [[셀, ...], ...]} (행 번호는 1부터, None은 빈 셀)
+    - str: 공유 문자열 (inline=True면 인라인 문자열)
+    - tuple: 서식 있는 텍스트 조각 (인라인 문자열)
+    - int/float: 숫자 셀
+    """
+    shared = []
+    shared_index = {}
+    parts = {}
+    for number, (name, rows) in enumerate(sheets.items(), 1):
+        xml_rows = []
+        for row_no, row in enumerate(rows, 1):
+            cells = []
+            for col_no, value in enumerate(row, 1):
+                ref = f"{_column_letters(col_no)}{row_no}"
+                if value is None:
+                    continue
+                if isinstance(value, tuple):
+                    runs = ''.join(f'<r><t xml:space="preserve">{escape(run)}</t></r>' for run in value)
+                    cells.append(f'<c r="{ref}" t="inlineStr"><is>{runs}</is></c>')
+                elif isinstance(value, str) and inline:
+                    cells.append(f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>')
+                elif isinstance(value, str):
+                    if value not in shared_index:
+                        shared_index[value] = len(shared)
+                        shared.append(value)
+                    cells.append(f'<c r="{ref}" t="s"><v>{shared_index[value]}</v></c>')
+                else:
+                    cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+            xml_rows.append(f'<row r="{row_no}">{"".join(cells)}</row>')
+        parts[f'xl/worksheets/sheet{number}.xml'] = (
+            f'<?xml version="1.0" encoding="UTF-8"?><worksheet xmlns="{_MAIN_NS}">'
+            f'<sheetData>{"".join(xml_rows)}</sheetData></worksheet>'
+        )
+
+    sheet_entries = ''.join(
+        f'<sheet name="{escape(name)}" sheetId="{number}" r:id="rId{number}"/>'
+        for number, name in enumerate(sheets, 1)
+    )
+    relationships = ''.join(
+        f'<Relationship Id="rId{number}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{number}.xml"/>'
+        for number in range(1, len(sheets) + 1)
+    )
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('xl/workbook.xml', (
+            f'<?xml version="1.0" encoding="UTF-8"?><workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f'<sheets>{sheet_entries}</sheets></workbook>'
+        ))
+        archive.writestr('xl/_rels/workbook.xml.rels', (
+            f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{_PACKAGE_REL_NS}">{relationships}</Relationships>'
+        ))
+        if shared:
+            archive.writestr('xl/sharedStrings.xml', (
+                f'<?xml version="1.0" encoding="UTF-8"?><sst xmlns="{_MAIN_NS}">'
+                + ''.join(f'<si><t xml:space="preserve">{escape(value)}</t></si>' for value in shared)
+                + '</sst>'
+            ))
+        for name, xml in parts.items():
+            archive.writestr(name, xml)
+    return path
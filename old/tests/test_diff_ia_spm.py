@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from conftest import write_workbook
+from diff_ia_spm import diff_items, diff_to_dict, diff_versions, index_items, item_digest
+
+OLD = [
+    {'func_id': 'IA-01', 'func_definition': '로그인', 'category': '회원'},
+    {'func_id': 'IA-02', 'func_definition': '회원가입'},
+    {'func_id': 'IA-03', 'func_definition': '탈퇴'},
+]
+
+
+def test_item_digest_ignores_key_order():
+    assert item_digest({'a': 1, 'b': '값'}) == item_digest({'b': '값', 'a': 1})
+    assert item_digest({'a': 1}) != item_digest({'a': 2})
+
+
+def test_index_items_numbers_duplicate_ids():
+    index = index_items(OLD + [{'func_id': 'IA-01', 'func_definition': '중복'}], 'func_id')
+
+    assert list(index) == ['IA-01', 'IA-02', 'IA-03', 'IA-01#2']
+
+
+def test_diff_items_reports_added_removed_and_changed_fields():
+    new = [
+        {'category': '회원', 'func_definition': '로그인', 'func_id': 'IA-01'},
+        {'func_id': 'IA-02', 'func_definition': '회원 가입', 'category': '회원'},
+        {'func_id': 'IA-04', 'func_definition': '검색'},
+    ]
+
+    diff = diff_items('IA 1.0', OLD, new, 'func_id')
+
+    assert (diff.added, diff.removed, diff.unchanged) == (['IA-04'], ['IA-03'], 1)
+    assert [(change.field, change.old, change.new) for change in diff.modified['IA-02']] == [
+        ('func_definition', '회원가입', '회원 가입'), ('category', '', '회원'),
+    ]
+    assert diff.changed_ids == ['IA-04', 'IA-02'] and diff.has_changes()
+    assert diff_to_dict([diff])['IA 1.0']['modified']['IA-02'][0] == {
+        'field': 'func_definition', 'old': '회원가입', 'new': '회원 가입',
+    }
+
+
+def test_diff_versions_of_two_workbooks(tmp_path):
+    header = ['기능 ID', '화면 ID', '기능 정의']
+    old_path = write_workbook(tmp_path / 'old.xlsx', {
+        'IA 1.0': [header, ['Seller-ia-front-01', 'Login', '로그인'], ['Seller-ia-front-02', 'Join', '가입']],
+        'SPM 1.0': [['정책 코드', '정책 내용'], ['dealer-sp-01', '환불 불가']],
+    })
+    new_path = write_workbook(tmp_path / 'new.xlsx', {
+        'IA 1.0': [header, ['Seller-ia-front-01', 'Login', '간편 로그인']],
+        'SPM 1.0': [['정책 코드', '정책 내용'], ['dealer-sp-01', '환불 불가']],
+    })
+
+    ia, spm = diff_versions(str(old_path), str(new_path))
+
+    assert ia.removed == ['Seller-ia-front-02'] and list(ia.modified) == ['Seller-ia-front-01']
+    assert not spm.has_changes() and spm.unchanged == 1
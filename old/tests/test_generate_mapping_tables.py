@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import generate_mapping_tables
+
+OLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_default_outputs_do_not_touch_committed_tables(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', [
+        'generate_mapping_tables.py',
+        '--prd', os.path.join(OLD_DIR, 'PRD_Phase1_2025-12-31.md'),
+        '--output-json', os.path.join(OLD_DIR, 'output.json'),
+    ])
+
+    generate_mapping_tables.main()
+
+    assert sorted(os.listdir(tmp_path)) == sorted([
+        generate_mapping_tables.DEFAULT_IA_TABLE,
+        generate_mapping_tables.DEFAULT_SPM_TABLE,
+    ])
+    ia_table = (tmp_path / generate_mapping_tables.DEFAULT_IA_TABLE).read_text(encoding='utf-8')
+    assert ia_table.startswith('# IA-PRD 매핑 테이블')
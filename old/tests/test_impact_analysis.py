@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import random
+from collections import deque
+
+import pytest
+
+from impact_analysis import ImpactIndex, build_graph, decision_scopes, iter_bits
+from prd_model import PRDDocument
+from trace_graph import TraceGraph
+
+PREFIXES = ('FLOW-', 'SCR-', 'FUNC-', 'ENT-', 'API-', 'D-P1-')
+
+
+def _bfs(graph, start, backward=False):
+    adjacency = {}
+    for source, target in graph.edges():
+        if backward:
+            source, target = target, source
+        adjacency.setdefault(source, []).append(target)
+    seen = set()
+    queue = deque(adjacency.get(start, ()))
+    while queue:
+        node_id = queue.popleft()
+        if node_id not in seen:
+            seen.add(node_id)
+            queue.extend(adjacency.get(node_id, ()))
+    seen.discard(start)
+    return sorted(seen, key=graph.index.__getitem__)
+
+
+def _random_graph(rng, nodes=24, edges=40):
+    ids = [f"{rng.choice(PREFIXES)}{number:02d}" for number in range(nodes)]
+    graph = TraceGraph()
+    for node_id in ids:
+        graph.node(node_id, defined=True)
+    for _ in range(edges):
+        graph.add_edge(rng.choice(ids), rng.choice(ids))
+    return graph, ids
+
+
+def _assert_matches_bfs(index):
+    for node_id in index.graph.ids:
+        assert index.depends_on(node_id) == _bfs(index.graph, node_id)
+        assert index.affected_by(node_id) == _bfs(index.graph, node_id, backward=True)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_reachability_matches_bfs_on_cyclic_graphs(seed):
+    graph, _ = _random_graph(random.Random(seed))
+
+    _assert_matches_bfs(ImpactIndex(graph))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_add_and_remove_match_rebuild(seed):
+    rng = random.Random(seed)
+    graph, ids = _random_graph(rng, edges=15)
+    index = ImpactIndex(graph)
+
+    for step in range(30):
+        source, target = rng.choice(ids), rng.choice(ids + [f"NFR-{step:04d}"])
+        index.add_edge(source, target)
+        ids = index.graph.ids
+        if step % 10 == 9:
+            index.remove_edge(*rng.choice(index.graph.edges()))
+    _assert_matches_bfs(index)
+
+
+def test_update_applies_only_edge_differences():
+    rng = random.Random(11)
+    graph, ids = _random_graph(rng, edges=20)
+    index = ImpactIndex(graph)
+
+    latest, _ = _random_graph(random.Random(11), edges=20)
+    latest.add_edge(ids[0], ids[1])
+    latest.add_edge(ids[2], 'NFR-0100')
+    assert index.update(latest)[1] == 0
+    _assert_matches_bfs(index)
+
+    pruned = TraceGraph()
+    for node_id in latest.ids:
+        pruned.node(node_id, defined=True)
+    for edge in latest.edges()[1:]:
+        pruned.add_edge(*edge)
+    assert index.update(pruned) == (0, 1)
+    _assert_matches_bfs(index)
+
+
+def test_kind_filter_and_unknown_ids():
+    graph = TraceGraph()
+    for source, target in (('FLOW-01', 'SCR-0001'), ('SCR-0001', 'FUNC-01'), ('FUNC-01', 'API-0101'),
+                           ('FUNC-01', 'ENT-01')):
+        graph.add_edge(source, target)
+    index = ImpactIndex(graph)
+
+    assert index.depends_on('FLOW-01', kinds=('apis', 'entities')) == ['API-0101', 'ENT-01']
+    assert index.affected_by('ENT-01', kinds=('flows',)) == ['FLOW-01']
+    assert list(iter_bits(0b10110)) == [1, 2, 4]
+    with pytest.raises(KeyError):
+        index.affected_by('FUNC-99')
+
+
+def test_decision_scope_edges_point_to_decisions():
+    document = PRDDocument(
+        "| 결정 ID | 결정 내용 | 영향 범위 |\n|---|---|---|\n"
+        "| D-P1-001 | 경매 전환 | `SCR-0300`, `FUNC-15`, FUNC-15 |\n"
+    )
+    scopes = decision_scopes(document)
+
+    index = ImpactIndex(build_graph({}, {}, scopes))
+
+    assert scopes == {'D-P1-001': ['SCR-0300', 'FUNC-15']}
+    assert index.affected_by('D-P1-001') == ['SCR-0300', 'FUNC-15']
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import pickle
+
+from issue_store import FIELDS, IssueRow, IssueStore
+from validate_prd_deep_check import Issue, Severity, new_issue_store
+
+ISSUES = [
+    Issue(Severity.HIGH, 'API 논리', '엔드포인트 중복', 'POST /cars 중복', 'API Registry', ['API-0101', 'API-0102'], '하나로 통합'),
+    Issue(Severity.MEDIUM, '추적성', 'Flow 열 ID 없음', '공통 — 한글 설명', 'Screen Registry', [], ''),
+    Issue(Severity.HIGH, '추적성', '도달 불가', '', '', ['SCR-0001'], '연결'),
+]
+
+
+def _store():
+    store = new_issue_store()
+    store.extend(ISSUES)
+    return store
+
+
+def test_round_trip_preserves_every_field():
+    store = _store()
+
+    assert len(store) == 3
+    assert list(store) == ISSUES
+    assert store[-1] == ISSUES[-1] and list(store[1:]) == ISSUES[1:]
+    assert store.fields(0) == tuple(getattr(ISSUES[0], name) for name in FIELDS)
+    assert list(pickle.loads(pickle.dumps(store))) == ISSUES
+
+
+def test_extend_from_store_and_default_row_factory():
+    copy = IssueStore()
+    copy.extend(_store())
+
+    assert copy[0] == IssueRow(*(getattr(ISSUES[0], name) for name in FIELDS))
+    assert copy.add(Severity.LOW, '기타', '규칙', '설명') == 3
+    assert copy.field(3, 'affected_ids') == [] and copy.field(3, 'location') == ''
+
+
+def test_grouping_by_coded_columns_keeps_first_seen_order():
+    store = _store()
+
+    assert store.count_by('severity') == {Severity.HIGH: 2, Severity.MEDIUM: 1}
+    assert {key: list(rows) for key, rows in store.rows_by('category').items()} == {'API 논리': [0], '추적성': [1, 2]}
+    assert list(store.select('severity', Severity.HIGH, Severity.LOW)) == [0, 2]
+    assert list(store.select('severity', Severity.HIGH, rows=[1, 2])) == [2]
+    assert store.count_by('category', rows=[1]) == {'추적성': 1}
+
+
+def test_shared_strings_are_stored_once():
+    store = _store()
+    store.extend(ISSUES)
+
+    assert store.strings.count('API-0101') == 1
+    assert store.rows([4]) == [ISSUES[1]]
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import os
+
+import item_snapshot
+from item_snapshot import BuiltTables, Snapshot, SnapshotRow, load_items, write_snapshot
+
+TABLES = {
+    'ia_items': [
+        {'func_id': 'FUNC-01', 'func_definition': '로그인', 'empty_fields': ['비고']},
+        {'func_id': 'FUNC-02', 'category': '회원'},
+    ],
+    'spm_items': [{'policy_id': 'POL-01', 'policy_intro': None}],
+}
+
+
+def _source(tmp_path, text='{}'):
+    source = tmp_path / 'output.json'
+    source.write_text(text, encoding='utf-8')
+    return str(source)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / 'items.prdsnap')
+    write_snapshot(path, TABLES)
+
+    with item_snapshot.open_snapshot(path) as snapshot:
+        assert {name: [dict(row) for row in table] for name, table in snapshot.tables.items()} == TABLES
+        assert snapshot['ia_items'].value('category', 0) is None
+
+
+def test_rows_are_lazy_views(tmp_path):
+    path = str(tmp_path / 'items.prdsnap')
+    write_snapshot(path, TABLES)
+
+    with item_snapshot.open_snapshot(path) as snapshot:
+        table = snapshot['ia_items']
+        first, second = table[0], table[-1]
+
+        assert isinstance(first, SnapshotRow)
+        assert snapshot._decoded == {}
+        assert first['func_id'] == 'FUNC-01'
+        assert first['empty_fields'] == ['비고']
+        assert 'category' not in first and second.get('category') == '회원'
+        assert [row['func_id'] for row in table[:1]] == ['FUNC-01']
+        assert [dict(row) for row in table] == TABLES['ia_items']
+
+
+def test_load_items_builds_once_then_reads_snapshot(tmp_path):
+    source = _source(tmp_path)
+    path = str(tmp_path / 'output.prdsnap')
+    calls = []
+
+    def build(file_path):
+        calls.append(file_path)
+        return TABLES
+
+    with load_items(source, build, path) as tables:
+        assert isinstance(tables, Snapshot)
+        assert tables['spm_items'][0]['policy_intro'] is None
+    with load_items(source, build, path) as tables:
+        assert len(tables['ia_items']) == 2
+
+    assert calls == [source]
+
+
+def test_load_items_rebuilds_when_source_changes(tmp_path):
+    source = _source(tmp_path)
+    path = str(tmp_path / 'output.prdsnap')
+    with load_items(source, lambda _: TABLES, path):
+        pass
+
+    # 크기와 수정 시각이 같아도 내용이 바뀌면 다시 만듦
+    stat = os.stat(source)
+    with open(source, 'w', encoding='utf-8') as file:
+        file.write('[]')
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    rebuilt = {'ia_items': [{'func_id': 'FUNC-09'}], 'spm_items': []}
+
+    with load_items(source, lambda _: rebuilt, path) as tables:
+        assert [row['func_id'] for row in tables['ia_items']] == ['FUNC-09']
+
+
+def test_load_items_falls_back_to_built_tables(tmp_path):
+    source = _source(tmp_path)
+    path = str(tmp_path / 'missing' / 'output.prdsnap')
+
+    with load_items(source, lambda _: TABLES, path) as tables:
+        assert isinstance(tables, BuiltTables)
+        assert tables['ia_items'] == TABLES['ia_items']
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import random
+
+from keyword_index import KeywordIndex
+
+REGISTRY = {
+    'FUNC-01': {'name': '차량 등록'},
+    'FUNC-02': {'name': '차량 판매 방식 변경'},
+    'FUNC-03': {'name': '경매 등록'},
+    'FUNC-04': {'name': ''},
+}
+
+
+def _index():
+    return KeywordIndex.from_registry(REGISTRY, lambda owner, data: data['name'].split())
+
+
+def test_contained_in_matches_substrings():
+    index = _index()
+
+    assert index.contained_in('경매 차량을 등록') == ['경매', '차량', '등록']
+    assert index.owners['차량'] == ['FUNC-01', 'FUNC-02']
+
+
+def test_rank_prefers_rare_keywords_then_registry_order():
+    candidates = _index().rank('차량 경매')
+
+    assert [candidate.id for candidate in candidates] == ['FUNC-03', 'FUNC-01', 'FUNC-02']
+    assert candidates[0].keywords == ('경매',)
+    assert candidates[1].score == candidates[2].score
+    assert _index().rank('무관한 문장') == []
+
+
+def test_index_lookups_agree_with_brute_force():
+    rng = random.Random(7)
+    alphabet = '가나다라 a'
+    keywords = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() for _ in range(60)} - {''}
+    index = KeywordIndex()
+    for number, keyword in enumerate(sorted(keywords)):
+        index.add(keyword, f'ID-{number % 7}')
+
+    for _ in range(200):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        found = index.contained_in(text)
+        assert sorted(found) == sorted(keyword for keyword in index.owners if keyword in text)
+        positions = [text.index(keyword) for keyword in found]
+        assert positions == sorted(positions)  # 처음 나타나는 위치 순서
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import itertools
+
+import pytest
+
+from near_duplicates import MinHasher, NearDuplicateDetector, find_near_duplicates, jaccard, shingles
+
+BASE = '로그인 및 계정 식별에 사용할 이메일 주소를 입력한다'
+DOCUMENTS = {
+    'IA:01': BASE + '.',
+    'FUNC:01': BASE + '!',
+    'SPM:01': BASE + ' (필수).',
+    'IA:02': '차량 등록원부를 촬영하여 OCR로 차량 정보를 자동 입력한다.',
+    'IA:03': '짧음',
+}
+
+
+def test_near_identical_definitions_cluster_across_labels():
+    clusters = find_near_duplicates(DOCUMENTS, threshold=0.8)
+
+    assert [cluster.keys for cluster in clusters] == [['IA:01', 'FUNC:01', 'SPM:01']]
+    pairs = itertools.combinations(clusters[0].keys, 2)
+    assert clusters[0].similarity == round(min(jaccard(shingles(DOCUMENTS[a]), shingles(DOCUMENTS[b]))
+                                               for a, b in pairs), 4)
+
+
+def test_short_documents_are_skipped():
+    detector = NearDuplicateDetector()
+
+    assert detector.add('IA:03', DOCUMENTS['IA:03']) is False
+    assert 'IA:03' not in detector.shingle_sets
+
+
+def test_clustered_pairs_are_verified_by_exact_jaccard():
+    detector = NearDuplicateDetector(threshold=0.5)
+    for key, text in DOCUMENTS.items():
+        detector.add(key, text)
+
+    for cluster in detector.clusters():
+        for a, b in itertools.combinations(cluster.keys, 2):
+            assert jaccard(detector.shingle_sets[a], detector.shingle_sets[b]) >= 0.5
+    assert all(pair[0] != pair[1] for pair in detector.candidate_pairs())
+
+
+def test_minhash_is_deterministic_and_estimates_jaccard():
+    a, b = shingles(DOCUMENTS['IA:01']), shingles(DOCUMENTS['SPM:01'])
+    hasher = MinHasher(num_perm=256)
+
+    left, right = hasher.signature(a), hasher.signature(b)
+
+    assert left == MinHasher(num_perm=256).signature(a)
+    estimate = sum(x == y for x, y in zip(left, right)) / len(left)
+    assert estimate == pytest.approx(jaccard(a, b), abs=0.15)
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(num_perm=60, bands=16)
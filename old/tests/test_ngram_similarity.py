@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import math
+
+import pytest
+
+from ngram_similarity import NgramVectorizer, SimilarityIndex, char_ngrams, normalize_text
+
+CANDIDATES = {
+    'FUNC-01': '딜러 회원가입 계정 생성',
+    'FUNC-02': '차량 등록 및 등록원부 OCR',
+    'FUNC-03': '판매 방식 변경 (일반 → 경매)',
+    'FUNC-04': '딜러 회원가입 계정 생성',
+}
+
+
+def _dense_cosine(vectorizer, left, right):
+    a, b = vectorizer.transform_one(left), vectorizer.transform_one(right)
+    return sum(weight * b.get(index, 0.0) for index, weight in a.items())
+
+
+def test_char_ngrams_mark_word_boundaries():
+    assert normalize_text('OCR_인식, 등록!') == 'ocr 인식 등록'
+    assert char_ngrams('등록 원부', (2, 2)) == [' 등', '등록', '록 ', ' 원', '원부', '부 ']
+
+
+def test_vectors_are_l2_normalized():
+    vectorizer = NgramVectorizer().fit(CANDIDATES.values())
+
+    for text in CANDIDATES.values():
+        vector = vectorizer.transform_one(text)
+        assert math.sqrt(sum(weight * weight for weight in vector.values())) == pytest.approx(1.0)
+    assert vectorizer.transform_one('!!!') == {}
+
+
+def test_inverted_index_scores_equal_cosine_similarity():
+    index = SimilarityIndex(CANDIDATES)
+    query = '등록원부 OCR로 차량을 등록한다'
+
+    scores = index.scores(query)
+
+    for position, candidate_id in enumerate(index.ids):
+        expected = _dense_cosine(index.vectorizer, query, CANDIDATES[candidate_id])
+        assert scores.get(position, 0.0) == pytest.approx(expected)
+
+
+def test_top_k_orders_by_score_then_registration():
+    index = SimilarityIndex(CANDIDATES)
+
+    matches = index.top_k('딜러 계정 회원가입', k=2)
+
+    assert [match.id for match in matches] == ['FUNC-01', 'FUNC-04']
+    assert matches[0].score == matches[1].score > 0
+    assert index.top_k('딜러 계정 회원가입', k=3, min_score=0.99) == []
+    assert index.top_k_matrix({'q': '경매 전환'}, k=1) == {'q': index.top_k('경매 전환', k=1)}
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from conftest import write_workbook
+from parse_output_json import parse_output_json
+
+
+def test_workbook_with_real_id_headers(tmp_path):
+    path = write_workbook(tmp_path / 'IA_SPM.xlsx', {
+        'IA 1.0': [
+            ['IA 1.0'],
+            [('기능', ' ID'), '화면 ID', '기능 정의', '관련 정책 ID'],
+            ['Seller-ia-front-join-01', 'SignUp', '이메일 주소를 입력한다.', 'dealer-sp-user-01'],
+            ['Seller-ia-front-join-02', 'SignUp', '비밀번호를 입력한다.', None],
+            ['메모', None, '항목이 아닌 행', None],
+        ],
+        'SPM 1.0': [
+            ['정책 코드', '정책 내용', '카테고리'],
+            ['dealer-sp-user-01', '이메일은 중복될 수 없다.', '회원'],
+        ],
+    })
+
+    result = parse_output_json(str(path))
+
+    assert [item['func_id'] for item in result['ia_items']] == ['Seller-ia-front-join-01', 'Seller-ia-front-join-02']
+    assert result['ia_items'][0]['func_definition'] == '이메일 주소를 입력한다.'
+    assert result['ia_items'][1]['policy_id'] == ''
+    assert result['spm_items'] == [{
+        'policy_id': 'dealer-sp-user-01',
+        'policy_content': '이메일은 중복될 수 없다.',
+        'category': '회원',
+        'empty_fields': [],
+    }]
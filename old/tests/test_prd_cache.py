@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import os
+
+from prd_cache import cached_parse
+
+
+def _counting_parser(calls):
+    def parser(path):
+        calls.append(path)
+        with open(path, encoding='utf-8') as f:
+            return {'text': f.read()}
+    return parser
+
+
+def test_cached_parse_reuses_result_until_content_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv('PRD_CACHE', '1')
+    monkeypatch.setenv('PRD_CACHE_DIR', str(tmp_path / 'cache'))
+    source = tmp_path / 'prd.md'
+    source.write_text('# 첫 버전', encoding='utf-8')
+    calls = []
+    parser = _counting_parser(calls)
+
+    assert cached_parse(str(source), 'test', parser) == {'text': '# 첫 버전'}
+    assert cached_parse(str(source), 'test', parser) == {'text': '# 첫 버전'}
+    assert len(calls) == 1
+
+    source.write_text('# 둘째 버전', encoding='utf-8')
+    assert cached_parse(str(source), 'test', parser) == {'text': '# 둘째 버전'}
+    assert len(calls) == 2
+    assert len(os.listdir(tmp_path / 'cache')) == 1  # 이전 내용의 항목은 정리
+
+
+def test_cached_parse_version_and_namespace_are_separate_entries(tmp_path, monkeypatch):
+    monkeypatch.setenv('PRD_CACHE', '1')
+    monkeypatch.setenv('PRD_CACHE_DIR', str(tmp_path / 'cache'))
+    source = tmp_path / 'prd.md'
+    source.write_text('내용', encoding='utf-8')
+    calls = []
+    parser = _counting_parser(calls)
+
+    cached_parse(str(source), 'test', parser)
+    cached_parse(str(source), 'test', parser, version=2)
+    cached_parse(str(source), 'other', parser)
+
+    assert len(calls) == 3
+
+
+def test_cached_parse_disabled_and_corrupt_entries(tmp_path, monkeypatch):
+    monkeypatch.setenv('PRD_CACHE_DIR', str(tmp_path / 'cache'))
+    source = tmp_path / 'prd.md'
+    source.write_text('내용', encoding='utf-8')
+    calls = []
+    parser = _counting_parser(calls)
+
+    cached_parse(str(source), 'test', parser)  # PRD_CACHE=0 (conftest)
+    assert not (tmp_path / 'cache').exists()
+
+    monkeypatch.setenv('PRD_CACHE', '1')
+    cached_parse(str(source), 'test', parser)
+    for name in os.listdir(tmp_path / 'cache'):
+        (tmp_path / 'cache' / name).write_bytes(b'not a pickle')
+    assert cached_parse(str(source), 'test', parser) == {'text': '내용'}
+    assert len(calls) == 3
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+
+from prd_model import PRDDocument, match_heading, split_chunks, split_table_row
+
+DOCUMENT = """# PRD
+
+## 1. 개요
+
+| 필드명 | 내용 |
+|---|---|
+| 목적 | 딜러 매입 |
+
+```markdown
+# 코드 안의 헤딩
+| 코드 | 표 |
+```
+
+## 2. Screen Registry
+
+| Screen ID | 화면명 | Flow |
+|---|---|---|
+| SCR-0001 | 로그인 | FLOW-01 |
+| SCR-0002 | 홈 | FLOW-01, FLOW-02 |
+"""
+
+
+def test_headings_tables_and_code_blocks_in_one_pass():
+    document = PRDDocument(DOCUMENT)
+
+    assert [(heading.level, heading.text, heading.line) for heading in document.headings] == [
+        (1, 'PRD', 1), (2, '1. 개요', 3), (2, '2. Screen Registry', 14),
+    ]
+    assert [(block.lang, block.line) for block in document.code_blocks] == [('markdown', 9)]
+    assert [table.header for table in document.tables] == [['필드명', '내용'], ['Screen ID', '화면명', 'Flow']]
+    assert document.tables[0].fields() == {'목적': '딜러 매입'}
+    assert document.tables[1].rows[1] == ['SCR-0002', '홈', 'FLOW-01, FLOW-02']
+    assert document.tables[1].row_lines == [18, 19]
+
+
+def test_table_offsets_point_into_content():
+    document = PRDDocument(DOCUMENT)
+
+    for table in document.tables:
+        assert document.content[table.offset:table.end].startswith('| ')
+        assert document.content[table.end - 1] == '\n'
+        assert document.headings[table.heading].offset < table.offset
+
+
+def test_split_table_row_strips_outer_pipes():
+    assert split_table_row('| a |  b | |') == ['a', 'b', '']
+    assert split_table_row('a | b') == ['a', 'b']
+
+
+SECTIONED = """# PRD
+
+## 3. 기능
+
+### FUNC-01: 로그인
+
+본문 FUNC-01
+
+### FUNC-02: 회원가입
+
+## 결정 D-P1-001
+
+### 결정 D-P1-002: 단일 계정
+"""
+
+
+def test_sections_by_title_with_or_without_number_and_by_id():
+    document = PRDDocument(SECTIONED)
+
+    assert document.section('3. 기능') is document.section('기능')
+    assert document.section('FUNC-01').text == 'FUNC-01: 로그인'
+    assert document.section('D-P1-002').level == 3
+    assert document.section('없는 섹션') is None
+    assert document.section_ids('FUNC-') == ['FUNC-01', 'FUNC-02']
+    assert document.section_ids('FUNC-', level=2) == []
+
+
+def test_section_ends_at_next_heading_of_same_or_higher_level():
+    document = PRDDocument(SECTIONED)
+    functions = document.section('기능')
+    login = document.section('FUNC-01')
+
+    assert document.section_text(login) == '### FUNC-01: 로그인\n\n본문 FUNC-01\n\n'
+    assert functions.end == SECTIONED.index('## 결정')
+    assert document.headings[0].end == len(SECTIONED)
+
+
+BOUND = """## Function Registry
+
+| 화면 | Function ID | 기능명 |
+|---|---|---|
+| SCR-0001 | FUNC-01 | 로그인 |
+| 공통 | 설명 행 |
+
+## 부록
+
+| Function ID | 기능명 |
+|---|---|
+| FUNC-09 | 부록 기능 |
+"""
+
+
+def test_records_bind_columns_by_header_name():
+    document = PRDDocument(BOUND)
+    columns = {'id': 'Function ID', 'name': '기능명'}
+
+    assert document.records(columns) == [
+        {'id': 'FUNC-01', 'name': '로그인'},
+        {'id': '설명 행', 'name': ''},
+        {'id': 'FUNC-09', 'name': '부록 기능'},
+    ]
+    assert [record['id'] for record in document.records(columns, key=re.compile(r'FUNC-\d+'))] == ['FUNC-01', 'FUNC-09']
+
+
+def test_records_limited_to_section_and_cached():
+    document = PRDDocument(BOUND)
+    columns = {'id': 'Function ID', 'name': '기능명'}
+    registry = document.section('Function Registry')
+
+    records = document.records(columns, section=registry)
+
+    assert [record['id'] for record in records] == ['FUNC-01', '설명 행']
+    assert document.records(columns, section=registry) is records
+    assert document.tables_with('Function ID', '화면') == [document.tables[0]]
+    assert [cells[0] for cells in document.rows(first_cell=re.compile(r'FUNC-\d+'))] == ['FUNC-09']
+
+
+CHUNKED = """# PRD
+
+| A | B |
+|---|---|
+| a1 | b1 |
+## 두 번째
+| C | D |
+|---|---|
+| c1 |
+| c2 | d2 | extra |
+
+```
+## 코드 안 헤딩
+```
+### 세 번째
+본문
+"""
+
+
+def _tokens(document):
+    return ([(h.level, h.text, h.line, h.offset, h.end) for h in document.headings],
+            [(t.header, t.rows, t.line, t.offset, t.end, t.heading, t.row_lines) for t in document.tables],
+            [(b.lang, b.line, b.offset, b.end) for b in document.code_blocks])
+
+
+def test_split_chunks_at_headings_outside_code_fences():
+    chunks = split_chunks(CHUNKED)
+
+    assert [CHUNKED[start:end].splitlines()[0] for start, end in chunks] == ['# PRD', '## 두 번째', '### 세 번째']
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(CHUNKED)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(chunks, chunks[1:]))
+
+
+def test_table_ending_at_chunk_boundary_does_not_absorb_next_chunk():
+    document = PRDDocument(CHUNKED)
+
+    first, second = document.tables
+    assert first.rows == [['a1', 'b1']] and first.heading == 0
+    assert CHUNKED[first.end:].startswith('## 두 번째')
+    assert second.header == ['C', 'D'] and second.heading == 1
+    # 셀 수가 다른 행도 다른 행과 섞이지 않음
+    assert second.rows == [['c1'], ['c2', 'd2', 'extra']]
+    assert second.row_lines == [9, 10]
+
+
+def test_chunk_cache_retokenizes_only_changed_chunks():
+    cache = {}
+    PRDDocument(CHUNKED, cache)
+    edited = CHUNKED.replace('| c1 |', '| c1 | d1 |')
+
+    document = PRDDocument(edited, cache)
+
+    assert document.reparsed_chunks == 1
+    assert _tokens(document) == _tokens(PRDDocument(edited))
+    assert document.tables[1].rows[0] == ['c1', 'd1']
+
+
+def test_chunk_cache_shifts_positions_of_reused_chunks():
+    cache = {}
+    PRDDocument(CHUNKED, cache)
+    edited = CHUNKED.replace('| a1 | b1 |', '| a1 | b1 |\n| a2 | b2 |')
+
+    document = PRDDocument(edited, cache)
+
+    assert document.reparsed_chunks == 1
+    assert _tokens(document) == _tokens(PRDDocument(edited))
+    assert document.section('세 번째').line == 16
+
+
+def test_from_file_incremental_reuses_chunks_across_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv('PRD_CACHE', '1')
+    monkeypatch.setenv('PRD_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'prd.md'
+    path.write_text(CHUNKED, encoding='utf-8')
+
+    assert PRDDocument.from_file_incremental(str(path)).reparsed_chunks == 3
+    assert PRDDocument.from_file_incremental(str(path)).reparsed_chunks == 0
+
+    path.write_text(CHUNKED.replace('본문', '바뀐 본문'), encoding='utf-8')
+    assert PRDDocument.from_file_incremental(str(path)).reparsed_chunks == 1
+
+
+REFERENCES = """# PRD
+
+## FUNC-01: 로그인
+`SCR-0001`에서 FUNC-01 호출
+## 부록
+D-P1-001, FUNC-01
+"""
+
+
+def test_id_references_scanned_once_with_positions():
+    document = PRDDocument(REFERENCES)
+    references = document.id_references()
+
+    assert references is document.id_references()
+    assert references.ids() == ['FUNC-01', 'SCR-0001', 'D-P1-001']
+    assert references.ids('FUNC') == ['FUNC-01']
+    assert references.by_type() == {'FUNC': {'FUNC-01'}, 'SCR': {'SCR-0001'}, 'D-P1': {'D-P1-001'}}
+    assert references.count('FUNC-01') == 3 and len(references) == 5
+    assert 'API-0001' not in references and references.first('API-0001') is None
+
+
+def test_id_occurrence_line_column_and_section():
+    document = PRDDocument(REFERENCES)
+
+    occurrences = list(document.id_references().occurrences('FUNC-01'))
+
+    assert [(item.line, item.column) for item in occurrences] == [(3, 4), (4, 14), (6, 11)]
+    assert [item.section.text for item in occurrences] == ['FUNC-01: 로그인', 'FUNC-01: 로그인', '부록']
+    assert REFERENCES[occurrences[2].offset:].startswith('FUNC-01')
+
+
+def test_section_span_points_into_document_buffer():
+    document = PRDDocument(REFERENCES)
+    login = document.section('FUNC-01')
+
+    span = document.section_span(login)
+
+    assert span.buffer is document.content
+    assert (span.start, span.end) == (login.offset, login.end)
+    assert span.text == document.section_text(login) == '## FUNC-01: 로그인\n`SCR-0001`에서 FUNC-01 호출\n'
+    assert 'SCR-0001' in span and '부록' not in span
+    assert span.find('FUNC-01') == REFERENCES.index('FUNC-01')
+
+
+def test_span_search_stays_within_bounds():
+    document = PRDDocument(REFERENCES)
+    span = document.section_span(document.section('FUNC-01'))
+    pattern = re.compile(r'FUNC-\d+')
+
+    assert [match.start() for match in span.finditer(pattern)] == [
+        REFERENCES.index('FUNC-01'), REFERENCES.index('FUNC-01 호출'),
+    ]
+    sub_span = span.sub_span(span.find('`'), len(REFERENCES))
+    assert sub_span.end == span.end and sub_span.search(pattern).group() == 'FUNC-01'
+    assert len(document.span(0, 5)) == 5 and str(document.span(0, 5)) == '# PRD'
+    assert [table.offset for table in document.tables_in(span.start, span.end)] == []
+
+
+def test_match_heading_strips_closing_hashes_and_trailing_space():
+    assert match_heading('## 2. 기능 ##  \n') == (2, '2. 기능')
+    assert match_heading('# C#') == (1, 'C')
+    assert match_heading('### ###') == (3, '#')
+    assert match_heading('#제목') is None and match_heading('#   ') is None and match_heading('####### 7') is None
+
+
+def test_long_whitespace_heading_parses_in_linear_time():
+    def parse_seconds(width):
+        content = '# 개요\n\n' + ('# 제목' + ' ' * width + 'x\n' + '## 공백' + ' ' * width + '\n') * 5
+        started = time.perf_counter()
+        document = PRDDocument(content)
+        elapsed = time.perf_counter() - started
+        assert [heading.text for heading in document.headings[1:3]] == ['제목' + ' ' * width + 'x', '공백']
+        return elapsed
+
+    parse_seconds(1000)  # 워밍업
+    small, large = parse_seconds(20000), parse_seconds(80000)
+
+    assert large < 1.0
+    assert large < small * 16  # 폭이 4배일 때 이차 시간(16배)보다 충분히 작음
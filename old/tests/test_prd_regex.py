@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import re
+import threading
+import time
+
+import pytest
+
+import prd_regex
+from prd_model import PRDDocument
+
+# 역추적이 지수적으로 늘어나는 패턴 (a가 20개 이상이면 예산보다 충분히 오래 걸림)
+CATASTROPHIC = r'(a+)+$'
+
+
+def test_compile_returns_backend_pattern(monkeypatch):
+    monkeypatch.setenv('PRD_REGEX_BACKEND', 're')
+    prd_regex.compile.cache_clear()
+
+    pattern = prd_regex.compile(r'FUNC-\d+')
+
+    assert isinstance(pattern, re.Pattern)
+    assert pattern.findall('`FUNC-01`, FUNC-02') == ['FUNC-01', 'FUNC-02']
+
+
+class _FakeRe2:
+    """lookbehind를 거부하는 re2 대역 (받은 패턴을 기록)"""
+
+    def __init__(self):
+        self.compiled = []
+
+    def compile(self, pattern):
+        if '(?<' in pattern:
+            raise ValueError('invalid perl operator: (?<')
+        self.compiled.append(pattern)
+        return re.compile(pattern)
+
+
+@pytest.fixture
+def fake_re2(monkeypatch):
+    fake = _FakeRe2()
+    monkeypatch.setattr(prd_regex, 're2', fake)
+    monkeypatch.setattr(prd_regex, 'FALLBACK_PATTERNS', {})
+    monkeypatch.delenv('PRD_REGEX_BACKEND', raising=False)
+    prd_regex.compile.cache_clear()
+    yield fake
+    prd_regex.compile.cache_clear()
+
+
+def test_re_flags_map_to_re2_inline_flags(fake_re2, recwarn):
+    pattern = prd_regex.compile(r'^func-\d+$', re.IGNORECASE | re.MULTILINE)
+
+    assert fake_re2.compiled == [r'(?im)^func-\d+$']
+    assert pattern.findall('FUNC-01\nfunc-02') == ['FUNC-01', 'func-02']
+    assert prd_regex.budgeted(r'a.b', re.DOTALL).backend == 're2' and fake_re2.compiled[-1] == '(?s)a.b'
+    assert not recwarn.list and prd_regex.FALLBACK_PATTERNS == {}
+
+
+def test_fallback_to_re_warns_and_is_recorded(fake_re2):
+    with pytest.warns(RuntimeWarning, match='선형 시간 보장 없음'):
+        lookbehind = prd_regex.compile(r'(?<=ID-)\d+')
+    with pytest.warns(RuntimeWarning, match='VERBOSE'):
+        verbose = prd_regex.budgeted(r'\d+  # 숫자', re.VERBOSE)
+
+    assert isinstance(lookbehind, re.Pattern) and verbose.backend == 're'
+    assert sorted(prd_regex.FALLBACK_PATTERNS) == [r'(?<=ID-)\d+', r'\d+  # 숫자']
+
+
+def test_budgeted_pattern_without_scan_behaves_like_pattern():
+    pattern = prd_regex.budgeted(r'SCR-(\d+)')
+
+    assert pattern.fullmatch('SCR-0001').group(1) == '0001'
+    assert [match.group() for match in pattern.finditer('SCR-1 SCR-2')] == ['SCR-1', 'SCR-2']
+    assert pattern.sub('X', 'SCR-1 a') == 'X a'
+
+
+def test_scan_budget_is_on_by_default(monkeypatch):
+    monkeypatch.delenv('PRD_REGEX_BUDGET', raising=False)
+
+    with prd_regex.scan() as scan:
+        assert scan.active and scan.budget == prd_regex.DEFAULT_BUDGET > 0
+
+
+def test_scan_without_budget_is_a_no_op(monkeypatch):
+    monkeypatch.setenv('PRD_REGEX_BUDGET', '0')
+
+    with prd_regex.scan() as scan:
+        assert prd_regex.budgeted(r'\d+').findall('1 2') == ['1', '2']
+        assert not scan.active
+
+
+def test_scan_budget_interrupts_backtracking_and_reports_line():
+    pattern = prd_regex.budgeted(CATASTROPHIC)
+    text = 'ok\n' + 'a' * 26 + 'b\nok'
+
+    with pytest.raises(prd_regex.RegexBudgetExceeded) as info:
+        with prd_regex.scan(0.05):
+            pattern.search(text)
+
+    assert info.value.pattern == CATASTROPHIC
+    assert info.value.line_no == 2
+    assert info.value.line == 'a' * 26 + 'b'
+
+
+def test_scan_budget_is_checked_after_call_off_main_thread():
+    pattern = prd_regex.budgeted(CATASTROPHIC)
+    raised = []
+
+    def worker():
+        try:
+            with prd_regex.scan(0.01):
+                pattern.match('a' * 20 + 'b')
+        except prd_regex.RegexBudgetExceeded as exc:
+            raised.append(exc)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert len(raised) == 1 and raised[0].line == 'a' * 20 + 'b'
+
+
+def test_document_scan_parses_long_whitespace_heading_quickly(monkeypatch):
+    monkeypatch.setenv('PRD_REGEX_BUDGET', '0.5')
+    heading = '# 제목' + ' ' * 3000 + 'x'
+
+    started = time.perf_counter()
+    document = PRDDocument('# 개요\n\n본문\n\n' + heading + '\n')
+
+    assert time.perf_counter() - started < 0.5
+    assert document.headings[-1].text == '제목' + ' ' * 3000 + 'x'
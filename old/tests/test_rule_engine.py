@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import os
+
+from rule_engine import Rule, RulePlan, render
+from validate_prd_deep_check import RULE_CHECKS, RULES, Issue, PRDDeepValidator
+
+RULE_SET = [
+    Rule('check_a', 'item', 'High', '형식', 'A1', '{id} 형식 오류', affected=('id',),
+         predicate=lambda record, context: not record['id'].startswith('FUNC-')),
+    Rule('check_b', 'item', 'Low', '참조', 'B1', lambda record, context: f"{context['prefix']}{record['id']}"),
+    Rule('check_a', 'link', 'Medium', '형식', 'A2', '{source}→{target}',
+         affected=lambda record, context: [record['source'], record['target']]),
+    Rule('check_c', 'item', 'Low', '기타', 'C1', '{id}'),
+]
+EVENTS = [
+    ('item', {'id': 'X-1'}),
+    ('link', {'source': 'X-1', 'target': 'FUNC-02'}),
+    ('item', {'id': 'FUNC-02'}),
+    ('unused', {'id': 'Z'}),
+]
+
+
+def _evaluate(checks):
+    plan = RulePlan.compile(RULE_SET, checks)
+    return plan, plan.evaluate(iter(EVENTS), {'prefix': '참조 '}, Issue)
+
+
+def test_issues_follow_event_order_then_declaration_order():
+    _, found = _evaluate(['check_b', 'check_a'])
+
+    assert list(found) == ['check_b', 'check_a']
+    assert [issue.rule for issue in found['check_a']] == ['A1', 'A2']
+    assert [issue.description for issue in found['check_b']] == ['참조 X-1', '참조 FUNC-02']
+    assert [issue.affected_ids for issue in found['check_a']] == [['X-1'], ['X-1', 'FUNC-02']]
+
+
+def test_plan_keeps_only_selected_checks_and_their_selectors():
+    plan, found = _evaluate(['check_c'])
+
+    assert plan.selectors == frozenset({'item'})
+    assert [issue.description for issue in found['check_c']] == ['X-1', 'FUNC-02']
+    assert RulePlan.compile(RULE_SET).checks == ['check_a', 'check_b', 'check_c']
+    assert render('{id}!', {'id': 'A'}, None) == 'A!'
+
+
+def test_one_pass_rules_match_running_each_check_alone():
+    old_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    validator = PRDDeepValidator(os.path.join(old_dir, 'PRD_Phase1_2025-12-31.md'), '')
+    validator.parse_prd()
+
+    together = validator.run_rules(RULE_CHECKS)
+
+    for check in RULE_CHECKS:
+        assert list(together[check]) == list(validator.run_rules([check])[check])
+    assert sum(len(issues) for issues in together.values()) > 0
+    assert {rule.check for rule in RULES} == set(RULE_CHECKS)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from validate_prd_deep_check import CHECK_INPUTS, PRDDeepValidator
+
+OLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _parsed():
+    validator = PRDDeepValidator(os.path.join(OLD_DIR, 'PRD_Phase1_2025-12-31.md'), os.path.join(OLD_DIR, 'output.json'))
+    validator.parse_prd()
+    validator.parse_output_json()
+    return validator
+
+
+@pytest.fixture(scope='module')
+def sequential():
+    validator = _parsed()
+    results = validator.run_checks()
+    return validator, {name: list(issues) for name, issues in results.items()}
+
+
+@pytest.mark.parametrize('executor,jobs', [('thread', 1), ('thread', 4), ('process', 2)])
+def test_parallel_checks_merge_in_check_order(sequential, executor, jobs):
+    expected_validator, expected = sequential
+    validator = _parsed()
+
+    results = validator.run_checks_parallel(CHECK_INPUTS, jobs, executor)
+
+    assert list(results) == list(CHECK_INPUTS)
+    assert {name: list(issues) for name, issues in results.items()} == expected
+    assert list(validator.issues) == list(expected_validator.issues)
+
+
+def test_parallel_subset_keeps_requested_order():
+    names = ['check_api_logic', 'check_id_format', 'check_near_duplicates']
+    validator = _parsed()
+    expected = _parsed().run_checks(names)
+
+    results = validator.run_checks_parallel(names, 3)
+
+    assert list(results) == names
+    assert [list(results[name]) for name in names] == [list(expected[name]) for name in names]
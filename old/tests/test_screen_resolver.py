@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import json
+
+from screen_resolver import BKTree, ScreenResolver, edit_distance, load_synonyms, split_words
+
+SCREENS = {
+    'SCR-0002': {'name': '회원가입(딜러)'},
+    'SCR-0103': {'name': '판매 내역'},
+    'SCR-0104': {'name': '정산 내역'},
+    'SCR-0600': {'name': '탁송 예약/배차'},
+}
+SYNONYMS = {
+    'join': ('회원가입',),
+    'social': ('회원가입',),
+    'trade': ('판매',),
+    'delivery': ('탁송',),
+    'settle': ('정산',),
+    'history': ('내역',),
+}
+
+
+def _resolver(**options):
+    return ScreenResolver.from_registry(SCREENS, synonyms=SYNONYMS, **options)
+
+
+def test_split_words():
+    assert split_words('BizOCRResult') == ['biz', 'ocr', 'result']
+
+
+def test_every_word_translated_resolves_with_full_confidence():
+    match = _resolver().resolve('SettleHistory')
+
+    assert (match.screen_id, match.confidence, match.key) == ('SCR-0104', 1.0, '정산내역')
+
+
+def test_stop_word_does_not_inflate_confidence():
+    # 'check'/'confirm'/'date'는 번역하지 않지만 분모에 포함되어 한 단어만 옮긴 ID는 질의가 되지 않음
+    resolver = _resolver()
+
+    assert resolver.translations('SocialCheck') == []
+    assert resolver.resolve('SocialCheck') is None
+    assert resolver.resolve('TradeConfirm') is None
+    assert resolver.resolve('DeliveryDate') is None
+
+
+def test_min_matched_words_is_configurable():
+    resolver = _resolver(min_matched_words=1)
+
+    assert resolver.translations('JoinEmail') == [('회원가입', 0.5)]
+    assert resolver.resolve('JoinEmail').screen_id == 'SCR-0002'
+    assert resolver.resolve('SocialCheck').confidence == 0.5
+
+
+def test_synonym_file_entries_come_first(tmp_path, monkeypatch):
+    path = tmp_path / 'synonyms.json'
+    path.write_text(json.dumps({'Trade': ['거래'], 'Settle': '정산 관리'}, ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setenv('PRD_SCREEN_SYNONYMS', str(path))
+
+    synonyms = load_synonyms()
+
+    assert synonyms['trade'][0] == '거래'
+    assert synonyms['settle'] == ('정산 관리', '정산')
+    assert 'upload' not in synonyms and 'handover' not in synonyms
+
+
+def test_bk_tree_search_matches_brute_force():
+    words = ['정산내역', '정산상세', '판매내역', '탁송예약', '배차', '회원가입', '회원가입딜러']
+    tree = BKTree()
+    for word in words:
+        tree.add(word)
+
+    for query in ('정산내역', '정산', '판매상세', '회원'):
+        for tolerance in range(4):
+            expected = sorted((edit_distance(query, word), word) for word in words
+                              if edit_distance(query, word) <= tolerance)
+            assert sorted(tree.search(query, tolerance)) == expected
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+import pytest
+
+from sheet_loader import SheetTable, _StreamReader, iter_sheets, load_sheet_tables
+
+SHEETS = {
+    'fileName': 'IA.xlsx',
+    'sheets': [
+        {'name': 'IA 1.0', 'data': [{'Column1': 'FUNC-01', '기능': '로그인 ' * 20}, {'Column1': 12345678}]},
+        {'data': [{'정책': '환불'}], 'name': 'SPM 1.0'},
+        {'name': '빈 시트', 'data': []},
+    ],
+}
+
+
+def _write(tmp_path, document, text=None):
+    path = tmp_path / 'output.json'
+    path.write_text(text if text is not None else json.dumps(document, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64])
+def test_stream_reader_decodes_values_split_across_reads(chunk_size):
+    text = ' [ "긴 문자열 값", 1234567890, {"키": [1.5, null, true]}, -0.25 ] '
+    reader = _StreamReader(io.StringIO(text), chunk_size=chunk_size)
+
+    reader.expect('[')
+    values = []
+    while reader.next_item(']'):
+        values.append(reader.value())
+
+    assert values == json.loads(text)
+    assert reader.peek() == ''
+
+
+def test_stream_reader_reports_structure_errors():
+    reader = _StreamReader(io.StringIO('[1]'), chunk_size=1)
+
+    with pytest.raises(ValueError, match="'{' 위치에 '\\['"):
+        reader.expect('{')
+
+
+def _rows(path, sheet_names=None):
+    return [(name, row) for name, rows in iter_sheets(path, sheet_names) for row in rows]
+
+
+def test_iter_sheets_filters_sheets_and_handles_data_before_name(tmp_path):
+    path = _write(tmp_path, SHEETS)
+
+    assert [name for name, _ in _rows(path)] == ['IA 1.0', 'IA 1.0', 'SPM 1.0']
+    assert _rows(path, ['SPM 1.0']) == [('SPM 1.0', {'정책': '환불'})]
+
+
+def test_iter_sheets_stops_after_requested_sheets(tmp_path):
+    text = json.dumps({'sheets': SHEETS['sheets'][:1]}, ensure_ascii=False)
+    path = _write(tmp_path, None, text[:-2] + ', {"name": "깨진 시트", "data": [')
+
+    rows = [row for _, row in _rows(path, ['IA 1.0'])]
+
+    assert rows == SHEETS['sheets'][0]['data']
+
+
+def test_iter_sheets_skips_unconsumed_rows_and_keeps_empty_sheets(tmp_path):
+    path = _write(tmp_path, SHEETS)
+
+    seen = []
+    for name, rows in iter_sheets(path):
+        seen.append((name, next(rows, None) if name == 'SPM 1.0' else None))
+
+    assert seen == [('IA 1.0', None), ('SPM 1.0', {'정책': '환불'}), ('빈 시트', None)]
+
+
+def test_iter_sheets_skips_byte_order_mark(tmp_path):
+    path = _write(tmp_path, None, '\ufeff' + json.dumps(SHEETS, ensure_ascii=False))
+
+    assert [name for name, _ in _rows(path, ['SPM 1.0'])] == ['SPM 1.0']
+
+
+ROWS = [
+    {'Column1': 'FUNC-01', 'Column2': '', '기능': '로그인', '비고': []},
+    {'Column1': 'FUNC-02', '기능': '', '비고': [], '추가': '값'},
+    {'Column1': 'FUNC-03', 'Column2': '', '기능': '로그인'},
+]
+
+
+def test_sheet_table_prunes_always_empty_columns():
+    table = SheetTable.from_rows('IA 1.0', ROWS)
+
+    assert len(table) == 3
+    assert table.column_order == ['Column1', 'Column2', '기능', '비고', '추가']
+    assert table.columns == ['Column1', '기능', '추가']
+    assert table.empty_columns == ['Column2', '비고']
+    assert 'Column2' not in table.data and table.data['추가'] == [None, '값', None]
+    # 반복 문자열은 같은 객체로 공유
+    assert table.data['기능'][0] is table.data['기능'][2]
+
+
+def test_sheet_rows_read_like_the_original_dicts():
+    table = SheetTable.from_rows('IA 1.0', ROWS)
+    first, second, third = table.rows()
+
+    assert first['Column1'] == 'FUNC-01' and first.get('Column2') == ''
+    assert second.get('Column2', '없음') == '없음' and 'Column2' not in second
+    assert third.get('비고') is None
+    assert dict(second.items()) == {'Column1': 'FUNC-02', '기능': '', '추가': '값'}
+
+
+def test_sheet_rows_empty_fields_follow_column_order():
+    table = SheetTable.from_rows('IA 1.0', ROWS)
+
+    assert [row.empty_count() for row in table.rows()] == [2, 2, 1]
+    assert [row.empty_fields() for row in table.rows()] == [['Column2', '비고'], ['기능', '비고'], ['Column2']]
+
+
+def test_load_sheet_tables_reads_requested_sheets_once(tmp_path):
+    path = _write(tmp_path, SHEETS)
+
+    tables = load_sheet_tables(path, ['IA 1.0', '빈 시트', '없는 시트'])
+
+    assert sorted(tables) == ['IA 1.0', '빈 시트']
+    assert tables['IA 1.0'].row(1).get('Column1') == 12345678 and len(tables['빈 시트']) == 0
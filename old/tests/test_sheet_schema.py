@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import sheet_schema
+from sheet_loader import IA_SHEET, SPM_SHEET, SheetTable
+from sheet_schema import IA_SPEC, detect_from_rows, detect_schema
+
+IA_ROWS = [
+    {'Column1': 'IA 1.0', 'Column3': '화면 ID', '기능 정의': ''},
+    {'Column1': '', 'Column3': 'Seller-ia-front-001', '화면 ID': 'Login', '기능 정의': '로그인', '참고': 'Seller-ia-front-x'},
+    {'Column3': 'Seller-ia-front-002', '화면 ID': 'Join', '기능 정의': '회원가입'},
+    {'Column3': '비고 행', '기능 정의': '설명'},
+]
+
+
+def test_detect_schema_picks_column_with_most_prefixed_ids():
+    schema = detect_schema(IA_SHEET, IA_ROWS, IA_SPEC)
+
+    assert schema.id_column == 'Column3'
+    assert schema.columns['screen_id'] == '화면 ID' and schema.columns['category'] == '카테고리'
+    assert [schema.row_id(row) for row in IA_ROWS] == [None, 'Seller-ia-front-001', 'Seller-ia-front-002', None]
+
+
+def test_extract_builds_items_for_id_rows_only():
+    schema = detect_schema(IA_SHEET, IA_ROWS, IA_SPEC)
+
+    assert schema.extract(IA_ROWS[3]) is None
+    assert schema.extract(IA_ROWS[1], ['screen_id', 'func_definition', 'category']) == {
+        'func_id': 'Seller-ia-front-001', 'screen_id': 'Login', 'func_definition': '로그인', 'category': '',
+    }
+
+
+def test_extract_accepts_sheet_row_views():
+    table = SheetTable.from_rows(IA_SHEET, IA_ROWS)
+    schema, rows = detect_from_rows('output.json', IA_SHEET, table.rows())
+
+    items = [item for item in map(schema.extract, rows) if item]
+
+    assert [item['func_definition'] for item in items] == ['로그인', '회원가입']
+
+
+def test_detect_from_rows_returns_every_row_and_memoizes(monkeypatch):
+    monkeypatch.setattr(sheet_schema, 'MIN_ID_HITS', 1)
+    monkeypatch.setattr(sheet_schema, '_schema_memo', {})
+    calls = []
+    original = sheet_schema.detect_schema
+    monkeypatch.setattr(sheet_schema, 'detect_schema', lambda *args: calls.append(args) or original(*args))
+
+    first, rows = detect_from_rows('output.json', IA_SHEET, iter(IA_ROWS))
+    assert list(rows) == IA_ROWS
+    second, _ = detect_from_rows('output.json', IA_SHEET, iter(IA_ROWS))
+
+    assert second is first and len(calls) == 1
+    assert detect_from_rows('output.json', SPM_SHEET, iter(IA_ROWS))[0].id_column is None
+
+
+def test_cached_schema_is_redetected_when_id_column_moves(monkeypatch, tmp_path):
+    monkeypatch.setenv('PRD_CACHE', '1')
+    monkeypatch.setenv('PRD_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(sheet_schema, '_schema_memo', {})
+    moved = [{'Column1': row.get('Column3', ''), 'Column3': row.get('Column1', '')} for row in IA_ROWS]
+    original = [{'Column1': row.get('Column1', ''), 'Column3': row.get('Column3', '')} for row in IA_ROWS]
+
+    first, _ = detect_from_rows('output.json', IA_SHEET, original)
+    assert first.id_column == 'Column3'
+    # 헤더 집합(지문)은 같지만 ID가 다른 열로 옮겨 감: 메모리 캐시와 디스크 캐시 모두 다시 감지
+    assert detect_from_rows('output.json', IA_SHEET, moved)[0].id_column == 'Column1'
+    monkeypatch.setattr(sheet_schema, '_schema_memo', {})
+    assert detect_from_rows('output.json', IA_SHEET, original)[0].id_column == 'Column3'
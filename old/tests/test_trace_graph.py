@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from trace_graph import TraceGraph
+
+
+def _registries(**screen_flows):
+    return {
+        'flows': {'FLOW-01': {}, 'FLOW-02': {}},
+        'screens': {screen_id: {'flow': flow} for screen_id, flow in screen_flows.items()},
+        'functions': {'FUNC-01': {'related_screens': '`SCR-0001`, `SCR-0002`'}, 'FUNC-02': {'related_screens': '-'}},
+    }
+
+
+def test_flow_cell_without_id_is_recorded_not_raised():
+    graph = TraceGraph.from_prd(_registries(**{'SCR-0001': '공통'}), {})
+
+    assert graph.unresolved == [('SCR-0001', 'flow', '공통')]
+    assert [edge for edge in graph.edges() if edge[1] == 'SCR-0001'] == []
+    assert graph.unreachable('screens') == ['SCR-0001']
+
+
+def test_flow_cell_with_several_ids_adds_one_edge_per_id():
+    graph = TraceGraph.from_prd(_registries(**{'SCR-0001': '`FLOW-01`, FLOW-02'}), {})
+
+    assert ('FLOW-01', 'SCR-0001') in graph.edges()
+    assert ('FLOW-02', 'SCR-0001') in graph.edges()
+    assert 'FLOW-01, FLOW-02' not in graph.index
+    assert graph.unresolved == []
+
+
+def test_placeholder_cells_are_not_unresolved():
+    graph = TraceGraph.from_prd(_registries(**{'SCR-0001': 'FLOW-01', 'SCR-0002': ''}), {})
+
+    assert graph.unresolved == []
+    assert ('SCR-0002', 'FUNC-01') in graph.edges()
+
+
+def test_traceability_queries():
+    mappings = {
+        'screen_to_function': {'SCR-0001': ['FUNC-01']},
+        'function_to_api': {'FUNC-01': ['API-0101']},
+    }
+    registries = _registries(**{'SCR-0001': 'FLOW-01', 'SCR-0002': ''})
+    registries['apis'] = {'API-0101': {}, 'API-0102': {}}
+    graph = TraceGraph.from_prd(registries, mappings)
+
+    assert graph.unreachable('screens') == ['SCR-0002']
+    assert graph.without_successors('functions', ('entities', 'apis')) == ['FUNC-02']
+    assert graph.orphans('apis') == ['API-0102']
+    assert graph.find_cycle() is None
+
+    graph.add_edge('FUNC-01', 'SCR-0001')
+    cycle = graph.find_cycle()
+    assert cycle[0] == cycle[-1] and {'SCR-0001', 'FUNC-01'} <= set(cycle)
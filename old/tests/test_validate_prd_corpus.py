@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import os
+
+from issue_store import IssueStore
+from validate_prd_corpus import generate_corpus_report, validate_corpus, validate_document
+from validate_prd_deep_check import CHECK_INPUTS, PRDDeepValidator, Severity
+
+OLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRD_PATH = os.path.join(OLD_DIR, 'PRD_Phase1_2025-12-31.md')
+OUTPUT_JSON = os.path.join(OLD_DIR, 'output.json')
+
+
+def _checked_validator():
+    validator = PRDDeepValidator(PRD_PATH, OUTPUT_JSON)
+    validator.parse_prd()
+    validator.parse_output_json()
+    return validator
+
+
+def test_run_checks_defaults_to_every_check_in_order():
+    one_pass = _checked_validator()
+    one_by_one = _checked_validator()
+
+    results = one_pass.run_checks()
+    for name in CHECK_INPUTS:
+        one_by_one.run_check(name)
+
+    assert list(results) == list(CHECK_INPUTS)
+    assert list(one_pass.issues) == list(one_by_one.issues)
+
+
+def test_document_result_keeps_issue_store():
+    expected = _checked_validator()
+    expected.run_checks()
+
+    result = validate_document(PRD_PATH, OUTPUT_JSON)
+
+    assert result.error is None
+    assert isinstance(result.issues, IssueStore)
+    assert list(result.issues) == list(expected.issues)
+    assert result.severity_count(Severity.HIGH) == expected.issues.count_by('severity').get(Severity.HIGH, 0)
+
+
+def test_corpus_reports_missing_document_as_error():
+    results = validate_corpus([PRD_PATH, 'missing.md'], OUTPUT_JSON, jobs=1)
+
+    assert results[0].error is None and len(results[1].issues) == 0
+    assert results[1].error.startswith('FileNotFoundError')
+    assert '| missing.md | ' in generate_corpus_report(results, OUTPUT_JSON)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from validate_prd_deep_check import PRDDeepValidator
+
+
+def _validator(**screen_flows):
+    validator = PRDDeepValidator('', '')
+    validator.registries['flows'] = {'FLOW-01': {}, 'FLOW-02': {}}
+    validator.registries['screens'] = {screen_id: {'flow': flow} for screen_id, flow in screen_flows.items()}
+    return validator
+
+
+def test_traceability_reports_flow_cell_without_id():
+    validator = _validator(**{'SCR-0001': '공통'})
+
+    validator.check_traceability()
+
+    rules = [issue.rule for issue in validator.issues]
+    assert 'Flow 열 ID 없음' in rules
+    assert 'Flow에서 도달 불가한 Screen' in rules
+
+
+def test_cross_references_check_each_flow_id_in_cell():
+    validator = _validator(**{'SCR-0001': 'FLOW-01, FLOW-99', 'SCR-0002': '공통'})
+
+    found = validator.run_rules(['check_cross_references'])['check_cross_references']
+
+    assert [issue.affected_ids for issue in found] == [['SCR-0001', 'FLOW-99']]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+from validate_prd_deep_check import CHECK_INPUTS, PRDDeepValidator
+from watch_prd_deep_check import DeepCheckWatcher, issue_key
+
+OLD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DECISION_ROW = '| D-P1-001 | 일반 판매 → 경매 전환 가능 |'
+VERSION_HEADING = '### v2.12 (2025-12-31)'
+
+
+def _copy_inputs(tmp_path):
+    prd_path = str(tmp_path / 'prd.md')
+    output_json_path = str(tmp_path / 'output.json')
+    shutil.copy(os.path.join(OLD_DIR, 'PRD_Phase1_2025-12-31.md'), prd_path)
+    shutil.copy(os.path.join(OLD_DIR, 'output.json'), output_json_path)
+    return prd_path, output_json_path
+
+
+def _full_run(prd_path, output_json_path):
+    validator = PRDDeepValidator(prd_path, output_json_path)
+    validator.parse_prd()
+    validator.parse_output_json()
+    validator.run_checks()
+    return [issue_key(issue) for issue in validator.issues]
+
+
+def test_refresh_reruns_only_checks_whose_inputs_changed(tmp_path):
+    prd_path, output_json_path = _copy_inputs(tmp_path)
+    watcher = DeepCheckWatcher(prd_path, output_json_path)
+
+    rerun, added, resolved = watcher.refresh()
+    assert rerun == list(CHECK_INPUTS) and resolved == []
+    assert watcher.refresh(prd_changed=False, output_json_changed=False) == ([], [], [])
+
+    with open(prd_path, encoding='utf-8') as f:
+        content = f.read()
+    assert DECISION_ROW in content
+    with open(prd_path, 'w', encoding='utf-8') as f:
+        f.write(content.replace(DECISION_ROW, '| D-P1-001 | 판매 방식은 경매로만 전환 |'))
+    rerun, _, _ = watcher.refresh(prd_changed=True, output_json_changed=False)
+
+    assert 'check_cross_validation' in rerun
+    assert 'check_api_logic' not in rerun and 'check_near_duplicates' not in rerun
+    assert [issue_key(issue) for issue in watcher.validator.issues] == _full_run(prd_path, output_json_path)
+
+
+def test_refresh_reruns_cross_references_when_enclosing_heading_is_renamed(tmp_path):
+    prd_path, output_json_path = _copy_inputs(tmp_path)
+    watcher = DeepCheckWatcher(prd_path, output_json_path)
+    watcher.refresh()
+
+    with open(prd_path, encoding='utf-8') as f:
+        content = f.read()
+    assert VERSION_HEADING in content
+    # 길이가 같은 이름 변경: 본문 ID 참조 위치는 그대로이고 이슈 위치의 섹션 이름만 바뀜
+    with open(prd_path, 'w', encoding='utf-8') as f:
+        f.write(content.replace(VERSION_HEADING, VERSION_HEADING.replace('12-31', '12-30')))
+    rerun, _, _ = watcher.refresh(prd_changed=True, output_json_changed=False)
+
+    assert 'check_cross_references' in rerun and 'check_near_duplicates' not in rerun
+    assert [issue_key(issue) for issue in watcher.validator.issues] == _full_run(prd_path, output_json_path)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from conftest import write_workbook
+from sheet_loader import iter_sheets
+from xlsx_loader import _column_index, is_workbook, iter_workbook_sheets
+
+SHEETS = {
+    'IA 1.0': [
+        ['IA 1.0'],
+        [('기능', ' ID'), '화면 ID', None, '화면 ID'],
+        ['Seller-ia-front-01', 'Login', '중간 값', None, '헤더 밖 값'],
+        [],
+        ['Seller-ia-front-02', 3.0, None, 1.5],
+    ],
+    'SPM 1.0': [
+        ['정책 코드', '정책 내용'],
+        ['dealer-sp-01', '<환불> & 취소'],
+    ],
+}
+
+EXPECTED_IA = [
+    {'기능 ID': 'Seller-ia-front-01', '화면 ID': 'Login', 'Column3': '중간 값', 'Column4': '', 'Column5': '헤더 밖 값'},
+    {'기능 ID': 'Seller-ia-front-02', '화면 ID': '3', 'Column3': '', 'Column4': '1.5'},
+]
+
+
+def _read(path, sheet_names=None):
+    return {name: list(rows) for name, rows in iter_workbook_sheets(str(path), sheet_names)}
+
+
+@pytest.mark.parametrize('inline', [False, True])
+def test_shared_and_inline_strings_read_the_same_rows(tmp_path, inline):
+    path = write_workbook(tmp_path / 'IA_SPM.xlsx', SHEETS, inline=inline)
+
+    sheets = _read(path)
+
+    assert sheets['IA 1.0'] == EXPECTED_IA
+    assert sheets['SPM 1.0'] == [{'정책 코드': 'dealer-sp-01', '정책 내용': '<환불> & 취소'}]
+
+
+def test_requested_sheets_only_and_sheet_loader_dispatch(tmp_path):
+    path = write_workbook(tmp_path / 'IA_SPM.xlsx', SHEETS)
+
+    assert list(_read(path, ['SPM 1.0'])) == ['SPM 1.0']
+    assert is_workbook(str(path)) and not is_workbook('output.json')
+    assert [name for name, rows in iter_sheets(str(path)) for _ in rows] == ['IA 1.0', 'IA 1.0', 'SPM 1.0']
+
+
+def test_column_index_from_cell_reference():
+    assert [_column_index(reference) for reference in ('A1', 'Z9', 'AA10', 'ab12')] == [1, 26, 27, 28]
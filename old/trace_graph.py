@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 추적성 그래프 (Flow → Screen → Function → Entity/API/NFR)
+- Registry ID와 매핑 테이블/Registry 참조 열에 나온 ID를 정수 노드 번호로 변환
+- 간선은 CSR(압축 인접 배열)로 보관: offsets[i]..offsets[i+1] 구간의 targets가 노드 i의 후속 노드
+  (역방향 CSR도 함께 만들어 선행 노드 조회도 O(차수))
+- 고아 노드, 도달 불가 노드, 특정 종류의 후속 노드가 없는 노드, 순환 탐지는 모두 O(V+E) 한 번의 순회
+
+사용법
+    graph = TraceGraph.from_prd(validator.registries, validator.mappings)
+    graph.unreachable('screens')                              # Flow에서 도달할 수 없는 Screen ID
+    graph.without_successors('functions', ('entities', 'apis'))  # Entity/API가 없는 Function ID
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import prd_regex
+
+# 노드 종류 (Registry 이름)와 ID 접두어
+KINDS = ('flows', 'screens', 'functions', 'entities', 'apis', 'nfrs', 'decisions')
+KIND_PREFIXES = (
+    ('FLOW-', 'flows'),
+    ('SCR-', 'screens'),
+    ('FUNC-', 'functions'),
+    ('ENT-', 'entities'),
+    ('API-', 'apis'),
+    ('NFR-', 'nfrs'),
+    ('D-P1-', 'decisions'),
+)
+# 추적 방향 (상위 → 하위 종류)
+TRACE_LEVELS: Dict[str, Tuple[str, ...]] = {
+    'flows': ('screens',),
+    'screens': ('functions',),
+    'functions': ('entities', 'apis', 'nfrs'),
+}
+
+_KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+FLOW_ID_RE = prd_regex.compile(r'FLOW-\d+')
+SCREEN_ID_RE = prd_regex.compile(r'SCR-\d+')
+
+
+def kind_of(node_id: str) -> Optional[str]:
+    """ID 접두어로 노드 종류 판별 (알 수 없으면 None)"""
+    for prefix, kind in KIND_PREFIXES:
+        if node_id.startswith(prefix):
+            return kind
+    return None
+
+
+def _compress(count: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """(출발, 도착) 간선 목록 → (offsets, targets) CSR (출발 노드별 간선은 추가 순서 유지)"""
+    offsets = array('I', [0]) * (count + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(count):
+        offsets[i + 1] += offsets[i]
+    targets = array('I', [0]) * len(edges)
+    cursor = offsets[:-1]
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
+
+
+class TraceGraph:
+    def __init__(self):
+        self.ids: List[str] = []               # 노드 번호 → ID
+        self.index: Dict[str, int] = {}        # ID → 노드 번호
+        self.kinds = array('B')                # 노드 번호 → KINDS 순번
+        self.defined = bytearray()             # Registry에 정의된 노드면 1
+        self._edges: List[Tuple[int, int]] = []
+        self._edge_set = set()
+        self.unresolved: List[Tuple[str, str, str]] = []   # (노드 ID, 열 이름, ID가 없는 셀 값)
+        self._forward: Optional[Tuple[array, array]] = None
+        self._backward: Optional[Tuple[array, array]] = None
+
+    @classmethod
+    def from_prd(cls, registries: Dict[str, Dict], mappings: Dict[str, Dict]) -> 'TraceGraph':
+        """
+        Registry 정의 노드 + 간선
+        - Screen Registry의 Flow 열, Function Registry의 관련 화면 열
+        - FLOW → Screen, Screen → Function, Function → Entity/API/NFR 매핑 테이블
+        - 참조 열은 셀에서 ID만 추출 ('FLOW-01, FLOW-02'는 간선 두 개),
+          ID가 하나도 없는 셀('공통' 등)은 간선 없이 unresolved에 기록
+        """
+        graph = cls()
+        for kind in KINDS:
+            for node_id in registries.get(kind, {}):
+                graph.node(node_id, defined=True)
+
+        for screen_id, data in registries.get('screens', {}).items():
+            graph._add_cell_edges(FLOW_ID_RE, data.get('flow', ''), screen_id, 'flow')
+        for func_id, data in registries.get('functions', {}).items():
+            graph._add_cell_edges(SCREEN_ID_RE, data.get('related_screens', ''), func_id, 'related_screens')
+
+        for flow_id, screens in mappings.get('flow_to_screen', {}).items():
+            for screen_id, _ in screens:
+                graph.add_edge(flow_id, screen_id)
+        for name in ('screen_to_function', 'function_to_entity', 'function_to_api', 'function_to_nfr'):
+            for source, targets in mappings.get(name, {}).items():
+                for target in targets:
+                    graph.add_edge(source, target)
+        return graph
+
+    def _add_cell_edges(self, pattern, cell: str, node_id: str, column: str):
+        """참조 셀의 ID마다 ID → node_id 간선 추가 (ID가 없으면 unresolved에 기록)"""
+        source_ids = pattern.findall(cell)
+        for source_id in source_ids:
+            self.add_edge(source_id, node_id)
+        cell = cell.strip()
+        if not source_ids and cell and cell != '-':
+            self.unresolved.append((node_id, column, cell))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def node(self, node_id: str, defined: bool = False) -> int:
+        """ID의 노드 번호 (없으면 추가)"""
+        number = self.index.get(node_id)
+        if number is None:
+            kind = kind_of(node_id)
+            if kind is None:
+                raise ValueError(f"노드 종류를 알 수 없는 ID입니다: {node_id}")
+            number = self.index[node_id] = len(self.ids)
+            self.ids.append(node_id)
+            self.kinds.append(_KIND_CODES[kind])
+            self.defined.append(0)
+            self._forward = self._backward = None
+        if defined:
+            self.defined[number] = 1
+        return number
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """간선 추가 (이미 있으면 False)"""
+        edge = (self.node(source), self.node(target))
+        if edge in self._edge_set:
+            return False
+        self._edge_set.add(edge)
+        self._edges.append(edge)
+        self._forward = self._backward = None
+        return True
+
+    def remove_edge(self, source: str, target: str) -> bool:
+        """간선 제거 (없으면 False)"""
+        if source not in self.index or target not in self.index:
+            return False
+        edge = (self.index[source], self.index[target])
+        if edge not in self._edge_set:
+            return False
+        self._edge_set.discard(edge)
+        self._edges.remove(edge)
+        self._forward = self._backward = None
+        return True
+
+    def edges(self) -> List[Tuple[str, str]]:
+        """(출발 ID, 도착 ID) 간선 목록 (추가 순서)"""
+        return [(self.ids[source], self.ids[target]) for source, target in self._edges]
+
+    def csr(self, backward: bool = False) -> Tuple[array, array]:
+        """(offsets, targets) CSR 배열 (역방향이면 선행 노드 배열, 간선이 바뀐 뒤 처음 호출할 때 구축)"""
+        if self._forward is None:
+            self._forward = _compress(len(self.ids), self._edges)
+            self._backward = _compress(len(self.ids), [(target, source) for source, target in self._edges])
+        return self._backward if backward else self._forward
+
+    def successors(self, number: int) -> array:
+        offsets, targets = self.csr()
+        return targets[offsets[number]:offsets[number + 1]]
+
+    def predecessors(self, number: int) -> array:
+        offsets, sources = self.csr(backward=True)
+        return sources[offsets[number]:offsets[number + 1]]
+
+    def kind(self, number: int) -> str:
+        return KINDS[self.kinds[number]]
+
+    def nodes_of(self, kind: str, defined_only: bool = True) -> List[int]:
+        code = _KIND_CODES[kind]
+        return [number for number in range(len(self.ids))
+                if self.kinds[number] == code and (self.defined[number] or not defined_only)]
+
+    def reachable(self, sources: Iterable[int], backward: bool = False) -> bytearray:
+        """sources에서 간선(역방향이면 역간선)을 따라 도달 가능한 노드 표시 (BFS)"""
+        offsets, targets = self.csr(backward)
+        seen = bytearray(len(self.ids))
+        queue = deque()
+        for number in sources:
+            if not seen[number]:
+                seen[number] = 1
+                queue.append(number)
+        while queue:
+            number = queue.popleft()
+            for i in range(offsets[number], offsets[number + 1]):
+                target = targets[i]
+                if not seen[target]:
+                    seen[target] = 1
+                    queue.append(target)
+        return seen
+
+    def undefined(self) -> List[str]:
+        """간선에만 나오고 Registry에 정의되지 않은 ID"""
+        return [node_id for number, node_id in enumerate(self.ids) if not self.defined[number]]
+
+    def orphans(self, kind: str) -> List[str]:
+        """상위 종류에서 들어오는 간선이 없는 정의 노드 (예: 어떤 Screen에도 속하지 않은 Function)"""
+        parents = {_KIND_CODES[parent] for parent, children in TRACE_LEVELS.items() if kind in children}
+        return [self.ids[number] for number in self.nodes_of(kind)
+                if not any(self.kinds[source] in parents for source in self.predecessors(number))]
+
+    def unreachable(self, kind: str, root: str = 'flows') -> List[str]:
+        """root 종류의 정의 노드에서 도달할 수 없는 kind 정의 노드"""
+        seen = self.reachable(self.nodes_of(root))
+        return [self.ids[number] for number in self.nodes_of(kind) if not seen[number]]
+
+    def without_successors(self, kind: str, target_kinds: Iterable[str]) -> List[str]:
+        """target_kinds 종류의 후속 노드가 하나도 없는 kind 정의 노드"""
+        codes = {_KIND_CODES[target] for target in target_kinds}
+        return [self.ids[number] for number in self.nodes_of(kind)
+                if not any(self.kinds[target] in codes for target in self.successors(number))]
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """순환 하나를 ID 목록으로 반환 (없으면 None). 반복 DFS 3색 표시"""
+        offsets, targets = self.csr()
+        state = bytearray(len(self.ids))  # 0: 미방문, 1: 방문 중, 2: 완료
+        for start in range(len(self.ids)):
+            if state[start]:
+                continue
+            state[start] = 1
+            path = [start]
+            stack = [offsets[start]]
+            while stack:
+                number = path[-1]
+                position = stack[-1]
+                if position == offsets[number + 1]:
+                    state[number] = 2
+                    path.pop()
+                    stack.pop()
+                    continue
+                stack[-1] += 1
+                target = targets[position]
+                if state[target] == 1:
+                    return [self.ids[node] for node in path[path.index(target):]] + [self.ids[target]]
+                if state[target] == 0:
+                    state[target] = 1
+                    path.append(target)
+                    stack.append(offsets[target])
+        return None
+
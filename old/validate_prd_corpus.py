@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 코퍼스 심층점검 스크립트
+- old/ 폴더의 PRD 변형본/설계 문서를 프로세스 풀에서 병렬로 파싱·검증
+- 문서별 결과를 입력 순서대로 병합하여 하나의 리포트 작성 (문서별 요약 포함)
+
+사용법
+    python validate_prd_corpus.py [문서 ...] [--output-json output.json] [--jobs N] [--output PRD_코퍼스_점검_리포트.md]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from issue_store import IssueStore
+from validate_prd_deep_check import PRDDeepValidator, Severity, new_issue_store
+
+DEFAULT_CORPUS = [
+    'PRD_Phase1_2025-12-31.md',
+    'PRD_Phase1_2025-12-31 copy.md',
+    'PRD_Phase1_2025-12-31 copy 2.md',
+    'PRD_Phase1_2025-12-31_copy2_processed.md',
+    '통합_PRD.md',
+    '기술설계서.md',
+    '통합설계명세서_1.md',
+]
+DEFAULT_REPORT = 'PRD_코퍼스_점검_리포트.md'
+
+SEVERITIES = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]
+REGISTRY_LABELS = [
+    ('flows', 'Flow'),
+    ('screens', 'Screen'),
+    ('functions', 'Function'),
+    ('apis', 'API'),
+    ('entities', 'Entity'),
+    ('nfrs', 'NFR'),
+    ('decisions', 'Decision'),
+]
+
+
+@dataclass
+class DocumentResult:
+    path: str
+    registry_counts: Dict[str, int] = field(default_factory=dict)
+    ia_count: int = 0
+    spm_count: int = 0
+    issues: IssueStore = field(default_factory=new_issue_store)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    def severity_count(self, severity: Severity) -> int:
+        return self.issues.count_by('severity').get(severity, 0)
+
+
+def validate_document(prd_path: str, output_json_path: str) -> DocumentResult:
+    """문서 하나를 파싱·검증 (프로세스 풀 작업 단위, 실패해도 결과로 반환)"""
+    result = DocumentResult(path=prd_path)
+    started = time.perf_counter()
+    try:
+        validator = PRDDeepValidator(prd_path, output_json_path)
+        validator.parse_prd()
+        validator.parse_output_json()
+        validator.run_checks()
+        result.registry_counts = {name: len(registry) for name, registry in validator.registries.items()}
+        result.ia_count = len(validator.ia_items)
+        result.spm_count = len(validator.spm_items)
+        result.issues = validator.issues
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def validate_corpus(prd_paths: List[str], output_json_path: str, jobs: Optional[int] = None) -> List[DocumentResult]:
+    """문서들을 병렬 검증하고 입력 순서대로 결과 반환"""
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(prd_paths)) or 1
+    if jobs == 1:
+        return [validate_document(path, output_json_path) for path in prd_paths]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(validate_document, prd_paths, [output_json_path] * len(prd_paths)))
+
+
+def generate_corpus_report(results: List[DocumentResult], output_json_path: str) -> str:
+    """문서별 결과를 병합한 리포트"""
+    total_issues = sum(len(result.issues) for result in results)
+
+    report_lines = []
+    report_lines.append("# PRD 코퍼스 심층점검 리포트")
+    report_lines.append("")
+    report_lines.append(f"**검증 범위**: PRD/설계 문서 {len(results)}개 ↔ {output_json_path}")
+    report_lines.append(f"**전체 이슈**: {total_issues}개")
+    report_lines.append("")
+    report_lines.append("---")
+    report_lines.append("")
+
+    # 문서별 요약
+    report_lines.append("## 1. 문서별 요약")
+    report_lines.append("")
+    registry_header = ' | '.join(label for _, label in REGISTRY_LABELS)
+    severity_header = ' | '.join(severity.value for severity in SEVERITIES)
+    report_lines.append(f"| 문서 | {registry_header} | {severity_header} | 전체 |")
+    report_lines.append("|---|" + "---|" * (len(REGISTRY_LABELS) + len(SEVERITIES) + 1))
+    for result in results:
+        if result.error:
+            report_lines.append(f"| {result.path} | " + "- | " * (len(REGISTRY_LABELS) + len(SEVERITIES)) + "오류 |")
+            continue
+        registry_cells = ' | '.join(str(result.registry_counts.get(name, 0)) for name, _ in REGISTRY_LABELS)
+        severity_cells = ' | '.join(str(result.severity_count(severity)) for severity in SEVERITIES)
+        report_lines.append(f"| {result.path} | {registry_cells} | {severity_cells} | {len(result.issues)} |")
+    report_lines.append("")
+
+    # 분류별 통계 (문서 수/건수)
+    report_lines.append("## 2. 이슈 분류별 통계")
+    report_lines.append("")
+    report_lines.append("| 분류 | 해당 문서 수 | 건수 |")
+    report_lines.append("|---|---|---|")
+    category_documents = defaultdict(set)
+    category_counts = defaultdict(int)
+    for result in results:
+        for category, count in result.issues.count_by('category').items():
+            category_documents[category].add(result.path)
+            category_counts[category] += count
+    for category in sorted(category_counts):
+        report_lines.append(f"| {category} | {len(category_documents[category])}개 | {category_counts[category]}건 |")
+    report_lines.append("")
+
+    # 문서별 상세
+    report_lines.append("## 3. 문서별 점검 결과")
+    report_lines.append("")
+    for idx, result in enumerate(results, 1):
+        report_lines.append(f"### 3.{idx} {result.path}")
+        report_lines.append("")
+        if result.error:
+            report_lines.append(f"- **오류**: {result.error}")
+            report_lines.append("")
+            continue
+        report_lines.append(f"- IA 기능 항목 {result.ia_count}개, SPM 정책 항목 {result.spm_count}개 기준")
+        report_lines.append(f"- 이슈 {len(result.issues)}개")
+        report_lines.append("")
+        for severity in SEVERITIES:
+            severity_rows = result.issues.select('severity', severity)
+            if not severity_rows:
+                continue
+            report_lines.append(f"#### {severity.value} ({len(severity_rows)}건)")
+            report_lines.append("")
+            for issue in result.issues.rows(severity_rows[:20]):  # 최대 20개만
+                line = f"- **{issue.rule}**: {issue.description}"
+                if issue.location:
+                    line += f" ({issue.location})"
+                report_lines.append(line)
+            if len(severity_rows) > 20:
+                report_lines.append(f"- 외 {len(severity_rows) - 20}건")
+            report_lines.append("")
+
+    report_lines.append("---")
+    report_lines.append("")
+    report_lines.append("**검증 방법**: 자동화 스크립트 기반 규칙 검사 (문서별 병렬 실행)")
+
+    return '\n'.join(report_lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PRD 코퍼스 심층점검')
+    parser.add_argument('documents', nargs='*', default=DEFAULT_CORPUS, help='검증할 문서 (기본값: old/ PRD 코퍼스)')
+    parser.add_argument('--output-json', default='output.json', help='output.json 또는 IA/SPM 원본 엑셀(.xlsx) 경로')
+    parser.add_argument('--jobs', type=int, default=None, help='동시 프로세스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--output', default=DEFAULT_REPORT, help='리포트 경로')
+    args = parser.parse_args()
+
+    documents = [path for path in args.documents if os.path.exists(path)]
+    for path in args.documents:
+        if path not in documents:
+            print(f"경고: 파일을 찾을 수 없어 건너뜁니다: {path}")
+    if not documents:
+        print("검증할 문서가 없습니다.")
+        sys.exit(1)
+
+    print(f"{len(documents)}개 문서 검증 중...")
+    started = time.perf_counter()
+    results = validate_corpus(documents, args.output_json, args.jobs)
+    for result in results:
+        status = f"오류 ({result.error})" if result.error else f"이슈 {len(result.issues)}개"
+        print(f"   - {result.path}: {status} ({result.elapsed:.2f}초)")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(generate_corpus_report(results, args.output_json))
+
+    print(f"\n완료! ({time.perf_counter() - started:.2f}초) 리포트가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,50 @@ PRD 심층점검 스크립트 (디버깅 및 논리구성 확인)
 - PRD ↔ output.json 교차검증
 """
 
-import json
-import re
+import argparse
+import copy
 from collections import defaultdict
-from typing import Dict, List, Any, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+import prd_regex
+from prd_cache import cached_parse
+from sheet_loader import IA_SHEET, SPM_SHEET, iter_sheets
+from sheet_schema import detect_from_rows
+from keyword_index import Candidate, KeywordIndex
+from screen_resolver import ScreenMatch, ScreenResolver
+from near_duplicates import NearDuplicateDetector
+from trace_graph import TraceGraph
+from rule_engine import Rule, RulePlan
+from issue_store import IssueStore
+from prd_model import (
+    DOCUMENT_CACHE_VERSION,
+    PRDDocument,
+    API_REGISTRY_COLUMNS,
+    DECISION_COLUMNS,
+    FIELD_TABLE_HEADERS,
+    FLOW_REGISTRY_COLUMNS,
+    FLOW_SCREEN_COLUMNS,
+    FUNCTION_MAPPING_COLUMNS,
+    FUNCTION_REGISTRY_COLUMNS,
+    SCREEN_FUNCTION_COLUMNS,
+    SCREEN_REGISTRY_COLUMNS,
+)
+
+FLOW_ID_RE = prd_regex.compile(r'FLOW-\d+')
+SCREEN_ID_RE = prd_regex.compile(r'SCR-\d+')
+FUNC_ID_RE = prd_regex.compile(r'FUNC-\d+')
+API_ID_RE = prd_regex.compile(r'API-\d+')
+NFR_ID_RE = prd_regex.compile(r'NFR-\d+')
+DECISION_ID_RE = prd_regex.compile(r'D-P1-\d+')
+ENTITY_HEADING_RE = prd_regex.compile(r'ENT-(\d+):\s*([^(]+)')
+
+def _without_id(record: Dict[str, str]) -> Dict[str, str]:
+    """헤더 바인딩 레코드에서 키 열(id)을 뺀 Registry 항목"""
+    return {name: value for name, value in record.items() if name != 'id'}
+
 class Severity(Enum):
     CRITICAL = "Critical"
     HIGH = "High"
@@ -30,13 +67,248 @@ class Issue:
     affected_ids: List[str] = field(default_factory=list)
     recommendation: str = ""
 
+def new_issue_store() -> IssueStore:
+    """Issue 객체로 읽히는 열 단위 이슈 저장소"""
+    return IssueStore(Issue)
+
+# 검사 규칙별 입력 (watch 모드에서 입력이 바뀐 규칙만 재실행하는 데 사용)
+# - 키 순서가 main()의 검사 실행 순서
+CHECK_INPUTS: Dict[str, Tuple[str, ...]] = {
+    'check_id_format': ('registries',),
+    'check_uniqueness': ('registries',),
+    'check_cross_references': ('registries', 'mappings', 'id_references', 'section_headings'),
+    'check_traceability': ('registries', 'mappings'),
+    'check_phase_logic': ('prd_content', 'functions'),
+    'check_api_logic': ('apis', 'api_sections'),
+    'check_cross_validation': ('functions', 'screens', 'decisions', 'ia_items', 'spm_items'),
+    'check_near_duplicates': ('functions', 'ia_items', 'spm_items'),
+}
+
+# 유사 중복 탐지 대상: (라벨, 항목 목록/Registry 이름, ID 키(None이면 Registry ID), 본문 키)
+# - 라벨이 달라도 함께 비교 (IA 정의와 같은 FUNC 설명도 탐지)
+NEAR_DUPLICATE_SOURCES = (
+    ('IA', 'ia_items', 'func_id', 'func_definition'),
+    ('FUNC', 'functions', None, 'description'),
+    ('SPM', 'spm_items', 'policy_id', 'policy_content'),
+)
+NEAR_DUPLICATE_THRESHOLD = 0.8
+NEAR_DUPLICATE_LOCATIONS = {'IA': 'output.json IA 1.0', 'FUNC': 'Function Registry', 'SPM': 'output.json SPM 1.0'}
+
+# 추적성 그래프 참조 열 → (열 이름, 위치)
+TRACE_REFERENCE_COLUMNS = {
+    'flow': ('Flow', 'Screen Registry'),
+    'related_screens': ('관련 화면', 'Function Registry'),
+}
+
+# 본문 ID 참조 접두어 → Registry 이름 (없으면 접두어 소문자)
+REFERENCE_REGISTRIES = {
+    'D-P1': 'decisions',
+    'SCR': 'screens',
+    'FUNC': 'functions',
+    'API': 'apis',
+    'ENT': 'entities',
+    'FLOW': 'flows',
+    'NFR': 'nfrs',
+}
+
+# Registry ID 형식 규칙 (Registry 이름의 접두어 → 패턴)
+ID_PATTERNS = {
+    'FLOW': r'^FLOW-\d+$',
+    'SCR': r'^SCR-\d{4}$',
+    'FUNC': r'^FUNC-\d+$',
+    'API': r'^API-\d{4}$',
+    'ENT': r'^ENT-\d{2}$',
+    'NFR': r'^NFR-\d{4}$',
+    'D-P1': r'^D-P1-\d{3}$',
+}
+
+
+def _mapping_rule(mapping: str, rule: str, location: str, side: str, registry: str, label: str,
+                   severity: Severity) -> Rule:
+    """매핑 테이블의 출발(source)/도착(target) ID가 Registry에 없을 때의 규칙"""
+    return Rule(
+        check='check_cross_references',
+        selector=f'{mapping}.{side}',
+        severity=severity,
+        category="Cross-Reference 무결성",
+        rule=rule,
+        description=f"매핑 테이블의 {{{side}}}가 {label} Registry에 존재하지 않습니다",
+        location=location,
+        affected=(side,),
+        recommendation=f"{{{side}}}를 {label} Registry에 추가하거나 매핑 테이블을 수정하세요",
+        predicate=lambda record, v: record[side] not in v.registries[registry],
+    )
+
+
+# 병렬 실행 단위 (서로 결과를 공유하지 않는 검사 묶음, 묶음 안은 순서대로 실행)
+CHECK_FAMILIES: Tuple[Tuple[str, ...], ...] = (
+    ('check_id_format', 'check_uniqueness', 'check_cross_references', 'check_traceability'),
+    ('check_phase_logic', 'check_api_logic'),
+    ('check_cross_validation',),
+    ('check_near_duplicates',),
+)
+EXECUTORS = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+# 선언형 검사 규칙 (rule_engine) - 같은 검사 안에서는 선언 순서가 같은 레코드의 이슈 순서
+RULES: Tuple[Rule, ...] = (
+    # ID 형식 검증
+    Rule(
+        check='check_id_format',
+        selector='registry.item',
+        severity=Severity.CRITICAL,
+        category="ID 형식 검증",
+        rule="{id_prefix} ID 형식 규칙",
+        description="{item_id}가 형식 규칙({pattern})을 위반합니다",
+        location="{registry_name} Registry",
+        affected=('item_id',),
+        recommendation="{item_id}를 올바른 형식으로 수정하세요",
+        predicate=lambda record, v: record['pattern'] and not prd_regex.match(record['pattern'], record['item_id']),
+    ),
+    # Registry 유일성
+    Rule(
+        check='check_uniqueness',
+        selector='registry.item',
+        severity=Severity.CRITICAL,
+        category="ID 유일성",
+        rule="{registry_name} Registry 중복 정의",
+        description="{item_id}가 중복 정의되었습니다",
+        location="{registry_name} Registry",
+        affected=('item_id',),
+        recommendation="{item_id}의 중복 정의를 제거하거나 ID를 변경하세요",
+        predicate=lambda record, v: record['duplicate'],
+    ),
+    # Cross-Reference 무결성: Registry 참조 열
+    Rule(
+        check='check_cross_references',
+        selector='screens.flow',
+        severity=Severity.CRITICAL,
+        category="Cross-Reference 무결성",
+        rule="Screen Registry의 Flow ID 참조",
+        description="{screen_id}가 참조하는 {flow_id}가 Flow Registry에 존재하지 않습니다",
+        location="Screen Registry: {screen_id}",
+        affected=('screen_id', 'flow_id'),
+        recommendation="{flow_id}를 Flow Registry에 추가하거나 Screen Registry의 Flow ID를 수정하세요",
+        predicate=lambda record, v: record['flow_id'] not in v.registries['flows'],
+    ),
+    Rule(
+        check='check_cross_references',
+        selector='functions.screen',
+        severity=Severity.HIGH,
+        category="Cross-Reference 무결성",
+        rule="Function Registry의 Screen ID 참조",
+        description="{func_id}가 참조하는 {screen_id}가 Screen Registry에 존재하지 않습니다",
+        location="Function Registry: {func_id}",
+        affected=('func_id', 'screen_id'),
+        recommendation="{screen_id}를 Screen Registry에 추가하거나 Function Registry의 관련 화면을 수정하세요",
+        predicate=lambda record, v: record['screen_id'] not in v.registries['screens'],
+    ),
+    # Cross-Reference 무결성: 매핑 테이블
+    _mapping_rule('flow_to_screen', "FLOW → Screen 매핑 테이블", "FLOW → Screen 매핑 테이블",
+                   'source', 'flows', 'Flow', Severity.CRITICAL),
+    _mapping_rule('flow_to_screen', "FLOW → Screen 매핑 테이블", "FLOW → Screen 매핑 테이블",
+                   'target', 'screens', 'Screen', Severity.CRITICAL),
+    _mapping_rule('screen_to_function', "Screen → Function 매핑 테이블", "Screen → Function 매핑 테이블",
+                   'source', 'screens', 'Screen', Severity.CRITICAL),
+    _mapping_rule('screen_to_function', "Screen → Function 매핑 테이블", "Screen → Function 매핑 테이블",
+                   'target', 'functions', 'Function', Severity.CRITICAL),
+    _mapping_rule('function_to_entity', "Function → Entity 매핑 테이블", "Function → Entity/API/NFR 매핑 테이블",
+                   'source', 'functions', 'Function', Severity.CRITICAL),
+    _mapping_rule('function_to_entity', "Function → Entity 매핑 테이블", "Function → Entity/API/NFR 매핑 테이블",
+                   'target', 'entities', 'Entity', Severity.HIGH),
+    _mapping_rule('function_to_api', "Function → API 매핑 테이블", "Function → Entity/API/NFR 매핑 테이블",
+                   'target', 'apis', 'API', Severity.HIGH),
+    _mapping_rule('function_to_nfr', "Function → NFR 매핑 테이블", "Function → Entity/API/NFR 매핑 테이블",
+                   'target', 'nfrs', 'NFR', Severity.HIGH),
+    # Cross-Reference 무결성: 본문 ID 참조
+    Rule(
+        check='check_cross_references',
+        selector='text.reference',
+        severity=Severity.MEDIUM,
+        category="Cross-Reference 무결성",
+        rule="본문 ID 참조",
+        description="본문에서 참조된 {ref_id}가 {registry_name} Registry에 존재하지 않습니다",
+        location=lambda record, v: v._reference_location(record['ref_id']),
+        affected=('ref_id',),
+        recommendation="{ref_id}를 {registry_name} Registry에 추가하거나 본문의 참조를 수정하세요",
+        predicate=lambda record, v: record['ref_id'] not in v.registries.get(record['registry_name'], {}),
+    ),
+    # Phase 범위 논리
+    Rule(
+        check='check_phase_logic',
+        selector='document.function_count',
+        severity=Severity.MEDIUM,
+        category="Phase 범위 논리",
+        rule="Function Registry 개수 일치성",
+        description="주석에 명시된 Function 개수({stated_count}개)와 실제 Registry 개수({actual_count}개)가 일치하지 않습니다",
+        location="Function Registry 주석",
+        affected=lambda record, v: list(v.registries['functions'].keys()),
+        recommendation="주석을 {actual_count}개로 수정하거나 Registry를 확인하세요",
+        predicate=lambda record, v: record['stated_count'] != record['actual_count'],
+    ),
+    Rule(
+        check='check_phase_logic',
+        selector='document.frd_unwritten',
+        severity=Severity.MEDIUM,
+        category="Phase 범위 논리",
+        rule="FRD 미작성 Function 존재 여부",
+        description="FRD 미작성으로 언급된 {func_id}가 Function Registry에 존재하지 않습니다",
+        location="Function Registry 주석",
+        affected=('func_id',),
+        recommendation="{func_id}를 Function Registry에 추가하거나 주석을 수정하세요",
+        predicate=lambda record, v: record['func_id'] not in v.registries['functions'],
+    ),
+    # API 논리
+    Rule(
+        check='check_api_logic',
+        selector='apis.missing_detail',
+        severity=Severity.MEDIUM,
+        category="API 논리",
+        rule="API Registry ↔ 상세 명세 대응성",
+        description="{api_id}가 API Registry에 있지만 상세 명세 섹션이 없습니다",
+        location="API Registry",
+        affected=('api_id',),
+        recommendation="{api_id}의 상세 명세 섹션을 추가하세요",
+    ),
+    Rule(
+        check='check_api_logic',
+        selector='apis.missing_registry',
+        severity=Severity.MEDIUM,
+        category="API 논리",
+        rule="API Registry ↔ 상세 명세 대응성",
+        description="{api_id}의 상세 명세가 있지만 API Registry에 없습니다",
+        location="API 상세 명세",
+        affected=('api_id',),
+        recommendation="{api_id}를 API Registry에 추가하세요",
+    ),
+    Rule(
+        check='check_api_logic',
+        selector='apis.endpoint_group',
+        severity=Severity.HIGH,
+        category="API 논리",
+        rule="동일 엔드포인트/메서드 중복",
+        description=lambda record, v: f"{record['key']}가 {len(record['api_ids'])}개의 API({', '.join(record['api_ids'])})에서 중복 사용됩니다",
+        location="API Registry",
+        affected=lambda record, v: record['api_ids'],
+        recommendation="엔드포인트 또는 메서드를 구분하거나 API를 통합하세요",
+        predicate=lambda record, v: len(record['api_ids']) > 1,
+    ),
+)
+RULE_CHECKS = tuple(dict.fromkeys(rule.check for rule in RULES))
+
+# 교차검증 키워드 역색인: Registry 이름 → (키워드 추출 함수(ID, 데이터), 정규화)
+KEYWORD_SOURCES = {
+    'functions': (lambda owner, data: data.get('name', '').split(), None),
+    'decisions': (lambda owner, data: data.get('content', '').split()[:5], None),  # 처음 5개 단어만
+}
+
 class PRDDeepValidator:
     def __init__(self, prd_path: str, output_json_path: str):
         self.prd_path = prd_path
         self.output_json_path = output_json_path
-        self.issues: List[Issue] = []
+        self.issues: IssueStore = new_issue_store()
         
         # PRD 데이터 구조
+        self.document: PRDDocument = None
         self.prd_content = ""
         self.registries = {
             'flows': {},
@@ -55,537 +327,454 @@ class PRDDeepValidator:
             'function_to_nfr': defaultdict(list),
         }
         self.id_references_in_text: Dict[str, Set[str]] = defaultdict(set)
+        self._keyword_indexes: Dict[str, KeywordIndex] = {}
+        self._screen_resolver: Optional[ScreenResolver] = None
+        self._trace_graph: Optional[TraceGraph] = None
         
         # output.json 데이터 구조
         self.ia_items: List[Dict] = []
         self.spm_items: List[Dict] = []
         
     def parse_prd(self):
-        """PRD 문서 파싱"""
-        with open(self.prd_path, 'r', encoding='utf-8') as f:
-            self.prd_content = f.read()
+        """PRD 문서 파싱 (내용이 같으면 디스크 캐시 재사용)"""
+        parsed = cached_parse(self.prd_path, 'deep_check.prd', self._parse_prd_file,
+                              version=DOCUMENT_CACHE_VERSION)
+        self.document = parsed['document']
+        self.prd_content = self.document.content
+        self.registries = parsed['registries']
+        self.mappings = parsed['mappings']
+        self.id_references_in_text = parsed['id_references_in_text']
+        self._keyword_indexes = {}
+        self._screen_resolver = None
+        self._trace_graph = None
+    
+    def _parse_prd_file(self, path: str) -> Dict[str, Any]:
+        """PRD 문서를 실제로 파싱하여 캐시할 상태를 반환"""
+        self.document = PRDDocument.from_file_incremental(path)
+        self.prd_content = self.document.content
+        doc = self.document
         
         # Flow Registry 파싱
-        flow_pattern = r'\|\s*(FLOW-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        for match in re.finditer(flow_pattern, self.prd_content):
-            flow_id = match.group(1).strip()
-            self.registries['flows'][flow_id] = {
-                'name': match.group(2).strip(),
-                'description': match.group(3).strip(),
-                'owner': match.group(4).strip(),
-                'status': match.group(5).strip(),
-            }
+        for record in doc.records(FLOW_REGISTRY_COLUMNS, key=FLOW_ID_RE):
+            self.registries['flows'][record['id']] = _without_id(record)
         
         # Screen Registry 파싱
-        screen_pattern = r'\|\s*(SCR-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        for match in re.finditer(screen_pattern, self.prd_content):
-            screen_id = match.group(1).strip()
-            self.registries['screens'][screen_id] = {
-                'name': match.group(2).strip(),
-                'role': match.group(3).strip(),
-                'flow': match.group(4).strip(),
-                'status': match.group(5).strip(),
-            }
+        for record in doc.records(SCREEN_REGISTRY_COLUMNS, key=SCREEN_ID_RE):
+            self.registries['screens'][record['id']] = _without_id(record)
         
         # Function Registry 파싱
-        func_pattern = r'\|\s*(FUNC-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        for match in re.finditer(func_pattern, self.prd_content):
-            func_id = match.group(1).strip()
-            self.registries['functions'][func_id] = {
-                'name': match.group(2).strip(),
-                'description': match.group(3).strip(),
-                'related_screens': match.group(4).strip(),
-                'status': match.group(5).strip(),
-            }
+        for record in doc.records(FUNCTION_REGISTRY_COLUMNS, key=FUNC_ID_RE):
+            self.registries['functions'][record['id']] = _without_id(record)
         
         # API Registry 파싱
-        api_pattern = r'\|\s*(API-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        for match in re.finditer(api_pattern, self.prd_content):
-            api_id = match.group(1).strip()
-            self.registries['apis'][api_id] = {
-                'name': match.group(2).strip(),
-                'method': match.group(3).strip(),
-                'endpoint': match.group(4).strip(),
-                'description': match.group(5).strip(),
-                'related_function': match.group(6).strip(),
-                'related_nfr': match.group(7).strip(),
-                'status': match.group(8).strip(),
-            }
+        for record in doc.records(API_REGISTRY_COLUMNS, key=API_ID_RE):
+            self.registries['apis'][record['id']] = _without_id(record)
         
-        # Entity는 TSD 섹션에서 파싱 (ENT-01: Vehicle 형태)
-        entity_pattern = r'#### ENT-(\d+):\s*([^(]+)'
-        for match in re.finditer(entity_pattern, self.prd_content):
+        # Entity는 TSD 섹션 헤딩에서 파싱 (ENT-01: Vehicle 형태)
+        for match in doc.headings_matching(ENTITY_HEADING_RE):
             entity_id = f"ENT-{match.group(1).zfill(2)}"
-            entity_name = match.group(2).strip()
             self.registries['entities'][entity_id] = {
-                'name': entity_name,
+                'name': match.group(2).strip(),
             }
         
-        # NFR 파싱
-        nfr_pattern = r'\|\s*NFR-ID\s*\|\s*(NFR-\d+)\s*\|'
-        for match in re.finditer(nfr_pattern, self.prd_content):
-            nfr_id = match.group(1).strip()
-            # NFR 상세 정보 추출 시도
-            nfr_section = self._extract_nfr_section(nfr_id)
-            self.registries['nfrs'][nfr_id] = nfr_section
+        # NFR 파싱 ('필드명 | 내용' 표의 NFR-ID 필드)
+        for table in doc.tables_with(*FIELD_TABLE_HEADERS):
+            nfr_id = table.fields().get('NFR-ID', '')
+            if NFR_ID_RE.fullmatch(nfr_id):
+                self.registries['nfrs'][nfr_id] = self._extract_nfr_section(nfr_id)
         
         # Decision 파싱
-        decision_pattern = r'\|\s*(D-P1-\d+)\s*\|\s*([^|]+)\s*\|'
-        for match in re.finditer(decision_pattern, self.prd_content):
-            decision_id = match.group(1).strip()
-            self.registries['decisions'][decision_id] = {
-                'content': match.group(2).strip(),
-            }
+        for record in doc.records(DECISION_COLUMNS, key=DECISION_ID_RE):
+            self.registries['decisions'][record['id']] = _without_id(record)
         
         # 매핑 테이블 파싱
         self._parse_mapping_tables()
         
         # 본문에서 ID 참조 추출
         self._extract_id_references()
+        
+        return {
+            'document': self.document,
+            'registries': self.registries,
+            'mappings': self.mappings,
+            'id_references_in_text': self.id_references_in_text,
+        }
     
     def _extract_nfr_section(self, nfr_id: str) -> Dict:
-        """NFR 섹션 추출"""
-        pattern = rf'###\s+\d+\.\d+\s+{re.escape(nfr_id)}:.*?(?=###|\Z)'
-        match = re.search(pattern, self.prd_content, re.DOTALL)
-        if match:
-            section = match.group(0)
+        """NFR 섹션 추출 (섹션 텍스트를 복사하지 않고 범위만 보관)"""
+        heading = self.document.section(nfr_id)
+        if heading and heading.level == 3:
             return {
-                'section': section,
+                'section': self.document.section_span(heading),
             }
         return {}
     
     def _parse_mapping_tables(self):
         """매핑 테이블 파싱"""
+        doc = self.document
+        
         # FLOW → Screen 매핑
-        flow_screen_pattern = r'\|\s*(FLOW-\d+)\s*\|\s*(SCR-\d+)\s*\|\s*(\d+)\s*\|'
-        for match in re.finditer(flow_screen_pattern, self.prd_content):
-            flow_id = match.group(1).strip()
-            screen_id = match.group(2).strip()
-            order = int(match.group(3).strip())
-            self.mappings['flow_to_screen'][flow_id].append((screen_id, order))
-        
-        # Screen → Function 매핑
-        screen_func_pattern = r'\|\s*(SCR-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        # Screen → Function 매핑 테이블 섹션만 추출
-        screen_func_section = re.search(r'#### Screen → Function 매핑.*?(?=####|\Z)', self.prd_content, re.DOTALL)
+        for record in doc.records(FLOW_SCREEN_COLUMNS, key=FLOW_ID_RE):
+            if SCREEN_ID_RE.fullmatch(record['screen']) and record['order'].isdigit():
+                self.mappings['flow_to_screen'][record['flow']].append((record['screen'], int(record['order'])))
+        
+        # Screen → Function 매핑 (해당 섹션의 표만 조회)
+        screen_func_section = doc.section('Screen → Function 매핑')
         if screen_func_section:
-            for match in re.finditer(screen_func_pattern, screen_func_section.group(0)):
-                screen_id = match.group(1).strip()
-                func_ref = match.group(2).strip()
-                # FUNC-XX 추출
-                func_ids = re.findall(r'FUNC-\d+', func_ref)
-                for func_id in func_ids:
-                    self.mappings['screen_to_function'][screen_id].append(func_id)
+            for record in doc.records(SCREEN_FUNCTION_COLUMNS, key=SCREEN_ID_RE, section=screen_func_section):
+                for func_id in prd_regex.findall(r'FUNC-\d+', record['functions']):
+                    self.mappings['screen_to_function'][record['screen']].append(func_id)
         
         # Function → Entity/API/NFR 매핑
-        func_mapping_pattern = r'\|\s*(FUNC-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
-        func_mapping_section = re.search(r'#### Function → Entity/API/NFR 매핑.*?(?=####|\Z)', self.prd_content, re.DOTALL)
+        func_mapping_section = doc.section('Function → Entity/API/NFR 매핑')
         if func_mapping_section:
-            for match in re.finditer(func_mapping_pattern, func_mapping_section.group(0)):
-                func_id = match.group(1).strip()
-                entity_ref = match.group(2).strip()
-                api_ref = match.group(3).strip()
-                nfr_ref = match.group(4).strip()
+            for record in doc.records(FUNCTION_MAPPING_COLUMNS, key=FUNC_ID_RE, section=func_mapping_section):
+                func_id = record['function']
                 
                 # Entity 추출
-                entity_ids = re.findall(r'ENT-\d+', entity_ref)
-                for entity_id in entity_ids:
+                for entity_id in prd_regex.findall(r'ENT-\d+', record['entities']):
                     self.mappings['function_to_entity'][func_id].append(entity_id)
                 
                 # API 추출
-                api_ids = re.findall(r'API-\d+', api_ref)
-                for api_id in api_ids:
+                for api_id in prd_regex.findall(r'API-\d+', record['apis']):
                     self.mappings['function_to_api'][func_id].append(api_id)
                 
                 # NFR 추출
-                nfr_ids = re.findall(r'NFR-\d+', nfr_ref)
-                for nfr_id in nfr_ids:
+                for nfr_id in prd_regex.findall(r'NFR-\d+', record['nfrs']):
                     self.mappings['function_to_nfr'][func_id].append(nfr_id)
     
     def _extract_id_references(self):
-        """본문에서 ID 참조 추출"""
-        id_patterns = {
-            'FUNC': r'FUNC-\d+',
-            'SCR': r'SCR-\d+',
-            'API': r'API-\d+',
-            'ENT': r'ENT-\d+',
-            'FLOW': r'FLOW-\d+',
-            'NFR': r'NFR-\d+',
-            'D-P1': r'D-P1-\d+',
-        }
-        
-        for id_type, pattern in id_patterns.items():
-            for match in re.finditer(pattern, self.prd_content):
-                id_value = match.group(0)
-                self.id_references_in_text[id_type].add(id_value)
+        """본문에서 ID 참조 추출 (전체 접두어를 한 번에 스캔한 위치 색인 사용)"""
+        for id_type, id_set in self.document.id_references().by_type().items():
+            self.id_references_in_text[id_type] |= id_set
     
     def parse_output_json(self):
-        """output.json 파싱"""
-        with open(self.output_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # IA 1.0 파싱
-        ia_sheet = next((s for s in data['sheets'] if s['name'] == 'IA 1.0'), None)
-        if ia_sheet:
-            for row in ia_sheet['data']:
-                func_id = row.get('System.Xml.XmlElement', '')
-                if func_id and func_id.startswith('Seller-ia-front-'):
-                    self.ia_items.append({
-                        'func_id': func_id,
-                        'screen_id': row.get('화면 ID', ''),
-                        'func_definition': row.get('기능 정의', ''),
-                        'category': row.get('카테고리', ''),
-                        'depth1': row.get('Depth 1', ''),
-                        'depth2': row.get('Depth 2', ''),
-                        'depth3': row.get('Depth 3', ''),
-                        'policy_id': row.get('관련 정책 ID', ''),
-                        'importance': row.get('중요도', ''),
-                        'implementation_target': row.get('구현 대상', ''),
-                    })
-        
-        # SPM 1.0 파싱
-        spm_sheet = next((s for s in data['sheets'] if s['name'] == 'SPM 1.0'), None)
-        if spm_sheet:
-            for row in spm_sheet['data']:
-                policy_code = row.get('정책 코드', '')
-                if policy_code and policy_code.startswith('dealer-sp-'):
-                    self.spm_items.append({
-                        'policy_id': policy_code,
-                        'policy_intro': row.get('정책 소개', ''),
-                        'policy_content': row.get('정책 내용', ''),
-                        'policy_category': row.get('정책분류', ''),
-                        'detail_item': row.get('세부 항목', ''),
-                    })
+        """output.json 파싱 (내용이 같으면 디스크 캐시 재사용)"""
+        parsed = cached_parse(self.output_json_path, 'deep_check.output_json', self._parse_output_json_file)
+        self.ia_items = parsed['ia_items']
+        self.spm_items = parsed['spm_items']
     
-    def check_id_format(self):
-        """ID 형식 검증"""
-        id_patterns = {
-            'FLOW': r'^FLOW-\d+$',
-            'SCR': r'^SCR-\d{4}$',
-            'FUNC': r'^FUNC-\d+$',
-            'API': r'^API-\d{4}$',
-            'ENT': r'^ENT-\d{2}$',
-            'NFR': r'^NFR-\d{4}$',
-            'D-P1': r'^D-P1-\d{3}$',
+    def _parse_output_json_file(self, path: str) -> Dict[str, List[Dict]]:
+        """output.json을 실제로 파싱하여 IA/SPM 항목을 반환"""
+        # IA/SPM 시트만 한 번의 스트리밍 읽기로 처리
+        for sheet_name, rows in iter_sheets(path, [IA_SHEET, SPM_SHEET]):
+            # ID 열/의미 열은 시트마다 한 번만 감지 (항목 키는 sheet_schema의 필드 순서)
+            schema, rows = detect_from_rows(path, sheet_name, rows)
+            items = self.ia_items if sheet_name == IA_SHEET else self.spm_items
+            for row in rows:
+                item = schema.extract(row)
+                if item is not None:
+                    items.append(item)
+        
+        return {
+            'ia_items': self.ia_items,
+            'spm_items': self.spm_items,
         }
+    
+    def check_input(self, name: str) -> Any:
+        """CHECK_INPUTS에 명시된 검사 입력 값"""
+        if name in self.registries:
+            return self.registries[name]
+        if name == 'api_sections':
+            return self.document.section_ids('API-', level=4)
+        if name == 'id_references':
+            return self.document.id_references().offsets
+        if name == 'section_headings':
+            # 본문 참조 이슈 위치에 감싸는 헤딩 텍스트가 들어가므로 헤딩 이름/범위도 입력
+            return [(heading.text, heading.offset, heading.end) for heading in self.document.headings]
+        return getattr(self, name)
+    
+    def keyword_index(self, name: str) -> KeywordIndex:
+        """Registry 키워드 역색인 (Registry마다 처음 필요할 때 한 번 구축)"""
+        index = self._keyword_indexes.get(name)
+        if index is None:
+            keywords, normalize = KEYWORD_SOURCES[name]
+            index = self._keyword_indexes[name] = KeywordIndex.from_registry(self.registries[name], keywords, normalize)
+        return index
+    
+    def function_candidates(self, ia_item: Dict) -> List[Candidate]:
+        """IA 기능 정의에 기능명 단어가 나타나는 PRD Function 후보 (점수순)"""
+        return self.keyword_index('functions').rank(ia_item.get('func_definition', ''))
+    
+    def screen_resolver(self) -> ScreenResolver:
+        """Screen Registry 화면명/ID 해석기 (처음 필요할 때 한 번 구축)"""
+        if self._screen_resolver is None:
+            self._screen_resolver = ScreenResolver.from_registry(self.registries['screens'])
+        return self._screen_resolver
+    
+    def screen_candidates(self, ia_item: Dict) -> List[ScreenMatch]:
+        """IA 화면 ID를 동의어 표 + 편집 거리로 해석한 PRD Screen (최소 신뢰도 이상일 때 하나)"""
+        screen_id = ia_item.get('screen_id', '')
+        match = self.screen_resolver().resolve(screen_id) if screen_id else None
+        return [match] if match else []
+    
+    def decision_candidates(self, spm_item: Dict) -> List[Candidate]:
+        """SPM 정책 소개에 결정 내용 앞 단어가 나타나는 Decision 후보 (점수순)"""
+        return self.keyword_index('decisions').rank(spm_item.get('policy_intro', ''))
+    
+    def trace_graph(self) -> TraceGraph:
+        """Registry/매핑 테이블 추적성 그래프 (처음 필요할 때 한 번 구축)"""
+        if self._trace_graph is None:
+            self._trace_graph = TraceGraph.from_prd(self.registries, self.mappings)
+        return self._trace_graph
+    
+    def run_check(self, name: str) -> IssueStore:
+        """검사 규칙 하나만 실행하여 해당 규칙의 이슈를 반환 (self.issues에도 누적)"""
+        start = len(self.issues)
+        getattr(self, name)()
+        return self.issues[start:]
+    
+    def run_checks(self, names: Optional[Iterable[str]] = None) -> Dict[str, IssueStore]:
+        """
+        검사 여러 개를 names(기본: CHECK_INPUTS 전체) 순서로 실행하여 검사별 이슈 반환 (self.issues에도 같은 순서로 누적)
+        - 선언형 규칙 검사(RULE_CHECKS)는 모두 모아 모델 한 번 순회로 평가
+        """
+        names = list(CHECK_INPUTS if names is None else names)
+        rule_results = self.run_rules([name for name in names if name in RULE_CHECKS])
+        results = {}
+        for name in names:
+            if name in rule_results:
+                results[name] = rule_results[name]
+                self.issues.extend(results[name])
+            else:
+                results[name] = self.run_check(name)
+        return results
+    
+    def run_checks_parallel(self, names: Iterable[str], jobs: int, executor: str = 'thread') -> Dict[str, IssueStore]:
+        """
+        CHECK_FAMILIES 단위로 검사를 작업 풀에서 병렬 실행 (run_checks와 같은 결과/순서)
+        - 작업마다 검증기의 얕은 복사본에서 실행 (파싱 결과는 공유, 이슈/지연 색인은 복사본 소유)
+        - executor='process'는 작업 프로세스마다 검증기를 한 번만 전달
+        - 이슈는 완료 순서와 관계없이 names 순서로 self.issues에 누적
+        """
+        names = list(names)
+        families = [[name for name in family if name in names] for family in CHECK_FAMILIES]
+        families = [family for family in families if family]
+        grouped = {name for family in families for name in family}
+        families += [[name] for name in names if name not in grouped]
         
+        if executor == 'process':
+            pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_check_worker, initargs=(self,))
+            run = _run_check_family
+        else:
+            pool = EXECUTORS[executor](max_workers=jobs)
+            run = self._run_family
+        with pool:
+            results = {}
+            for family_results in pool.map(run, families):
+                results.update(family_results)
+        
+        ordered = {name: results[name] for name in names}
+        for issues in ordered.values():
+            self.issues.extend(issues)
+        return ordered
+    
+    def _run_family(self, names: List[str]) -> Dict[str, IssueStore]:
+        worker = copy.copy(self)
+        worker.issues = new_issue_store()
+        worker._keyword_indexes = dict(self._keyword_indexes)
+        return worker.run_checks(names)
+    
+    def run_rules(self, checks: Iterable[str]) -> Dict[str, IssueStore]:
+        """선언형 규칙 검사(RULES)를 모델 한 번 순회로 평가 ({검사 이름: 이슈 목록}, self.issues에는 누적하지 않음)"""
+        plan = RulePlan.compile(RULES, checks)
+        return plan.evaluate(self.rule_events(plan.selectors), self, Issue, new_issue_store)
+    
+    def rule_events(self, selectors: Set[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        규칙 평가용 (선택자, 레코드) 이벤트 (Registry → 매핑 테이블 → 본문 참조 → 문서 주석 → API 명세 순서)
+        - selectors에 없는 스트림은 레코드를 만들지 않음
+        - set에서 나오는 ID는 정렬 (해시 시드가 다른 작업 프로세스에서도 같은 순서)
+        """
+        endpoint_method_map = defaultdict(list)
         for registry_name, registry in self.registries.items():
             id_prefix = registry_name.upper().rstrip('S')
             if id_prefix == 'DECISION':
                 id_prefix = 'D-P1'
-            
-            pattern = id_patterns.get(id_prefix)
-            if pattern:
-                for item_id in registry.keys():
-                    if not re.match(pattern, item_id):
-                        self.issues.append(Issue(
-                            severity=Severity.CRITICAL,
-                            category="ID 형식 검증",
-                            rule=f"{id_prefix} ID 형식 규칙",
-                            description=f"{item_id}가 형식 규칙({pattern})을 위반합니다",
-                            location=f"{registry_name} Registry",
-                            affected_ids=[item_id],
-                            recommendation=f"{item_id}를 올바른 형식으로 수정하세요"
-                        ))
-    
-    def check_uniqueness(self):
-        """Registry 유일성 검사"""
-        for registry_name, registry in self.registries.items():
-            seen = {}
+            pattern = ID_PATTERNS.get(id_prefix)
+            seen = set()
             for item_id, item_data in registry.items():
-                if item_id in seen:
-                    self.issues.append(Issue(
-                        severity=Severity.CRITICAL,
-                        category="ID 유일성",
-                        rule=f"{registry_name} Registry 중복 정의",
-                        description=f"{item_id}가 중복 정의되었습니다",
-                        location=f"{registry_name} Registry",
-                        affected_ids=[item_id],
-                        recommendation=f"{item_id}의 중복 정의를 제거하거나 ID를 변경하세요"
-                    ))
-                seen[item_id] = item_data
-    
-    def check_cross_references(self):
-        """Cross-Reference 무결성 검사"""
-        # Screen Registry의 Flow ID 존재 여부
-        for screen_id, screen_data in self.registries['screens'].items():
-            flow_id = screen_data.get('flow', '').strip()
-            if flow_id and flow_id not in self.registries['flows']:
-                self.issues.append(Issue(
-                    severity=Severity.CRITICAL,
-                    category="Cross-Reference 무결성",
-                    rule="Screen Registry의 Flow ID 참조",
-                    description=f"{screen_id}가 참조하는 {flow_id}가 Flow Registry에 존재하지 않습니다",
-                    location=f"Screen Registry: {screen_id}",
-                    affected_ids=[screen_id, flow_id],
-                    recommendation=f"{flow_id}를 Flow Registry에 추가하거나 Screen Registry의 Flow ID를 수정하세요"
-                ))
+                if 'registry.item' in selectors:
+                    yield 'registry.item', {
+                        'registry_name': registry_name, 'item_id': item_id, 'id_prefix': id_prefix,
+                        'pattern': pattern, 'duplicate': item_id in seen,
+                    }
+                    seen.add(item_id)
+                if registry_name == 'screens' and 'screens.flow' in selectors:
+                    # ID가 없는 셀('공통' 등)은 check_traceability가 보고
+                    for flow_id in FLOW_ID_RE.findall(item_data.get('flow', '')):
+                        yield 'screens.flow', {'screen_id': item_id, 'flow_id': flow_id}
+                elif registry_name == 'functions' and 'functions.screen' in selectors:
+                    for screen_id in SCREEN_ID_RE.findall(item_data.get('related_screens', '')):
+                        yield 'functions.screen', {'func_id': item_id, 'screen_id': screen_id}
+                elif registry_name == 'apis' and 'apis.endpoint_group' in selectors:
+                    endpoint_method_map[f"{item_data.get('method', '')} {item_data.get('endpoint', '')}"].append(item_id)
         
-        # Function Registry의 Screen ID 참조 검사
-        for func_id, func_data in self.registries['functions'].items():
-            related_screens = func_data.get('related_screens', '')
-            screen_ids = re.findall(r'SCR-\d+', related_screens)
-            for screen_id in screen_ids:
-                if screen_id not in self.registries['screens']:
-                    self.issues.append(Issue(
-                        severity=Severity.HIGH,
-                        category="Cross-Reference 무결성",
-                        rule="Function Registry의 Screen ID 참조",
-                        description=f"{func_id}가 참조하는 {screen_id}가 Screen Registry에 존재하지 않습니다",
-                        location=f"Function Registry: {func_id}",
-                        affected_ids=[func_id, screen_id],
-                        recommendation=f"{screen_id}를 Screen Registry에 추가하거나 Function Registry의 관련 화면을 수정하세요"
-                    ))
-        
-        # 매핑 테이블의 ID 참조 검사
-        for flow_id, screens in self.mappings['flow_to_screen'].items():
-            if flow_id not in self.registries['flows']:
-                self.issues.append(Issue(
-                    severity=Severity.CRITICAL,
-                    category="Cross-Reference 무결성",
-                    rule="FLOW → Screen 매핑 테이블",
-                    description=f"매핑 테이블의 {flow_id}가 Flow Registry에 존재하지 않습니다",
-                    location="FLOW → Screen 매핑 테이블",
-                    affected_ids=[flow_id],
-                    recommendation=f"{flow_id}를 Flow Registry에 추가하거나 매핑 테이블을 수정하세요"
-                ))
-            for screen_id, _ in screens:
-                if screen_id not in self.registries['screens']:
-                    self.issues.append(Issue(
-                        severity=Severity.CRITICAL,
-                        category="Cross-Reference 무결성",
-                        rule="FLOW → Screen 매핑 테이블",
-                        description=f"매핑 테이블의 {screen_id}가 Screen Registry에 존재하지 않습니다",
-                        location="FLOW → Screen 매핑 테이블",
-                        affected_ids=[screen_id],
-                        recommendation=f"{screen_id}를 Screen Registry에 추가하거나 매핑 테이블을 수정하세요"
-                    ))
-        
-        for screen_id, func_ids in self.mappings['screen_to_function'].items():
-            if screen_id not in self.registries['screens']:
-                self.issues.append(Issue(
-                    severity=Severity.CRITICAL,
-                    category="Cross-Reference 무결성",
-                    rule="Screen → Function 매핑 테이블",
-                    description=f"매핑 테이블의 {screen_id}가 Screen Registry에 존재하지 않습니다",
-                    location="Screen → Function 매핑 테이블",
-                    affected_ids=[screen_id],
-                    recommendation=f"{screen_id}를 Screen Registry에 추가하거나 매핑 테이블을 수정하세요"
-                ))
-            for func_id in func_ids:
-                if func_id not in self.registries['functions']:
-                    self.issues.append(Issue(
-                        severity=Severity.CRITICAL,
-                        category="Cross-Reference 무결성",
-                        rule="Screen → Function 매핑 테이블",
-                        description=f"매핑 테이블의 {func_id}가 Function Registry에 존재하지 않습니다",
-                        location="Screen → Function 매핑 테이블",
-                        affected_ids=[func_id],
-                        recommendation=f"{func_id}를 Function Registry에 추가하거나 매핑 테이블을 수정하세요"
-                    ))
-        
-        # Function → Entity/API/NFR 매핑 검사
-        for func_id, entity_ids in self.mappings['function_to_entity'].items():
-            if func_id not in self.registries['functions']:
-                self.issues.append(Issue(
-                    severity=Severity.CRITICAL,
-                    category="Cross-Reference 무결성",
-                    rule="Function → Entity 매핑 테이블",
-                    description=f"매핑 테이블의 {func_id}가 Function Registry에 존재하지 않습니다",
-                    location="Function → Entity/API/NFR 매핑 테이블",
-                    affected_ids=[func_id],
-                    recommendation=f"{func_id}를 Function Registry에 추가하거나 매핑 테이블을 수정하세요"
-                ))
-            for entity_id in entity_ids:
-                if entity_id not in self.registries['entities']:
-                    self.issues.append(Issue(
-                        severity=Severity.HIGH,
-                        category="Cross-Reference 무결성",
-                        rule="Function → Entity 매핑 테이블",
-                        description=f"매핑 테이블의 {entity_id}가 Entity Registry에 존재하지 않습니다",
-                        location="Function → Entity/API/NFR 매핑 테이블",
-                        affected_ids=[entity_id],
-                        recommendation=f"{entity_id}를 Entity Registry에 추가하거나 매핑 테이블을 수정하세요"
-                    ))
-        
-        for func_id, api_ids in self.mappings['function_to_api'].items():
-            for api_id in api_ids:
-                if api_id not in self.registries['apis']:
-                    self.issues.append(Issue(
-                        severity=Severity.HIGH,
-                        category="Cross-Reference 무결성",
-                        rule="Function → API 매핑 테이블",
-                        description=f"매핑 테이블의 {api_id}가 API Registry에 존재하지 않습니다",
-                        location="Function → Entity/API/NFR 매핑 테이블",
-                        affected_ids=[api_id],
-                        recommendation=f"{api_id}를 API Registry에 추가하거나 매핑 테이블을 수정하세요"
-                    ))
-        
-        for func_id, nfr_ids in self.mappings['function_to_nfr'].items():
-            for nfr_id in nfr_ids:
-                if nfr_id not in self.registries['nfrs']:
-                    self.issues.append(Issue(
-                        severity=Severity.HIGH,
-                        category="Cross-Reference 무결성",
-                        rule="Function → NFR 매핑 테이블",
-                        description=f"매핑 테이블의 {nfr_id}가 NFR Registry에 존재하지 않습니다",
-                        location="Function → Entity/API/NFR 매핑 테이블",
-                        affected_ids=[nfr_id],
-                        recommendation=f"{nfr_id}를 NFR Registry에 추가하거나 매핑 테이블을 수정하세요"
-                    ))
-        
-        # 본문에서 참조된 ID가 Registry에 존재하는지 검사
-        for id_type, id_set in self.id_references_in_text.items():
-            registry_name = id_type.lower()
-            if id_type == 'D-P1':
-                registry_name = 'decisions'
-            elif id_type == 'SCR':
-                registry_name = 'screens'
-            elif id_type == 'FUNC':
-                registry_name = 'functions'
-            elif id_type == 'API':
-                registry_name = 'apis'
-            elif id_type == 'ENT':
-                registry_name = 'entities'
-            elif id_type == 'FLOW':
-                registry_name = 'flows'
-            elif id_type == 'NFR':
-                registry_name = 'nfrs'
-            
-            registry = self.registries.get(registry_name, {})
-            for ref_id in id_set:
-                if ref_id not in registry:
-                    self.issues.append(Issue(
-                        severity=Severity.MEDIUM,
-                        category="Cross-Reference 무결성",
-                        rule="본문 ID 참조",
-                        description=f"본문에서 참조된 {ref_id}가 {registry_name} Registry에 존재하지 않습니다",
-                        location="PRD 본문",
-                        affected_ids=[ref_id],
-                        recommendation=f"{ref_id}를 {registry_name} Registry에 추가하거나 본문의 참조를 수정하세요"
-                    ))
-    
-    def check_phase_logic(self):
-        """Phase 1 범위 논리 검사"""
-        # Function Registry 주석의 "총 N개"와 실제 Registry 개수 비교
+        # 매핑 테이블: 출발 ID 다음에 그 도착 ID들 (FLOW → Screen은 (Screen ID, 순서))
+        for mapping_name, mapping in self.mappings.items():
+            source_selector, target_selector = f'{mapping_name}.source', f'{mapping_name}.target'
+            if source_selector not in selectors and target_selector not in selectors:
+                continue
+            for source, targets in mapping.items():
+                if source_selector in selectors:
+                    yield source_selector, {'source': source}
+                if target_selector in selectors:
+                    for target in targets:
+                        yield target_selector, {'source': source, 'target': target[0] if isinstance(target, tuple) else target}
+        
+        if 'text.reference' in selectors:
+            for id_type, id_set in self.id_references_in_text.items():
+                registry_name = REFERENCE_REGISTRIES.get(id_type, id_type.lower())
+                for ref_id in sorted(id_set):
+                    yield 'text.reference', {'ref_id': ref_id, 'registry_name': registry_name}
+        
+        # Function Registry 주석의 "총 N개"
         # NOTE: 문서에는 "총 10개 서비스 계정" 등 다른 '총 N개' 표현도 존재하므로,
         #       Function Registry 주석 라인에 한정하여 파싱한다.
-        func_count_comment = re.search(
-            r'>\s*주석:\s*Function Registry[^\n]*총\s*(\d+)\s*개',
-            self.prd_content
-        )
-        if func_count_comment:
-            stated_count = int(func_count_comment.group(1))
-            actual_count = len(self.registries['functions'])
-            if stated_count != actual_count:
-                self.issues.append(Issue(
-                    severity=Severity.MEDIUM,
-                    category="Phase 범위 논리",
-                    rule="Function Registry 개수 일치성",
-                    description=f"주석에 명시된 Function 개수({stated_count}개)와 실제 Registry 개수({actual_count}개)가 일치하지 않습니다",
-                    location="Function Registry 주석",
-                    affected_ids=list(self.registries['functions'].keys()),
-                    recommendation=f"주석을 {actual_count}개로 수정하거나 Registry를 확인하세요"
-                ))
+        if 'document.function_count' in selectors:
+            func_count_comment = prd_regex.search(
+                r'>\s*주석:\s*Function Registry[^\n]*총\s*(\d+)\s*개',
+                self.prd_content
+            )
+            if func_count_comment:
+                yield 'document.function_count', {
+                    'stated_count': int(func_count_comment.group(1)),
+                    'actual_count': len(self.registries['functions']),
+                }
         
-        # FRD 미작성 Function 언급 검사
-        frd_unwritten_pattern = r'FRD 미작성 Function\(([^)]+)\)'
-        frd_match = re.search(frd_unwritten_pattern, self.prd_content)
-        if frd_match:
-            unwritten_ids = [id.strip() for id in frd_match.group(1).split(',')]
-            for func_id in unwritten_ids:
-                if func_id not in self.registries['functions']:
-                    self.issues.append(Issue(
-                        severity=Severity.MEDIUM,
-                        category="Phase 범위 논리",
-                        rule="FRD 미작성 Function 존재 여부",
-                        description=f"FRD 미작성으로 언급된 {func_id}가 Function Registry에 존재하지 않습니다",
-                        location="Function Registry 주석",
-                        affected_ids=[func_id],
-                        recommendation=f"{func_id}를 Function Registry에 추가하거나 주석을 수정하세요"
-                    ))
+        # FRD 미작성 Function 언급
+        if 'document.frd_unwritten' in selectors:
+            frd_match = prd_regex.search(r'FRD 미작성 Function\(([^)]+)\)', self.prd_content)
+            if frd_match:
+                for func_id in frd_match.group(1).split(','):
+                    yield 'document.frd_unwritten', {'func_id': func_id.strip()}
+        
+        # API Registry ↔ 상세 명세 섹션
+        if 'apis.missing_detail' in selectors or 'apis.missing_registry' in selectors:
+            api_detail_ids = set(self.document.section_ids('API-', level=4))
+            registry_api_ids = set(self.registries['apis'].keys())
+            if 'apis.missing_detail' in selectors:
+                for api_id in sorted(registry_api_ids - api_detail_ids):
+                    yield 'apis.missing_detail', {'api_id': api_id}
+            if 'apis.missing_registry' in selectors:
+                for api_id in sorted(api_detail_ids - registry_api_ids):
+                    yield 'apis.missing_registry', {'api_id': api_id}
+        for key, api_ids in endpoint_method_map.items():
+            yield 'apis.endpoint_group', {'key': key, 'api_ids': api_ids}
     
-    def check_api_logic(self):
-        """API 논리 검사"""
-        # API Registry와 API 상세 명세의 1:1 대응성
-        api_detail_pattern = r'#### API-(\d+):'
-        api_detail_ids = set()
-        for match in re.finditer(api_detail_pattern, self.prd_content):
-            api_id = f"API-{match.group(1)}"
-            api_detail_ids.add(api_id)
-        
-        registry_api_ids = set(self.registries['apis'].keys())
-        
-        # Registry에 있지만 상세 명세가 없는 API
-        missing_details = registry_api_ids - api_detail_ids
-        for api_id in missing_details:
+    def _run_rule_check(self, name: str):
+        self.issues.extend(self.run_rules([name])[name])
+    
+    def check_id_format(self):
+        """ID 형식 검증 (RULES)"""
+        self._run_rule_check('check_id_format')
+    
+    def check_uniqueness(self):
+        """Registry 유일성 검사 (RULES)"""
+        self._run_rule_check('check_uniqueness')
+    
+    def check_cross_references(self):
+        """Cross-Reference 무결성 검사: Registry 참조 열, 매핑 테이블, 본문 ID 참조 (RULES)"""
+        self._run_rule_check('check_cross_references')
+    
+    def check_traceability(self):
+        """Flow → Screen → Function → Entity/API/NFR 추적성 검사 (그래프 순회)"""
+        graph = self.trace_graph()
+
+        # 참조 열에 ID가 없어 간선을 만들지 못한 셀 ('공통' 등)
+        for node_id, column, cell in graph.unresolved:
+            label, location = TRACE_REFERENCE_COLUMNS[column]
             self.issues.append(Issue(
                 severity=Severity.MEDIUM,
-                category="API 논리",
-                rule="API Registry ↔ 상세 명세 대응성",
-                description=f"{api_id}가 API Registry에 있지만 상세 명세 섹션이 없습니다",
-                location="API Registry",
-                affected_ids=[api_id],
-                recommendation=f"{api_id}의 상세 명세 섹션을 추가하세요"
+                category="추적성",
+                rule=f"{label} 열 ID 없음",
+                description=f"{node_id}의 {label} 열 값 '{cell}'에서 ID를 찾을 수 없어 추적 경로에 연결되지 않습니다",
+                location=location,
+                affected_ids=[node_id],
+                recommendation=f"{label} 열에 참조 ID를 기입하세요 (여러 개면 쉼표로 구분)"
             ))
+
+        # Flow에서 도달할 수 없는 Screen/Function
+        for kind, label in (('screens', 'Screen'), ('functions', 'Function')):
+            unreachable = graph.unreachable(kind)
+            if unreachable:
+                self.issues.append(Issue(
+                    severity=Severity.MEDIUM,
+                    category="추적성",
+                    rule=f"Flow에서 도달 불가한 {label}",
+                    description=f"어떤 Flow에서도 도달할 수 없는 {label} {len(unreachable)}개: {', '.join(unreachable[:10])}",
+                    location=f"{label} Registry",
+                    affected_ids=unreachable[:10],
+                    recommendation=f"해당 {label} 항목을 상위 매핑 테이블에 연결하거나 Phase 1 범위 외로 명시하세요"
+                ))
         
-        # 상세 명세가 있지만 Registry에 없는 API
-        missing_registry = api_detail_ids - registry_api_ids
-        for api_id in missing_registry:
+        # Entity/API 연결이 없는 Function
+        without_data = graph.without_successors('functions', ('entities', 'apis'))
+        if without_data:
             self.issues.append(Issue(
                 severity=Severity.MEDIUM,
-                category="API 논리",
-                rule="API Registry ↔ 상세 명세 대응성",
-                description=f"{api_id}의 상세 명세가 있지만 API Registry에 없습니다",
-                location="API 상세 명세",
-                affected_ids=[api_id],
-                recommendation=f"{api_id}를 API Registry에 추가하세요"
+                category="추적성",
+                rule="Entity/API 미연결 Function",
+                description=f"Entity나 API와 연결되지 않은 Function {len(without_data)}개: {', '.join(without_data[:10])}",
+                location="Function → Entity/API/NFR 매핑 테이블",
+                affected_ids=without_data[:10],
+                recommendation="Function이 사용하는 Entity/API를 매핑 테이블에 추가하세요"
             ))
         
-        # 동일 엔드포인트/메서드 중복 검사
-        endpoint_method_map = defaultdict(list)
-        for api_id, api_data in self.registries['apis'].items():
-            endpoint = api_data.get('endpoint', '')
-            method = api_data.get('method', '')
-            key = f"{method} {endpoint}"
-            endpoint_method_map[key].append(api_id)
-        
-        for key, api_ids in endpoint_method_map.items():
-            if len(api_ids) > 1:
+        # 어떤 Function에서도 사용하지 않는 API/NFR
+        for kind, label in (('apis', 'API'), ('nfrs', 'NFR')):
+            orphans = graph.orphans(kind)
+            if orphans:
                 self.issues.append(Issue(
-                    severity=Severity.HIGH,
-                    category="API 논리",
-                    rule="동일 엔드포인트/메서드 중복",
-                    description=f"{key}가 {len(api_ids)}개의 API({', '.join(api_ids)})에서 중복 사용됩니다",
-                    location="API Registry",
-                    affected_ids=api_ids,
-                    recommendation=f"엔드포인트 또는 메서드를 구분하거나 API를 통합하세요"
+                    severity=Severity.LOW,
+                    category="추적성",
+                    rule=f"Function 미연결 {label}",
+                    description=f"어떤 Function에도 연결되지 않은 {label} {len(orphans)}개: {', '.join(orphans[:10])}",
+                    location=f"{label} Registry",
+                    affected_ids=orphans[:10],
+                    recommendation=f"해당 {label} 항목을 사용하는 Function을 매핑 테이블에 추가하거나 불필요하면 제거하세요"
                 ))
+        
+        # 추적 경로 순환
+        cycle = graph.find_cycle()
+        if cycle:
+            self.issues.append(Issue(
+                severity=Severity.HIGH,
+                category="추적성",
+                rule="추적 경로 순환",
+                description=f"추적 경로에 순환이 있습니다 ({' → '.join(cycle)})",
+                location="매핑 테이블",
+                affected_ids=list(dict.fromkeys(cycle)),
+                recommendation="상위 → 하위 방향으로만 매핑되도록 순환 경로의 매핑을 수정하세요"
+            ))
+    
+    def _reference_location(self, ref_id: str) -> str:
+        """본문 참조의 첫 등장 위치 (줄 번호, 섹션, 추가 등장 횟수)"""
+        references = self.document.id_references()
+        first = references.first(ref_id)
+        if first is None:
+            return "PRD 본문"
+        location = f"PRD 본문 {first.line}행"
+        if first.section is not None:
+            location += f" ({first.section.text})"
+        if references.count(ref_id) > 1:
+            location += f" 외 {references.count(ref_id) - 1}곳"
+        return location
+    
+    def check_phase_logic(self):
+        """Phase 1 범위 논리 검사: Function 개수 주석, FRD 미작성 Function 언급 (RULES)"""
+        self._run_rule_check('check_phase_logic')
+    
+    def check_api_logic(self):
+        """API 논리 검사: Registry ↔ 상세 명세 대응, 엔드포인트/메서드 중복 (RULES)"""
+        self._run_rule_check('check_api_logic')
     
     def check_cross_validation(self):
         """IA/SPM ↔ PRD 교차검증"""
-        # IA → PRD 커버리지
+        # IA → PRD 커버리지 (레지스트리별 키워드 역색인으로 후보 조회)
         unmapped_ia = []
         for ia_item in self.ia_items:
-            func_id = ia_item['func_id']
-            func_def = ia_item.get('func_definition', '')
-            screen_id_ia = ia_item.get('screen_id', '')
-            
-            # 간단한 키워드 매칭으로 매핑 가능 여부 확인
-            mapped = False
-            for prd_func_id, prd_func_data in self.registries['functions'].items():
-                func_name = prd_func_data.get('name', '')
-                if any(keyword in func_def for keyword in func_name.split()):
-                    mapped = True
-                    break
-            
-            if not mapped and screen_id_ia:
-                # Screen ID로 매핑 시도
-                prd_screen_ids = [sid for sid in self.registries['screens'].keys() if screen_id_ia.lower() in sid.lower() or sid.lower() in screen_id_ia.lower()]
-                if prd_screen_ids:
-                    mapped = True
-            
-            if not mapped:
+            if not (self.function_candidates(ia_item) or self.screen_candidates(ia_item)):
                 unmapped_ia.append(ia_item)
         
         if unmapped_ia:
@@ -600,21 +789,10 @@ class PRDDeepValidator:
                 recommendation=f"IA 항목을 PRD에 추가하거나 Phase 1 범위 외로 명시하세요"
             ))
         
-        # SPM → PRD 커버리지
+        # SPM → PRD 커버리지 (Decision Log 키워드 역색인)
         unmapped_spm = []
         for spm_item in self.spm_items:
-            policy_id = spm_item['policy_id']
-            policy_intro = spm_item.get('policy_intro', '')
-            
-            # Decision Log와 매핑 시도
-            mapped = False
-            for decision_id, decision_data in self.registries['decisions'].items():
-                decision_content = decision_data.get('content', '')
-                if any(keyword in policy_intro for keyword in decision_content.split()[:5]):  # 처음 5개 단어만
-                    mapped = True
-                    break
-            
-            if not mapped:
+            if not self.decision_candidates(spm_item):
                 unmapped_spm.append(spm_item)
         
         if unmapped_spm:
@@ -643,6 +821,46 @@ class PRDDeepValidator:
                 recommendation=f"관련 정책 ID를 채우거나 SPM 정책과 연결하세요"
             ))
     
+    def near_duplicate_documents(self) -> Dict[str, Tuple[str, str]]:
+        """유사 중복 탐지 문서 {키: (표시 ID, 본문)} (같은 ID가 여러 번 나오면 키에 #n)"""
+        documents: Dict[str, Tuple[str, str]] = {}
+        for label, source, id_key, text_key in NEAR_DUPLICATE_SOURCES:
+            if id_key is None:
+                entries = [(item_id, data) for item_id, data in self.registries[source].items()]
+            else:
+                entries = [(item.get(id_key, ''), item) for item in getattr(self, source)]
+            for item_id, data in entries:
+                text = (data.get(text_key) or '').strip()
+                if not item_id or not text:
+                    continue
+                key = f"{label}:{item_id}"
+                suffix = 2
+                while key in documents:
+                    key = f"{label}:{item_id}#{suffix}"
+                    suffix += 1
+                documents[key] = (item_id, text)
+        return documents
+
+    def check_near_duplicates(self):
+        """IA 기능 정의 / PRD Function 설명 / SPM 정책 내용의 유사 중복 (MinHash LSH 후보 → Jaccard 확인)"""
+        documents = self.near_duplicate_documents()
+        detector = NearDuplicateDetector(threshold=NEAR_DUPLICATE_THRESHOLD)
+        for key, (_, text) in documents.items():
+            detector.add(key, text)
+
+        for cluster in detector.clusters():
+            labels = sorted({key.split(':', 1)[0] for key in cluster.keys})
+            affected_ids = list(dict.fromkeys(documents[key][0] for key in cluster.keys))
+            self.issues.append(Issue(
+                severity=Severity.MEDIUM,
+                category="유사 중복 정의",
+                rule=f"{'/'.join(labels)} 정의 유사 중복",
+                description=f"{len(cluster.keys)}개 항목({', '.join(affected_ids)})의 정의가 거의 같습니다 (Jaccard {cluster.similarity:.2f} 이상)",
+                location=', '.join(NEAR_DUPLICATE_LOCATIONS[label] for label in labels),
+                affected_ids=affected_ids,
+                recommendation="같은 기능/정책이면 하나로 통합하고, 다르면 정의에 차이점을 명시하세요"
+            ))
+
     def generate_report(self) -> str:
         """리포트 생성"""
         report_lines = []
@@ -683,17 +901,15 @@ class PRDDeepValidator:
         report_lines.append(f"| SPM 정책 항목 | {len(self.spm_items)}개 |")
         report_lines.append("")
         
-        # 이슈 통계
-        issue_counts = defaultdict(int)
-        for issue in self.issues:
-            issue_counts[issue.severity.value] += 1
+        # 이슈 통계 (심각도 코드 열 집계)
+        issue_counts = self.issues.count_by('severity')
         
         report_lines.append("### 1.3 이슈 통계")
         report_lines.append("")
         report_lines.append("| 우선순위 | 개수 |")
         report_lines.append("|---|---|")
         for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-            count = issue_counts.get(severity.value, 0)
+            count = issue_counts.get(severity, 0)
             report_lines.append(f"| {severity.value} | {count}개 |")
         report_lines.append(f"| **전체** | **{len(self.issues)}개** |")
         report_lines.append("")
@@ -702,21 +918,19 @@ class PRDDeepValidator:
         report_lines.append("## 2. 규칙별 점검 결과")
         report_lines.append("")
         
-        categories = defaultdict(list)
-        for issue in self.issues:
-            categories[issue.category].append(issue)
+        categories = self.issues.rows_by('category')  # 분류 → 행 번호 (처음 나온 순서)
         
-        for category, category_issues in sorted(categories.items()):
+        for category, category_rows in sorted(categories.items()):
             report_lines.append(f"### 2.{list(categories.keys()).index(category) + 1} {category}")
             report_lines.append("")
             
             for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-                severity_issues = [i for i in category_issues if i.severity == severity]
-                if severity_issues:
-                    report_lines.append(f"#### {severity.value} ({len(severity_issues)}건)")
+                severity_rows = self.issues.select('severity', severity, rows=category_rows)
+                if severity_rows:
+                    report_lines.append(f"#### {severity.value} ({len(severity_rows)}건)")
                     report_lines.append("")
                     
-                    for idx, issue in enumerate(severity_issues[:20], 1):  # 최대 20개만
+                    for idx, issue in enumerate(self.issues.rows(severity_rows[:20]), 1):  # 최대 20개만
                         report_lines.append(f"**{idx}. {issue.rule}**")
                         report_lines.append("")
                         report_lines.append(f"- **설명**: {issue.description}")
@@ -736,16 +950,14 @@ class PRDDeepValidator:
         report_lines.append("")
         
         for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-            severity_issues = [i for i in self.issues if i.severity == severity]
-            if severity_issues:
+            severity_rows = self.issues.select('severity', severity)
+            if severity_rows:
                 report_lines.append(f"### 3.{severity.value}")
                 report_lines.append("")
                 report_lines.append("| 우선순위 | 위험요인 | 건수 | 상태 |")
                 report_lines.append("|---|---|---|---|")
                 
-                category_counts = defaultdict(int)
-                for issue in severity_issues:
-                    category_counts[issue.category] += 1
+                category_counts = self.issues.count_by('category', rows=severity_rows)
                 
                 for category, count in sorted(category_counts.items()):
                     report_lines.append(f"| {severity.value} | {category} | {count}건 | 확인됨 |")
@@ -755,12 +967,12 @@ class PRDDeepValidator:
         report_lines.append("## 4. 권장 수정안")
         report_lines.append("")
         
-        critical_high_issues = [i for i in self.issues if i.severity in [Severity.CRITICAL, Severity.HIGH]]
-        if critical_high_issues:
+        critical_high_rows = self.issues.select('severity', Severity.CRITICAL, Severity.HIGH)
+        if critical_high_rows:
             report_lines.append("### 4.1 즉시 수정 필요 (Critical/High)")
             report_lines.append("")
             
-            for idx, issue in enumerate(critical_high_issues[:10], 1):  # 최대 10개만
+            for idx, issue in enumerate(self.issues.rows(critical_high_rows[:10]), 1):  # 최대 10개만
                 report_lines.append(f"{idx}. **{issue.rule}**")
                 report_lines.append(f"   - 위치: {issue.location}")
                 report_lines.append(f"   - 수정 방법: {issue.recommendation}")
@@ -772,14 +984,12 @@ class PRDDeepValidator:
         report_lines.append("| 순서 | 항목 | 우선순위 | 상태 |")
         report_lines.append("|---|---|---|---|")
         
-        checklist_items = []
+        checklist_rows = []
         for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]:
-            severity_issues = [i for i in self.issues if i.severity == severity]
-            for issue in severity_issues:
-                checklist_items.append((severity, issue))
+            checklist_rows.extend(self.issues.select('severity', severity))
         
-        for idx, (severity, issue) in enumerate(checklist_items[:30], 1):  # 최대 30개만
-            report_lines.append(f"| {idx} | {issue.rule} | {severity.value} | - |")
+        for idx, row in enumerate(checklist_rows[:30], 1):  # 최대 30개만
+            report_lines.append(f"| {idx} | {self.issues.field(row, 'rule')} | {self.issues.field(row, 'severity').value} | - |")
         
         report_lines.append("")
         report_lines.append("---")
@@ -789,7 +999,25 @@ class PRDDeepValidator:
         
         return '\n'.join(report_lines)
 
+# process 실행기의 작업 프로세스별 검증기 (initializer로 한 번 전달)
+_worker_validator: Optional[PRDDeepValidator] = None
+
+
+def _init_check_worker(validator: PRDDeepValidator):
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _run_check_family(names: List[str]) -> Dict[str, IssueStore]:
+    return _worker_validator._run_family(names)
+
+
 def main():
+    parser = argparse.ArgumentParser(description='PRD 심층점검')
+    parser.add_argument('--jobs', type=int, default=1, help='검사 묶음 병렬 실행 수 (1이면 순차 실행)')
+    parser.add_argument('--executor', choices=sorted(EXECUTORS), default='thread', help='병렬 실행기')
+    args = parser.parse_args()
+    
     validator = PRDDeepValidator(
         prd_path='PRD_Phase1_2025-12-31.md',
         output_json_path='output.json'
@@ -810,22 +1038,28 @@ def main():
     print(f"   - IA 항목: {len(validator.ia_items)}개")
     print(f"   - SPM 항목: {len(validator.spm_items)}개")
     
-    print("\n3. 무결성 규칙 검사 중...")
-    validator.check_id_format()
-    validator.check_uniqueness()
-    validator.check_cross_references()
-    print(f"   - 발견된 이슈: {len(validator.issues)}개")
-    
-    print("\n4. 논리 일치성 규칙 검사 중...")
-    validator.check_phase_logic()
-    validator.check_api_logic()
-    print(f"   - 발견된 이슈: {len(validator.issues)}개")
-    
-    print("\n5. 교차검증 중...")
-    validator.check_cross_validation()
-    print(f"   - 발견된 이슈: {len(validator.issues)}개")
+    if args.jobs > 1:
+        print(f"\n3~4. 검사 규칙 + 교차검증 병렬 실행 중... ({args.executor} {args.jobs}개)")
+        validator.run_checks_parallel(CHECK_INPUTS, args.jobs, args.executor)
+        print(f"   - 발견된 이슈: {len(validator.issues)}개")
+    else:
+        print("\n3. 무결성/논리 일치성 규칙 검사 중...")
+        validator.run_checks([
+            'check_id_format',
+            'check_uniqueness',
+            'check_cross_references',
+            'check_traceability',
+            'check_phase_logic',
+            'check_api_logic',
+        ])
+        print(f"   - 발견된 이슈: {len(validator.issues)}개")
+        
+        print("\n4. 교차검증 중...")
+        validator.check_cross_validation()
+        validator.check_near_duplicates()
+        print(f"   - 발견된 이슈: {len(validator.issues)}개")
     
-    print("\n6. 리포트 생성 중...")
+    print("\n5. 리포트 생성 중...")
     report = validator.generate_report()
     
     with open('PRD_심층점검_리포트.md', 'w', encoding='utf-8') as f:
@@ -5,56 +5,35 @@ PRD-IA-SPM 메타데이터 검증 및 매핑 스크립트
 """
 
 import json
-import re
 from collections import defaultdict
 from typing import Dict, List, Any
 
+import prd_regex
+from prd_cache import cached_parse
+from prd_model import PRDDocument
+from sheet_loader import IA_SHEET, SPM_SHEET, load_sheet_tables
+from sheet_schema import detect_from_rows
+
 def parse_output_json(file_path: str) -> Dict[str, Any]:
-    """output.json 파일 파싱"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # IA 1.0 파싱
-    ia_sheet = next((s for s in data['sheets'] if s['name'] == 'IA 1.0'), None)
-    spm_sheet = next((s for s in data['sheets'] if s['name'] == 'SPM 1.0'), None)
-    
-    if not ia_sheet or not spm_sheet:
-        raise ValueError("필요한 시트를 찾을 수 없습니다")
-    
-    # IA 항목 추출
+    """output.json(또는 원본 .xlsx) 파일 파싱"""
+    # IA/SPM 시트만 한 번의 스트리밍 읽기로 열 단위 적재 (빈 필드 개수는 적재 시 계산)
     ia_items = []
-    for row in ia_sheet['data']:
-        func_id = row.get('System.Xml.XmlElement', '')
-        if func_id and func_id.startswith('Seller-ia-front-'):
-            item = {
-                'func_id': func_id,
-                'screen_id': row.get('화면 ID', ''),
-                'func_definition': row.get('기능 정의', ''),
-                'category': row.get('카테고리', ''),
-                'depth1': row.get('Depth 1', ''),
-                'depth2': row.get('Depth 2', ''),
-                'depth3': row.get('Depth 3', ''),
-                'policy_id': row.get('관련 정책 ID', ''),
-                'importance': row.get('중요도', ''),
-                'implementation_target': row.get('구현 대상', ''),
-                'empty_field_count': sum(1 for v in row.values() if v == '' or v == [] or (isinstance(v, list) and len(v) == 0))
-            }
-            ia_items.append(item)
-    
-    # SPM 항목 추출
     spm_items = []
-    for row in spm_sheet['data']:
-        policy_code = row.get('정책 코드', '')
-        if policy_code and policy_code.startswith('dealer-sp-'):
-            item = {
-                'policy_id': policy_code,
-                'policy_intro': row.get('정책 소개', ''),
-                'policy_content': row.get('정책 내용', ''),
-                'policy_category': row.get('정책분류', ''),
-                'detail_item': row.get('세부 항목', ''),
-                'empty_field_count': sum(1 for v in row.values() if v == '' or v == [] or (isinstance(v, list) and len(v) == 0))
-            }
-            spm_items.append(item)
+    sheets = load_sheet_tables(file_path, [IA_SHEET, SPM_SHEET])
+    for sheet_name, table in sheets.items():
+        rows = table.rows()
+        
+        # ID 열/의미 열은 시트마다 한 번만 감지 (원본 엑셀이면 ID 열 이름이 output.json과 달라도 됨)
+        schema, rows = detect_from_rows(file_path, sheet_name, rows)
+        items = ia_items if sheet_name == IA_SHEET else spm_items
+        for row in rows:
+            item = schema.extract(row)
+            if item is not None:
+                item['empty_field_count'] = row.empty_count()
+                items.append(item)
+    
+    if IA_SHEET not in sheets or SPM_SHEET not in sheets:
+        raise ValueError("필요한 시트를 찾을 수 없습니다")
     
     return {
         'ia_items': ia_items,
@@ -65,91 +44,53 @@ def parse_output_json(file_path: str) -> Dict[str, Any]:
 
 def parse_prd(file_path: str) -> Dict[str, Any]:
     """PRD 문서 파싱"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    doc = PRDDocument.from_file_incremental(file_path)
     
     # Function Registry 추출
-    func_pattern = r'\|\s*(FUNC-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
     functions = []
-    for match in re.finditer(func_pattern, content):
-        func_id = match.group(1).strip()
-        func_name = match.group(2).strip()
-        func_desc = match.group(3).strip()
-        functions.append({
-            'id': func_id,
-            'name': func_name,
-            'description': func_desc
-        })
+    for record in doc.records({'id': 'Function ID', 'name': '기능명', 'description': '설명'},
+                              key=prd_regex.compile(r'FUNC-\d+')):
+        functions.append(record)
     
     # Screen Registry 추출
-    screen_pattern = r'\|\s*(SCR-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
     screens = []
-    for match in re.finditer(screen_pattern, content):
-        screen_id = match.group(1).strip()
-        screen_name = match.group(2).strip()
-        screen_role = match.group(3).strip()
-        screens.append({
-            'id': screen_id,
-            'name': screen_name,
-            'role': screen_role
-        })
+    for record in doc.records({'id': 'Screen ID', 'name': '화면명', 'role': '역할'},
+                              key=prd_regex.compile(r'SCR-\d+')):
+        screens.append(record)
     
     # API Registry 추출
-    api_pattern = r'\|\s*(API-\d+)\s*\|\s*([^|]+)\s*\|'
     apis = []
-    for match in re.finditer(api_pattern, content):
-        api_id = match.group(1).strip()
-        api_desc = match.group(2).strip()
-        apis.append({
-            'id': api_id,
-            'description': api_desc
-        })
+    for record in doc.records({'id': 'API ID', 'description': '설명'}, key=prd_regex.compile(r'API-\d+')):
+        apis.append(record)
     
-    # Entity Registry 추출
-    entity_pattern = r'\|\s*(ENT-\d+)\s*\|\s*([^|]+)\s*\|'
+    # Entity 추출 (TSD 섹션의 ENT-01: Vehicle 형태 헤딩)
     entities = []
-    for match in re.finditer(entity_pattern, content):
-        entity_id = match.group(1).strip()
-        entity_name = match.group(2).strip()
+    for match in doc.headings_matching(prd_regex.compile(r'ENT-(\d+):\s*([^(]+)')):
         entities.append({
-            'id': entity_id,
-            'name': entity_name
+            'id': f"ENT-{match.group(1).zfill(2)}",
+            'name': match.group(2).strip()
         })
     
     # Flow Registry 추출
-    flow_pattern = r'\|\s*(FLOW-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|'
     flows = []
-    for match in re.finditer(flow_pattern, content):
-        flow_id = match.group(1).strip()
-        flow_name = match.group(2).strip()
-        flow_desc = match.group(3).strip()
-        flows.append({
-            'id': flow_id,
-            'name': flow_name,
-            'description': flow_desc
-        })
+    for record in doc.records({'id': 'Flow ID', 'name': '플로우명', 'description': '설명'},
+                              key=prd_regex.compile(r'FLOW-\d+')):
+        flows.append(record)
     
-    # NFR Registry 추출
-    nfr_pattern = r'\|\s*(NFR-\d+)\s*\|\s*([^|]+)\s*\|'
+    # NFR 추출 ('필드명 | 내용' 표의 NFR-ID/요구사항명 필드)
     nfrs = []
-    for match in re.finditer(nfr_pattern, content):
-        nfr_id = match.group(1).strip()
-        nfr_desc = match.group(2).strip()
-        nfrs.append({
-            'id': nfr_id,
-            'description': nfr_desc
-        })
+    for table in doc.tables_with('필드명', '내용'):
+        fields = table.fields()
+        if prd_regex.fullmatch(r'NFR-\d+', fields.get('NFR-ID', '')):
+            nfrs.append({
+                'id': fields['NFR-ID'],
+                'description': fields.get('요구사항명', '')
+            })
     
     # Decision Log 추출
-    decision_pattern = r'\|\s*(D-[^|]+)\s*\|\s*([^|]+)\s*\|'
     decisions = []
-    for match in re.finditer(decision_pattern, content):
-        decision_id = match.group(1).strip()
-        decision_content = match.group(2).strip()
-        decisions.append({
-            'id': decision_id,
-            'content': decision_content
-        })
+    for record in doc.records({'id': '결정 ID', 'content': '결정 내용'}, key=prd_regex.compile(r'D-.+')):
+        decisions.append(record)
     
     return {
         'functions': functions,
@@ -164,13 +105,13 @@ def parse_prd(file_path: str) -> Dict[str, Any]:
 if __name__ == '__main__':
     # output.json 파싱
     print("output.json 파싱 중...")
-    output_data = parse_output_json('output.json')
+    output_data = cached_parse('output.json', 'mapping.output_json', parse_output_json)
     print(f"IA 항목: {output_data['ia_count']}개")
     print(f"SPM 항목: {output_data['spm_count']}개")
     
     # PRD 파싱
     print("\nPRD 파싱 중...")
-    prd_data = parse_prd('PRD_Phase1_2025-12-31.md')
+    prd_data = cached_parse('PRD_Phase1_2025-12-31.md', 'mapping.prd', parse_prd)
     print(f"Functions: {len(prd_data['functions'])}개")
     print(f"Screens: {len(prd_data['screens'])}개")
     print(f"APIs: {len(prd_data['apis'])}개")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PRD 심층점검 watch 모드
+- PRD 마크다운과 output.json의 변경(mtime/크기)을 폴링으로 감지
+- 변경된 파일만 다시 파싱 (PRD는 청크 단위 증분 토큰화, output.json은 내용 해시 캐시)
+- 입력 지문이 바뀐 check_* 규칙만 재실행
+- 리포트 파일을 쓰지 않고 신규/해결 이슈 차이만 출력
+
+사용법
+    python watch_prd_deep_check.py [--prd PRD_Phase1_2025-12-31.md] [--output-json output.json] [--interval 0.3]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from issue_store import IssueStore
+from prd_cache import content_digest
+from prd_model import Span
+from validate_prd_deep_check import CHECK_INPUTS, Issue, PRDDeepValidator, new_issue_store
+
+# 파일별로 파싱 결과가 담기는 PRDDeepValidator 속성
+PRD_STATE = ('document', 'prd_content', 'registries', 'mappings', 'id_references_in_text')
+OUTPUT_JSON_STATE = ('ia_items', 'spm_items')
+
+IssueKey = Tuple[str, str, str, str, str, Tuple[str, ...]]
+
+
+def _canonical(value: Any) -> Any:
+    """지문 계산용 정규화 (set 순서는 실행마다 다르므로 정렬, dict는 삽입 순서 유지)"""
+    if isinstance(value, Span):
+        return value.text
+    if isinstance(value, dict):
+        return tuple((key, _canonical(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(item) for item in value)
+    return value
+
+
+def fingerprint(value: Any) -> str:
+    if isinstance(value, str):
+        return content_digest(value.encode('utf-8'))
+    return content_digest(pickle.dumps(_canonical(value), protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def issue_key(issue: Issue) -> IssueKey:
+    return (
+        issue.severity.value,
+        issue.category,
+        issue.rule,
+        issue.description,
+        issue.location,
+        tuple(issue.affected_ids),
+    )
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class DeepCheckWatcher:
+    """변경된 입력만 다시 파싱하고, 입력이 바뀐 규칙만 재실행"""
+
+    def __init__(self, prd_path: str, output_json_path: str):
+        self.prd_path = prd_path
+        self.output_json_path = output_json_path
+        self.validator: Optional[PRDDeepValidator] = None
+        self.input_fingerprints: Dict[str, str] = {}
+        self.check_issues: Dict[str, IssueStore] = {}
+
+    def _load(self, prd_changed: bool, output_json_changed: bool) -> PRDDeepValidator:
+        """바뀐 파일만 다시 파싱하고 나머지 상태는 이전 검사기에서 넘겨받음"""
+        validator = PRDDeepValidator(self.prd_path, self.output_json_path)
+        previous = self.validator
+
+        if prd_changed or previous is None:
+            validator.parse_prd()
+        else:
+            for name in PRD_STATE:
+                setattr(validator, name, getattr(previous, name))
+
+        if output_json_changed or previous is None:
+            validator.parse_output_json()
+        else:
+            for name in OUTPUT_JSON_STATE:
+                setattr(validator, name, getattr(previous, name))
+
+        return validator
+
+    def refresh(self, prd_changed: bool = True, output_json_changed: bool = True) -> Tuple[List[str], List[IssueKey], List[IssueKey]]:
+        """
+        다시 검사하여 (재실행한 규칙, 신규 이슈, 해결된 이슈) 반환
+        - 파싱이 실패하면(저장 도중 등) 예외를 그대로 올리고 이전 상태를 유지
+        """
+        validator = self._load(prd_changed, output_json_changed)
+
+        fingerprints = {}
+        for names in CHECK_INPUTS.values():
+            for name in names:
+                if name not in fingerprints:
+                    fingerprints[name] = fingerprint(validator.check_input(name))
+
+        before = Counter(issue_key(issue) for issues in self.check_issues.values() for issue in issues)
+
+        rerun = [
+            check_name for check_name, inputs in CHECK_INPUTS.items()
+            if check_name not in self.check_issues or any(
+                self.input_fingerprints.get(name) != fingerprints[name] for name in inputs
+            )
+        ]
+        # 재실행할 규칙끼리는 한 번에 실행 (선언형 규칙은 모델 한 번 순회), 이슈는 CHECK_INPUTS 순서로 다시 조립
+        fresh = validator.run_checks(rerun)
+        check_issues = {
+            check_name: fresh[check_name] if check_name in fresh else self.check_issues[check_name]
+            for check_name in CHECK_INPUTS
+        }
+        validator.issues = new_issue_store()
+        for issues in check_issues.values():
+            validator.issues.extend(issues)
+
+        after = Counter(issue_key(issue) for issue in validator.issues)
+
+        self.validator = validator
+        self.input_fingerprints = fingerprints
+        self.check_issues = check_issues
+
+        added = list((after - before).elements())
+        resolved = list((before - after).elements())
+        return rerun, added, resolved
+
+    @property
+    def issues(self) -> IssueStore:
+        return self.validator.issues if self.validator else new_issue_store()
+
+
+def _format_issue(sign: str, key: IssueKey) -> str:
+    severity, category, rule, description, location, _ = key
+    return f"  {sign} [{severity}] {category} / {rule}: {description} ({location})"
+
+
+def _print_summary(watcher: DeepCheckWatcher):
+    counts = Counter(issue.severity.value for issue in watcher.issues)
+    breakdown = ', '.join(f"{severity} {count}" for severity, count in counts.items())
+    print(f"   이슈 합계: {len(watcher.issues)}개" + (f" ({breakdown})" if breakdown else ""))
+
+
+def watch(prd_path: str, output_json_path: str, interval: float = 0.3):
+    watcher = DeepCheckWatcher(prd_path, output_json_path)
+
+    started = time.perf_counter()
+    watcher.refresh()
+    print(f"초기 점검 완료 ({time.perf_counter() - started:.2f}초)")
+    for issue in watcher.issues:
+        print(_format_issue('*', issue_key(issue)))
+    _print_summary(watcher)
+    print(f"\n변경 감시 중: {prd_path}, {output_json_path} (종료: Ctrl+C)")
+
+    signatures = {path: _stat_signature(path) for path in (prd_path, output_json_path)}
+    while True:
+        time.sleep(interval)
+        current = {path: _stat_signature(path) for path in signatures}
+        if current == signatures:
+            continue
+
+        # 저장 도중의 중간 상태를 피하도록 한 번 더 확인
+        time.sleep(min(interval, 0.05))
+        settled = {path: _stat_signature(path) for path in signatures}
+        if settled != current:
+            continue
+
+        prd_changed = settled[prd_path] != signatures[prd_path]
+        output_json_changed = settled[output_json_path] != signatures[output_json_path]
+        signatures = settled
+        if None in settled.values():
+            print(f"[{time.strftime('%H:%M:%S')}] 입력 파일을 찾을 수 없습니다. 다시 생성될 때까지 대기합니다.")
+            continue
+
+        changed = [path for path, flag in ((prd_path, prd_changed), (output_json_path, output_json_changed)) if flag]
+        started = time.perf_counter()
+        try:
+            rerun, added, resolved = watcher.refresh(prd_changed, output_json_changed)
+        except Exception as e:
+            print(f"[{time.strftime('%H:%M:%S')}] 파싱 실패 ({', '.join(changed)}): {e}")
+            continue
+        elapsed = time.perf_counter() - started
+
+        print(f"[{time.strftime('%H:%M:%S')}] 변경: {', '.join(changed)} → 재실행 {len(rerun)}개 규칙 ({elapsed:.2f}초)")
+        if rerun:
+            print(f"   규칙: {', '.join(rerun)}")
+        for key in added:
+            print(_format_issue('+', key))
+        for key in resolved:
+            print(_format_issue('-', key))
+        if not added and not resolved:
+            print("   이슈 변화 없음")
+        _print_summary(watcher)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PRD 심층점검 watch 모드')
+    parser.add_argument('--prd', default='PRD_Phase1_2025-12-31.md', help='PRD 마크다운 경로')
+    parser.add_argument('--output-json', default='output.json', help='output.json 또는 IA/SPM 원본 엑셀(.xlsx) 경로')
+    parser.add_argument('--interval', type=float, default=0.3, help='폴링 간격(초)')
+    args = parser.parse_args()
+
+    for path in (args.prd, args.output_json):
+        if not os.path.exists(path):
+            print(f"파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+
+    try:
+        watch(args.prd, args.output_json, args.interval)
+    except KeyboardInterrupt:
+        print("\n감시 종료")
+
+
+if __name__ == "__main__":
+    main()
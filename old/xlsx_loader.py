@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IA/SPM 원본 엑셀(.xlsx) 스트리밍 로더
+- zipfile + iterparse로 워크시트 XML을 행 단위로 읽고 읽은 요소는 바로 버림 (메모리는 공유 문자열 + 행 하나)
+- 행은 output.json과 같은 모양의 dict로 변환: 헤더 행의 값이 키, 헤더가 없는 열은 'Column{열 번호}', 빈 셀은 ''
+- 서식 있는 텍스트 헤더도 실제 글자로 읽으므로 output.json처럼 'System.Xml.XmlElement'로 바뀌지 않음
+  (ID 열은 sheet_schema가 접두어로 찾으므로 열 이름이 달라도 같은 항목이 추출됨)
+
+사용법
+    for sheet_name, rows in iter_workbook_sheets('IA_SPM.xlsx', ['IA 1.0', 'SPM 1.0']):
+        for row in rows:
+            ...
+"""
+
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm')
+# 헤더 행 탐색: 앞쪽 행 중 값이 있는 셀이 이 개수 이상인 첫 행
+HEADER_MIN_CELLS = 2
+HEADER_SEARCH_ROWS = 20
+
+_RELATIONSHIP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+
+def is_workbook(path: str) -> bool:
+    return path.lower().endswith(WORKBOOK_SUFFIXES)
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 뗀 태그 이름 (Transitional/Strict OOXML 모두 처리)"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _column_index(reference: str) -> int:
+    """'AB12' → 28 (1부터)"""
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index
+
+
+def _text(element: ET.Element) -> str:
+    """<si>/<is> 안의 모든 <t> 글자 (서식 있는 텍스트 조각 포함, 윗주 <rPh> 제외)"""
+    parts = []
+    for child in element:
+        name = _local(child.tag)
+        if name == 't':
+            parts.append(child.text or '')
+        elif name == 'r':
+            parts.extend(grandchild.text or '' for grandchild in child if _local(grandchild.tag) == 't')
+    return ''.join(parts)
+
+
+def _number(text: str) -> str:
+    """숫자 셀 값을 문자열로 ('3.0' → '3')"""
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    return str(int(value)) if value.is_integer() and 'E' not in text.upper() else text
+
+
+class _Workbook:
+    def __init__(self, archive: zipfile.ZipFile):
+        self.archive = archive
+        self.sheet_parts = self._sheet_parts()
+        self._shared_strings: Optional[List[str]] = None
+
+    def _sheet_parts(self) -> Dict[str, str]:
+        """시트 이름 → 워크시트 XML 경로 (통합 문서 순서)"""
+        targets = {}
+        with self.archive.open('xl/_rels/workbook.xml.rels') as f:
+            for relationship in ET.parse(f).getroot():
+                target = relationship.get('Target', '')
+                if target.startswith('/'):
+                    target = target.lstrip('/')
+                else:
+                    target = posixpath.normpath(posixpath.join('xl', target))
+                targets[relationship.get('Id')] = target
+
+        parts = {}
+        with self.archive.open('xl/workbook.xml') as f:
+            for element in ET.parse(f).getroot().iter():
+                if _local(element.tag) == 'sheet':
+                    relationship_id = element.get(f'{{{_RELATIONSHIP_NS}}}id') or next(
+                        (value for key, value in element.attrib.items() if _local(key) == 'id'), None)
+                    if relationship_id in targets:
+                        parts[element.get('name')] = targets[relationship_id]
+        return parts
+
+    @property
+    def shared_strings(self) -> List[str]:
+        """공유 문자열 표 (처음 필요할 때 한 번 스트리밍으로 읽음)"""
+        if self._shared_strings is None:
+            self._shared_strings = []
+            try:
+                f = self.archive.open('xl/sharedStrings.xml')
+            except KeyError:
+                return self._shared_strings
+            with f:
+                for _, element in ET.iterparse(f, events=('end',)):
+                    if _local(element.tag) == 'si':
+                        self._shared_strings.append(_text(element))
+                        element.clear()
+        return self._shared_strings
+
+    def _cell_value(self, cell: ET.Element) -> str:
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            inline = next((child for child in cell if _local(child.tag) == 'is'), None)
+            return _text(inline) if inline is not None else ''
+        raw = next((child.text or '' for child in cell if _local(child.tag) == 'v'), '')
+        if cell_type == 's':
+            return self.shared_strings[int(raw)] if raw else ''
+        if cell_type == 'b':
+            return 'TRUE' if raw == '1' else 'FALSE' if raw else ''
+        if cell_type == 'n':
+            return _number(raw) if raw else ''
+        return raw
+
+    def iter_cells(self, part: str) -> Iterator[Dict[int, str]]:
+        """워크시트의 행을 {열 번호: 값}으로 생성 (빈 행 포함, 행 사이 건너뛴 번호는 생략)"""
+        with self.archive.open(part) as f:
+            sheet_data = None
+            row_cells: Dict[int, str] = {}
+            for event, element in ET.iterparse(f, events=('start', 'end')):
+                name = _local(element.tag)
+                if event == 'start':
+                    if name == 'sheetData':
+                        sheet_data = element
+                    continue
+                if name == 'c':
+                    reference = element.get('r')
+                    column = _column_index(reference) if reference else max(row_cells, default=0) + 1
+                    value = self._cell_value(element)
+                    if value != '':
+                        row_cells[column] = value
+                elif name == 'row':
+                    yield row_cells
+                    row_cells = {}
+                    # 다 읽은 행은 트리에서 떼어 내어 메모리가 행 하나 크기를 넘지 않도록 함
+                    if sheet_data is not None:
+                        sheet_data.clear()
+
+
+def _header_keys(cells: Dict[int, str]) -> Dict[int, str]:
+    """헤더 행 → {열 번호: 키} (빈/중복 헤더는 output.json처럼 'Column{열 번호}')"""
+    keys = {}
+    seen = set()
+    for column in range(1, max(cells) + 1):
+        header = cells.get(column, '').strip()
+        if not header or header in seen:
+            header = f'Column{column}'
+        seen.add(header)
+        keys[column] = header
+    return keys
+
+
+def _sheet_rows(workbook: _Workbook, part: str) -> Iterator[Dict[str, str]]:
+    """헤더 행 아래의 값이 있는 행을 output.json 행 모양으로 생성"""
+    keys: Optional[Dict[int, str]] = None
+    for position, cells in enumerate(workbook.iter_cells(part)):
+        if keys is None:
+            if len(cells) >= HEADER_MIN_CELLS or (cells and position >= HEADER_SEARCH_ROWS):
+                keys = _header_keys(cells)
+            continue
+        if not cells:
+            continue
+        row = {key: cells.get(column, '') for column, key in keys.items()}
+        # 헤더보다 오른쪽에 있는 값도 버리지 않음
+        for column, value in cells.items():
+            if column not in keys:
+                row[f'Column{column}'] = value
+        yield row
+
+
+def iter_workbook_sheets(path: str, sheet_names: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Iterator[Dict[str, str]]]]:
+    """
+    (시트명, 행 iterator)를 통합 문서 순서대로 생성 (sheet_loader.iter_sheets와 같은 규약)
+    - 행 iterator는 다음 시트로 넘어가기 전에 소비해야 함
+    """
+    wanted = set(sheet_names) if sheet_names is not None else None
+    with zipfile.ZipFile(path) as archive:
+        workbook = _Workbook(archive)
+        for name, part in workbook.sheet_parts.items():
+            if wanted is not None and name not in wanted:
+                continue
+            rows = _sheet_rows(workbook, part)
+            yield name, rows
+            for _ in rows:
+                pass
+            if wanted is not None:
+                wanted.discard(name)
+                if not wanted:
+                    return